@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Offline benchmarks of the ``searchio`` command-line program.
+
+Every scenario runs ``searchio`` (or the ``search`` Script Filter
+program) in a new process, exactly as Alfred does, inside a
+throwaway copy of the workflow with its own data and cache
+directories. Searches fetch suggestions from the fixture server
+on localhost (see `fixtures`), so results don't depend on the
+network or on anybody's suggest API.
+
+Run from the ``bin`` directory:
+
+    python3 -m benchmark [-n <count>] [-k <name>] [-o <file>]
+                         [-b <file>] [--save-baseline]
+
+Results are written as JSON (see `benchmark.report`) and compared
+with a baseline of earlier results. Scenarios whose median time
+has grown by more than the threshold are flagged as regressions,
+and the exit status is 1.
+
+`benchmark.micro` has micro-benchmarks of individual functions.
+
+"""
+
+__version__ = '1.0'
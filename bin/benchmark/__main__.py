@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Run searchio benchmarks offline and compare with a baseline.
+
+Usage (from the ``bin`` directory):
+    python3 -m benchmark [-n <count>] [-k <name>] [-o <file>]
+                         [-b <file>] [-t <fraction>] [--save-baseline]
+    python3 -m benchmark --list
+"""
+
+from __future__ import print_function, absolute_import
+
+import argparse
+import json
+import sys
+
+from benchmark import report
+from benchmark.scenarios import SCENARIOS, SEARCH
+from benchmark.workspace import Workspace
+from common import log
+from fixtures.server import FixtureServer
+
+
+def bench(scenario, server, count):
+    """Return times of ``count`` runs of ``scenario`` in seconds.
+
+    One untimed run is made first, to warm the OS's file cache.
+
+    """
+    ws = Workspace(server.url)
+    try:
+        ws.add_search(SEARCH)
+        scenario.setup(ws)
+        times = []
+        try:
+            for i in range(count + 1):
+                scenario.before(ws, i)
+                t = ws.run(scenario.argv(ws, i), scenario.program)
+                if i:
+                    times.append(t)
+        finally:
+            scenario.teardown(ws)
+    finally:
+        ws.remove()
+
+    return times
+
+
+def main():
+    """Run benchmarks."""
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('-n', '--count', type=int, default=20,
+                    help='timed runs per scenario')
+    ap.add_argument('-k', '--scenario', action='append', default=[],
+                    help='only run scenarios whose name contains this '
+                    '(may be repeated)')
+    ap.add_argument('-o', '--output',
+                    help='save results to this file (default: STDOUT)')
+    ap.add_argument('-b', '--baseline', default=report.BASELINE,
+                    help='results to compare with (default: %(default)s)')
+    ap.add_argument('-t', '--threshold', type=float,
+                    default=report.THRESHOLD,
+                    help='max. slowdown of median as a fraction '
+                    '(default: %(default)s)')
+    ap.add_argument('--save-baseline', action='store_true',
+                    help='save results as the new baseline')
+    ap.add_argument('--latency', type=float, default=0.0,
+                    help="server's response time in seconds")
+    ap.add_argument('--jitter', type=float, default=0.0,
+                    help='max. seconds to add to or take from latency')
+    ap.add_argument('--gzip', action='store_true',
+                    help='gzip responses')
+    ap.add_argument('--list', action='store_true',
+                    help='list scenarios and exit')
+    args = ap.parse_args()
+
+    scenarios = [s for s in SCENARIOS
+                 if not args.scenario or
+                 any([k in s.name for k in args.scenario])]
+    if args.list:
+        for s in scenarios:
+            print('{:20s} {}'.format(s.name, s.description))
+        return 0
+
+    server = FixtureServer(latency=args.latency, jitter=args.jitter,
+                           gzip=args.gzip)
+    server.start()
+    results = []
+    try:
+        for s in scenarios:
+            times = bench(s, server, args.count)
+            r = report.summarise(s.name, s.description, times)
+            results.append(r)
+            log('%-20s %8.1fms median %8.1fms p95 %8.1fms min',
+                s.name, r['median_ms'], r['p95_ms'], r['min_ms'])
+    finally:
+        server.stop()
+
+    doc = report.document(results, args.count)
+    if args.output:
+        report.save(doc, args.output)
+    elif not args.save_baseline:
+        json.dump(doc, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.save_baseline:
+        report.save(doc, args.baseline)
+        log('saved baseline to %s', args.baseline)
+        return 0
+
+    try:
+        baseline = report.load(args.baseline)
+    except (IOError, OSError, ValueError) as err:
+        log('no baseline to compare with: %s', err)
+        return 0
+
+    rows = report.compare(results, baseline['results'], args.threshold)
+    log('')
+    log('compared with baseline from %s (%s)', baseline['meta']['date'],
+        baseline['meta'].get('commit') or 'unknown commit')
+    log('%-20s %10s %10s %8s', 'scenario', 'baseline', 'now', 'change')
+    regressions = 0
+    for name, old, new, change, regressed in rows:
+        log('%-20s %8.1fms %8.1fms %+7.0f%%%s', name, old, new, change * 100,
+            '  REGRESSION' if regressed else '')
+        regressions += regressed
+
+    if regressions:
+        log('%d regression(s)', regressions)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Micro-benchmarks of individual functions.
+
+Unlike the scenarios in `benchmark.scenarios`, these call `searchio`
+functions in-process, mostly comparing an optimised function with
+the code it replaced:
+
+    filter      fuzzy filtering of variant keys
+    jsonpath    parsing JSON Paths
+    mkurl       building result URLs
+    models      loading engines and creating searches
+    serializer  cache serializers for search results
+
+Run one from the ``bin`` directory:
+
+    python3 -m benchmark.micro.<name> [-h]
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import os
+import sys
+from timeit import timeit
+
+from common import log  # noqa: F401
+
+here = os.path.dirname(os.path.abspath(__file__))
+LIBDIR = os.path.join(here, '../../../src/lib')
+sys.path.insert(0, LIBDIR)
+
+# Shipped engines
+ENGINE_DIR = os.path.join(LIBDIR, 'searchio/engines')
+
+
+def bench(fn, count, unit=1e3):
+    """Return mean time per call of ``fn``.
+
+    Args:
+        fn (callable): Function to time.
+        count (int): Number of calls.
+        unit (float, optional): Units per second. Defaults to
+            milliseconds, ``1e6`` is microseconds.
+
+    Returns:
+        float: Mean time per call in ``unit``.
+
+    """
+    return timeit(fn, number=count) / count * unit
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Benchmark fuzzy filtering of variant keys.
+
+Compares `Workflow.filter()` with `searchio.fuzzy.FilterIndex`
+on the keys ``searchio variants`` filters (``<uid> <title>``),
+using the shipped engines' variants repeated to give 5,000+ keys.
+
+"cold" includes building the index, "warm" reuses it (as for
+the second and later keystrokes in a long-running process).
+
+Usage (from the ``bin`` directory):
+    python3 -m benchmark.micro.filter [-n <count>] [-k <keys>]
+"""
+
+from __future__ import print_function, absolute_import
+
+import argparse
+
+from benchmark.micro import ENGINE_DIR, bench, log
+from workflow import Workflow
+from searchio import engines, fuzzy
+
+QUERIES = ['w', 'wiki', 'wiki de', 'goog en', 'gde', 'amazon', 'star wars']
+
+
+def main():
+    """Run benchmarks."""
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('-n', '--count', type=int, default=5,
+                    help='iterations per benchmark')
+    ap.add_argument('-k', '--keys', type=int, default=5000,
+                    help='min. number of keys')
+    args = ap.parse_args()
+
+    wf = Workflow()
+    base = [u'{} {}'.format(v.uid, v.title)
+            for e in engines.load(ENGINE_DIR) for v in e.variants]
+    keys = list(base)
+    i = 1
+    while len(keys) < args.keys:
+        keys.extend([u'{} {}'.format(k, i) for k in base])
+        i += 1
+
+    log('%d keys', len(keys))
+    log('%-12s %7s %10s %10s %10s %10s', 'query', 'max', 'filter()',
+        'cold', 'warm', 'matches')
+    for query in QUERIES:
+        for n in (0, 20):
+            a = wf.filter(query, keys, max_results=n)
+            b = fuzzy.FilterIndex(keys).search(query, max_results=n)
+            assert len(a) == len(b), (query, n)
+
+            t1 = bench(lambda: wf.filter(query, keys, max_results=n),
+                       args.count)
+            t2 = bench(lambda: fuzzy.FilterIndex(keys).search(
+                       query, max_results=n), args.count)
+            idx = fuzzy.FilterIndex(keys)
+            idx.search(query)
+            t3 = bench(lambda: idx.search(query, max_results=n), args.count)
+            log('%-12s %7s %8.1fms %8.1fms %8.1fms %10d', query, n or '-',
+                t1, t2, t3, len(a))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Benchmark per-query JSON Path parsing.
+
+Compares parsing with `jsonpath_rw` (what `searchio search` used to
+do on every cache miss) against `searchio.jpath.compile()`.
+
+Usage (from the ``bin`` directory):
+    python3 -m benchmark.micro.jsonpath [-n <count>]
+"""
+
+from __future__ import print_function, absolute_import
+
+import argparse
+
+from benchmark.micro import bench, log
+from jsonpath_rw import parse
+from searchio import jpath
+
+# Paths used by the shipped engines
+PATHS = [
+    '$[1][*]',
+    '[1]',
+    '$[*].phrase',
+    '$.suggestions[*].value',
+    '$.predictions[*].description',
+]
+
+DATA = ['python', ['python', 'python tutorial', 'python download']]
+
+
+def main():
+    """Run benchmarks."""
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('-n', '--count', type=int, default=200,
+                    help='iterations per benchmark')
+    args = ap.parse_args()
+
+    log('%-32s %14s %14s %14s', 'path', 'jsonpath_rw',
+        'jpath (cold)', 'jpath (warm)')
+    for path in PATHS:
+        rw = bench(lambda: parse(path), args.count, 1e6)
+
+        def cold():
+            jpath._cache.clear()
+            jpath.compile(path)
+
+        c = bench(cold, args.count, 1e6)
+        jpath.compile(path)
+        w = bench(lambda: jpath.compile(path).find(DATA), args.count, 1e6)
+        log('%-32s %12.1fus %12.1fus %12.1fus', path, rw, c, w)
+
+
+if __name__ == '__main__':
+    main()
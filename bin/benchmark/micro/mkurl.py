@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Benchmark building result URLs.
+
+Compares the old `util.mkurl()`, which URL-encoded every
+environment variable on each call, against compiled templates
+(`util.urltemplate()`), for one keystroke's worth of URLs (the
+suggestion URL plus one search URL per suggestion) at different
+environment sizes.
+
+Alfred passes ~20 ``alfred_*`` variables plus the workflow's own,
+and a login shell typically adds another 50-100.
+
+Usage (from the ``bin`` directory):
+    python3 -m benchmark.micro.mkurl [-n <count>] [-s <suggestions>]
+"""
+
+from __future__ import print_function, absolute_import
+
+import argparse
+import os
+import re
+from urllib.parse import quote_plus
+
+from benchmark.micro import bench, log
+from searchio import util
+
+SUGGEST_URL = 'https://suggestqueries.google.com/complete/search?client=firefox&q={query}&hl=en'  # noqa: E501
+SEARCH_URL = 'https://www.google.com/search?q={query}&hl=en&safe=off'
+
+# Number of environment variables to benchmark with
+ENV_SIZES = (25, 100, 250)
+
+
+def mkurl_old(url, query=None, pcencode=False):
+    """`util.mkurl()` before templates were compiled."""
+    quote = quote_plus
+    if not query:
+        return url
+
+    url = re.sub(r'\$(\{.+?\})', r'\1', url)
+
+    d = dict(query=quote(query))
+    for k, v in os.environ.items():
+        d[k] = quote(v)
+
+    return url.format(**d)
+
+
+def set_env(size):
+    """Replace environment with ``size`` variables."""
+    os.environ.clear()
+    for i in range(size):
+        os.environ['BENCH_{:03d}'.format(i)] = '/usr/local/bin:/tmp/é {}'.format(i)
+
+
+def main():
+    """Run benchmarks."""
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('-n', '--count', type=int, default=500,
+                    help='iterations per benchmark')
+    ap.add_argument('-s', '--suggestions', type=int, default=10,
+                    help='suggestions per keystroke')
+    args = ap.parse_args()
+
+    terms = ['python {}'.format(i) for i in range(args.suggestions)]
+
+    def old():
+        mkurl_old(SUGGEST_URL, 'python')
+        for t in terms:
+            mkurl_old(SEARCH_URL, t)
+
+    def new():
+        util.urltemplate(SUGGEST_URL)('python')
+        mkurl = util.urltemplate(SEARCH_URL)
+        for t in terms:
+            mkurl(t)
+
+    assert [mkurl_old(SEARCH_URL, t) for t in terms] == \
+        [util.urltemplate(SEARCH_URL)(t) for t in terms]
+
+    log('%d URLs per keystroke', args.suggestions + 1)
+    log('%8s %14s %14s %8s', 'env vars', 'old', 'compiled', 'speedup')
+    env = dict(os.environ)
+    for size in ENV_SIZES:
+        set_env(size)
+        a = bench(old, args.count, 1e6)
+        b = bench(new, args.count, 1e6)
+        log('%8d %12.1fus %12.1fus %7.0fx', size, a, b, a / b)
+
+    os.environ.clear()
+    os.environ.update(env)
+
+
+if __name__ == '__main__':
+    main()
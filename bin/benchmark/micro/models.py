@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Benchmark the engine models over the shipped engines.
+
+Times loading all engines, rendering ``searchio list`` (which
+used to call ``len(engine.variants)`` several times per engine),
+and turning every variant into a `Search`, and measures the
+memory held by all the `Variant` and `Search` objects.
+
+Usage (from the ``bin`` directory):
+    python3 -m benchmark.micro.models [-n <count>]
+"""
+
+from __future__ import print_function, absolute_import
+
+import argparse
+import tracemalloc
+
+from benchmark.micro import ENGINE_DIR, bench, log
+from searchio import engines
+
+
+def render_list(engs):
+    """What ``searchio list`` does with each engine."""
+    for e in engs:
+        n = len(e.variants)
+        str(n) + ' variant' + ('s', '')[len(e.variants) == 1]
+        '{:>8}'.format(len(e.variants))
+
+
+def searches(engs):
+    """Return a `Search` for every variant."""
+    return [v.search for e in engs for v in e.variants]
+
+
+def main():
+    """Run benchmarks."""
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('-n', '--count', type=int, default=20,
+                    help='iterations per benchmark')
+    args = ap.parse_args()
+
+    engs = engines.load(ENGINE_DIR)
+    nvariants = sum(len(e._variants) for e in engs)
+    log('%d engines, %d variants (wikia: %d)', len(engs), nvariants,
+        len([e for e in engs if e.uid == 'wikia'][0]._variants))
+
+    log('%-28s %10.2fms', 'load engines',
+        bench(lambda: engines.load(ENGINE_DIR), args.count))
+    log('%-28s %10.2fms', 'render list (fresh engines)',
+        bench(lambda: render_list(engines.load(ENGINE_DIR)), args.count))
+    log('%-28s %10.2fms', 'render list (same engines)',
+        bench(lambda: render_list(engs), args.count))
+    log('%-28s %10.2fms', 'all variants -> Search',
+        bench(lambda: searches(engines.load(ENGINE_DIR)), args.count))
+
+    engs = engines.load(ENGINE_DIR)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    variants = [v for e in engs for v in e.variants]
+    after_variants = tracemalloc.get_traced_memory()[0]
+    objs = [v.search for v in variants]
+    after_searches = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    log('%-28s %10.1fKB (%d bytes each)', 'Variant objects',
+        (after_variants - before) / 1024.0,
+        (after_variants - before) / len(variants))
+    log('%-28s %10.1fKB (%d bytes each)', 'Search objects',
+        (after_searches - after_variants) / 1024.0,
+        (after_searches - after_variants) / len(objs))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Benchmark cache serializers for search results.
+
+Compares pickled `Result` namedtuples (what the cache used to
+store), JSON and `searchio.results.ResultsSerializer` on typical
+sets of suggestions: dump time, load time, load time plus building
+every URL (as rendering results does) and size.
+
+Usage (from the ``bin`` directory):
+    python3 -m benchmark.micro.serializer [-n <count>]
+"""
+
+from __future__ import print_function, absolute_import
+
+import argparse
+from collections import namedtuple
+import json
+import pickle
+
+from benchmark.micro import bench, log
+from searchio import util
+from searchio.results import Result, ResultsSerializer
+
+# The cached type before `searchio.results`
+OldResult = namedtuple('OldResult', 'term url source')
+
+# (name, search title, search URL, terms)
+CASES = [
+    ('google, 10 terms', 'Google (English)',
+     'https://www.google.com/search?q={query}&hl=en&safe=off',
+     ['python {}'.format(w) for w in (
+         'tutorial', 'download', 'online', 'list', 'dictionary',
+         'for loop', 'string', 'range', 'class', 'print')]),
+    ('wikipedia, 10 terms', 'Wikipedia (Deutsch)',
+     'https://de.wikipedia.org/wiki/{query}',
+     [u'Stra\xdfe {}'.format(i) for i in range(10)]),
+    ('amazon, 20 terms', 'Amazon United States',
+     'https://www.amazon.com/s/?field-keywords={query}&tag=searchio-20',
+     ['usb c cable {} ft braided fast charging'.format(i)
+      for i in range(20)]),
+]
+
+
+def main():
+    """Run benchmarks."""
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('-n', '--count', type=int, default=5000,
+                    help='iterations per benchmark')
+    args = ap.parse_args()
+
+    log('%-20s %-8s %8s %8s %8s %8s', 'results', 'format', 'dump',
+        'load', '+urls', 'bytes')
+    for name, title, url, terms in CASES:
+        mkurl = util.urltemplate(url)
+        new = [Result(t, mkurl(t), title, mkurl) for t in terms]
+        old = [OldResult(t, mkurl(t), title) for t in terms]
+        rows = [list(r) for r in old]
+
+        formats = [
+            ('pickle', old,
+             lambda o: pickle.dumps(o, protocol=-1), pickle.loads),
+            ('json', rows,
+             lambda o: json.dumps(o).encode('utf-8'), json.loads),
+            ('compact', new,
+             ResultsSerializer.dumps, ResultsSerializer.loads),
+        ]
+
+        for fmt, obj, dumps, loads in formats:
+            blob = dumps(obj)
+            loaded = loads(blob)
+            if fmt == 'compact':
+                assert loaded == new
+            urls = (lambda rs: [r[1] for r in rs]) if fmt == 'json' \
+                else (lambda rs: [r.url for r in rs])
+
+            log('%-20s %-8s %6.1fus %6.1fus %6.1fus %8d', name, fmt,
+                bench(lambda: dumps(obj), args.count, 1e6),
+                bench(lambda: loads(blob), args.count, 1e6),
+                bench(lambda: urls(loads(blob)), args.count, 1e6),
+                len(blob))
+
+
+if __name__ == '__main__':
+    main()
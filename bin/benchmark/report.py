@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Benchmark results and comparison with a baseline.
+
+Results are saved as JSON:
+
+    {
+        "version": 1,
+        "meta": {"python": "3.11.4", "platform": "...", "commit": "...",
+                 "date": "2026-10-17T12:00:00", "count": 20},
+        "results": [
+            {"name": "search/hit", "description": "...", "runs": 20,
+             "min_ms": 48.1, "median_ms": 50.3, "mean_ms": 51.0,
+             "p95_ms": 55.2, "stdev_ms": 1.9},
+            ...
+        ]
+    }
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import datetime
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+# Format of results files
+VERSION = 1
+
+# Default baseline
+BASELINE = os.path.join(here, 'baseline.json')
+
+# Scenarios whose median is this much slower than the baseline's
+# (and at least `MIN_DIFF` milliseconds slower) are regressions.
+THRESHOLD = 0.2
+MIN_DIFF = 2.0
+
+
+def summarise(name, description, times):
+    """Return result of a scenario.
+
+    Args:
+        name (str): Name of scenario.
+        description (str): What the scenario measures.
+        times (list): Seconds each run took.
+
+    Returns:
+        dict: Result with times in milliseconds.
+
+    """
+    ms = sorted([t * 1000 for t in times])
+    p95 = ms[max(0, int(math.ceil(len(ms) * 0.95)) - 1)]
+    return dict(
+        name=name,
+        description=description,
+        runs=len(ms),
+        min_ms=round(ms[0], 2),
+        median_ms=round(statistics.median(ms), 2),
+        mean_ms=round(statistics.mean(ms), 2),
+        p95_ms=round(p95, 2),
+        stdev_ms=round(statistics.stdev(ms), 2) if len(ms) > 1 else 0.0,
+    )
+
+
+def commit():
+    """Return current git commit or ``None``."""
+    try:
+        out = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                      cwd=here, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return out.decode('utf-8').strip()
+
+
+def document(results, count):
+    """Return results file contents for ``results``."""
+    return dict(
+        version=VERSION,
+        meta=dict(
+            python=platform.python_version(),
+            platform=platform.platform(),
+            commit=commit(),
+            date=datetime.datetime.now().isoformat(timespec='seconds'),
+            count=count,
+        ),
+        results=results,
+    )
+
+
+def load(path):
+    """Load results file.
+
+    Raises:
+        ValueError: Raised if file isn't a results file of this version.
+
+    """
+    with open(path) as fp:
+        doc = json.load(fp)
+
+    if not isinstance(doc, dict) or doc.get('version') != VERSION:
+        raise ValueError('Not a version {} results file: {}'.format(
+                         VERSION, path))
+
+    return doc
+
+
+def save(doc, path):
+    """Save results file."""
+    with open(path, 'w') as fp:
+        json.dump(doc, fp, indent=2, sort_keys=True)
+        fp.write('\n')
+
+
+def compare(results, baseline, threshold=THRESHOLD, min_diff=MIN_DIFF):
+    """Compare ``results`` with ``baseline``.
+
+    Args:
+        results (list): Results of this run.
+        baseline (list): Results to compare with.
+        threshold (float, optional): Max. acceptable slowdown as
+            a fraction of the baseline median.
+        min_diff (float, optional): Slowdowns of fewer milliseconds
+            are never regressions.
+
+    Returns:
+        list: ``(name, baseline median, median, change, regressed)``
+            tuples for scenarios in both. ``change`` is a fraction.
+
+    """
+    before = dict([(r['name'], r) for r in baseline])
+    rows = []
+    for r in results:
+        b = before.get(r['name'])
+        if not b:
+            continue
+
+        old, new = b['median_ms'], r['median_ms']
+        change = (new - old) / old if old else 0.0
+        regressed = change > threshold and new - old >= min_diff
+        rows.append((r['name'], old, new, change, regressed))
+
+    return rows
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""The benchmarked scenarios.
+
+Each `Scenario` gets a new `Workspace` with a search (``bench``)
+pointing at the fixture server. `Scenario.setup` prepares it
+once, `Scenario.before` runs (untimed) before every timed run,
+and `Scenario.argv` returns the arguments of run *i*.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import json
+import os
+
+# Search every search scenario uses
+SEARCH = 'bench'
+
+# Size of "large" setups
+LARGE_ENGINES = 100
+LARGE_VARIANTS = 100
+LARGE_SEARCHES = 300
+
+
+def _nop(*args):
+    pass
+
+
+class Scenario(object):
+    """A command to time.
+
+    Attributes:
+        argv (callable): ``argv(ws, i)`` returns arguments of run *i*.
+        before (callable): ``before(ws, i)`` prepares run *i*.
+        description (str): What is measured.
+        name (str): Unique name of scenario.
+        program (str): ``searchio`` or ``search``.
+        setup (callable): ``setup(ws)`` prepares the workspace.
+        teardown (callable): ``teardown(ws)`` cleans up.
+
+    """
+
+    def __init__(self, name, description, argv, setup=_nop, before=_nop,
+                 teardown=_nop, program='searchio'):
+        """Create new `Scenario`."""
+        self.name = name
+        self.description = description
+        self.argv = argv
+        self.setup = setup
+        self.before = before
+        self.teardown = teardown
+        self.program = program
+
+
+def query(i):
+    """Return a query no earlier run has used."""
+    return u'bench query {:04d}'.format(i)
+
+
+def _warm(ws):
+    """Populate the cache, catalog and icon index."""
+    ws.run(['search', SEARCH, 'warm up'])
+    ws.run(['list'])
+
+
+def _large_catalog(ws):
+    ws.add_engines(LARGE_ENGINES, LARGE_VARIANTS)
+    ws.run(['list'])
+
+
+def _large_searches(ws):
+    for i in range(LARGE_SEARCHES):
+        ws.add_search('bench{:03d}'.format(i))
+    ws.run(['reload'])
+
+
+def _touch_search(ws, i):
+    """Change the title of one of the large set of searches."""
+    p = os.path.join(ws.datadir, 'searches',
+                     'bench{:03d}.json'.format(i % LARGE_SEARCHES))
+    with open(p) as fp:
+        d = json.load(fp)
+    d['title'] = u'Bench search {}'.format(i)
+    with open(p, 'w') as fp:
+        json.dump(d, fp)
+
+
+def _manifest(ws, i):
+    """Write a manifest of 50 new searches for run *i*."""
+    rows = [dict(uid='batch-{}-{}'.format(i, j), keyword='b{}'.format(j),
+                 title='Batch {} {}'.format(i, j),
+                 search_url='http://example.com/?q={query}',
+                 suggest_url=ws.suggest_url, jsonpath='$[1][*]')
+            for j in range(50)]
+    with open(os.path.join(ws.root, 'manifest.json'), 'w') as fp:
+        json.dump(rows, fp)
+
+
+def _start_daemon(ws):
+    ws.env['SEARCHIO_DAEMON'] = '1'
+    ws.run(['daemon', 'start'])
+    # wait for it to answer, which also primes its imports
+    ws.run([SEARCH, 'warm up'], program='search')
+
+
+def _stop_daemon(ws):
+    ws.run(['daemon', 'stop'])
+
+
+SCENARIOS = [
+    Scenario('search/cold',
+             'search with empty cache directory (cold start)',
+             lambda ws, i: ['search', SEARCH, query(i)],
+             before=lambda ws, i: ws.clear_cache()),
+    Scenario('search/miss',
+             'search for a new query (fetch from server)',
+             lambda ws, i: ['search', SEARCH, query(i)], setup=_warm),
+    Scenario('search/hit',
+             'search for a cached query',
+             lambda ws, i: ['search', SEARCH, 'warm up'], setup=_warm),
+    Scenario('search/script-filter',
+             'cached query via `search` program without daemon',
+             lambda ws, i: [SEARCH, 'warm up'], setup=_warm,
+             program='search'),
+    Scenario('search/daemon-miss',
+             'new query via `search` program and running daemon',
+             lambda ws, i: [SEARCH, query(i)], setup=_start_daemon,
+             teardown=_stop_daemon, program='search'),
+    Scenario('list',
+             'list engines',
+             lambda ws, i: ['list'], setup=_warm),
+    Scenario('list/query',
+             'list engines matching a query',
+             lambda ws, i: ['list', 'goo'], setup=_warm),
+    Scenario('variants',
+             "list an engine's variants",
+             lambda ws, i: ['variants', 'google'], setup=_warm),
+    Scenario('variants/all',
+             'search variants of all engines',
+             lambda ws, i: ['variants', '--all', 'english'],
+             setup=_warm),
+    Scenario('large/list',
+             'list engines with {} more engines of {} variants'.format(
+                 LARGE_ENGINES, LARGE_VARIANTS),
+             lambda ws, i: ['list'], setup=_large_catalog),
+    Scenario('large/list-cold',
+             'list engines with large catalog after it has changed',
+             lambda ws, i: ['list'], setup=_large_catalog,
+             before=lambda ws, i: os.utime(
+                 os.path.join(ws.datadir, 'engines', 'bench0.json'))),
+    Scenario('large/variants-all',
+             'search variants of all engines in large catalog',
+             lambda ws, i: ['variants', '--all', 'alpha'],
+             setup=_large_catalog),
+    Scenario('reload',
+             'reload with no changes',
+             lambda ws, i: ['reload'], setup=_warm),
+    Scenario('large/reload',
+             'reload {} searches after one has changed'.format(
+                 LARGE_SEARCHES),
+             lambda ws, i: ['reload'], setup=_large_searches,
+             before=_touch_search),
+    Scenario('add',
+             'add a search',
+             lambda ws, i: ['add', '-u', 'added-{}'.format(i),
+                            '-s', 'http://127.0.0.1:9/?q={query}',
+                            'k{}'.format(i), 'Added {}'.format(i),
+                            'http://example.com/?q={query}'],
+             setup=_warm),
+    Scenario('add/batch',
+             'add 50 searches from a manifest',
+             lambda ws, i: ['add', '--batch',
+                            os.path.join(ws.root, 'manifest.json')],
+             setup=_warm, before=_manifest),
+]
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Throwaway copy of the workflow to run benchmarks in.
+
+A `Workspace` copies ``src`` into a temporary directory, with empty
+data and cache directories, and runs ``searchio`` there with the
+environment Alfred would give it. Nothing in the repo (info.plist
+in particular) or in the real workflow's data is touched.
+
+Requests go to the fixture server (see `fixtures`) the workspace
+is created with, via ``SEARCHIO_FIXTURE_SERVER``.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import json
+import os
+import plistlib
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+# Workflow source directory
+SRC = os.path.normpath(os.path.join(here, '../../src'))
+
+# Variables passed through from the benchmark's environment
+PASSTHROUGH = ('HOME', 'LANG', 'LC_ALL', 'PATH', 'USER')
+
+# Suggest URL of benchmark searches (answered by the fixture server)
+SUGGEST_URL = ('https://suggestqueries.google.com/complete/search'
+               '?client=firefox&q={query}')
+
+
+class CommandFailed(Exception):
+    """Raised if a benchmarked command exits with an error."""
+
+
+class Workspace(object):
+    """Copy of the workflow with its own data and cache.
+
+    Attributes:
+        cachedir (str): Workflow's cache directory.
+        datadir (str): Workflow's data directory.
+        env (dict): Environment commands are run in.
+        root (str): Temporary directory containing everything.
+        server_url (str): URL of fixture server.
+        suggest_url (str): Suggest URL of new searches.
+        workflowdir (str): Copy of ``src``.
+
+    """
+
+    def __init__(self, server_url, suggest_url=SUGGEST_URL):
+        """Create new `Workspace` in a temporary directory."""
+        self.server_url = server_url
+        self.suggest_url = suggest_url
+        self.root = tempfile.mkdtemp(prefix='searchio-bench-')
+        self.workflowdir = os.path.join(self.root, 'workflow')
+        self.datadir = os.path.join(self.root, 'data')
+        self.cachedir = os.path.join(self.root, 'cache')
+
+        shutil.copytree(SRC, self.workflowdir, symlinks=True,
+                        ignore=shutil.ignore_patterns('__pycache__', '*.pyc',
+                                                      'pkg'))
+        for p in (self.datadir, self.cachedir):
+            os.makedirs(p)
+
+        with open(os.path.join(self.workflowdir, 'info.plist'), 'rb') as fp:
+            info = plistlib.load(fp)
+
+        self.env = dict([(k, os.environ[k]) for k in PASSTHROUGH
+                         if k in os.environ])
+        self.env.update({
+            'alfred_workflow_bundleid': info['bundleid'] + '.bench',
+            'alfred_workflow_name': info['name'],
+            'alfred_workflow_version': info.get('version') or '0.0',
+            'alfred_workflow_data': self.datadir,
+            'alfred_workflow_cache': self.cachedir,
+            'SEARCHIO_FIXTURE_SERVER': server_url,
+        })
+
+    def run(self, argv, program='searchio'):
+        """Run ``program`` with arguments ``argv``.
+
+        Args:
+            argv (list): Command-line arguments.
+            program (str, optional): ``searchio`` or ``search``.
+
+        Returns:
+            float: Seconds the program took to run.
+
+        Raises:
+            CommandFailed: Raised if the program exits with an error.
+
+        """
+        start = time.perf_counter()
+        p = self.execute(argv, program)
+        elapsed = time.perf_counter() - start
+        if p.returncode:
+            raise CommandFailed('{} exited with {}:\n{}'.format(
+                                ' '.join(p.args), p.returncode,
+                                p.stderr.decode('utf-8', 'replace')))
+
+        return elapsed
+
+    def execute(self, argv, program='searchio', options=(), env=None):
+        """Run ``program`` and return its output and exit status.
+
+        Args:
+            argv (list): Command-line arguments.
+            program (str, optional): ``searchio`` or ``search``.
+            options (sequence, optional): Options for Python,
+                e.g. ``['-X', 'importtime']``.
+            env (dict, optional): Variables to add to `env`.
+
+        Returns:
+            subprocess.CompletedProcess: Finished process with
+                output as `bytes`.
+
+        """
+        cmd = [sys.executable] + list(options)
+        cmd += [os.path.join(self.workflowdir, program)] + argv
+        environ = dict(self.env)
+        environ.update(env or {})
+        return subprocess.run(cmd, cwd=self.workflowdir, env=environ,
+                              stdin=subprocess.DEVNULL,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+    def add_search(self, uid, jsonpath='$[1][*]'):
+        """Save a search that gets suggestions from `suggest_url`."""
+        p = os.path.join(self.datadir, 'searches', uid + '.json')
+        if not os.path.exists(os.path.dirname(p)):
+            os.makedirs(os.path.dirname(p))
+
+        with open(p, 'w') as fp:
+            json.dump(dict(title='Bench ' + uid, keyword=uid,
+                           icon='icons/engines/google.png',
+                           jsonpath=jsonpath, pcencode=False,
+                           search_url='http://example.com/?q={query}',
+                           suggest_url=self.suggest_url), fp, indent=2)
+
+        return p
+
+    def add_engines(self, engines, variants, seed=0):
+        """Generate ``engines`` engine files of ``variants`` each.
+
+        Titles and names are made of random words from a generator
+        seeded with ``seed``, so they are the same on every run.
+
+        """
+        rand = random.Random(seed)
+        words = ['alpha', 'bravo', 'charlie', 'delta', 'echo', 'foxtrot',
+                 'golf', 'hotel', 'india', 'juliet', 'kilo', 'lima',
+                 'mike', 'november', 'oscar', 'papa', 'quebec', 'romeo']
+        dirpath = os.path.join(self.datadir, 'engines')
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        for i in range(engines):
+            title = u'{} {}'.format(rand.choice(words).title(), i)
+            vs = []
+            for j in range(variants):
+                name = u'{} {}'.format(rand.choice(words).title(),
+                                       rand.choice(words))
+                vs.append(dict(
+                    uid='v{}'.format(j),
+                    name=name,
+                    title=u'{} ({})'.format(title, name),
+                    search_url='http://example.com/{}/{}?q={{query}}'.format(
+                        i, j),
+                    suggest_url='http://127.0.0.1:9/{}/{}?q={{query}}'.format(
+                        i, j),
+                ))
+
+            d = dict(title=title, description='Generated engine', variants=vs)
+            with open(os.path.join(dirpath, 'bench{}.json'.format(i)),
+                      'w') as fp:
+                json.dump(d, fp)
+
+    def clear_cache(self):
+        """Delete everything in the cache directory."""
+        shutil.rmtree(self.cachedir)
+        os.makedirs(self.cachedir)
+
+    def remove(self):
+        """Delete the workspace."""
+        shutil.rmtree(self.root, ignore_errors=True)
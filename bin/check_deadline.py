@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Check that a search's deadline covers reading the response.
+
+Runs the ``search`` Script Filter program in a throwaway workspace
+(see `benchmark.workspace`) against a fixture server that sends
+responses a byte at a time (a ``trickle`` fault), which never hits
+a socket timeout. It checks, both without and with the daemon (and
+its connection pool), that
+
+- a query that isn't cached is answered within the deadline plus
+  `SLACK` with just the query, not an error, and that
+
+- a query whose cached suggestions have expired is answered within
+  the same time with the expired suggestions.
+
+Exits with status 1 if a check fails.
+
+Usage (from the ``bin`` directory):
+    check_deadline.py [-t <secs>]
+"""
+
+from __future__ import print_function, absolute_import
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from benchmark.workspace import Workspace
+from fixtures.server import Faults, FixtureServer
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '../src/lib'))
+
+from searchio import client  # noqa: E402
+
+# Search the checks use
+SEARCH = 'check'
+
+# Seconds a search may take on top of its deadline, for starting
+# Python etc.
+SLACK = 1.5
+
+
+def log(s, *args):
+    """Simple STDERR logger."""
+    if args:
+        s = s % args
+    print(s, file=sys.stderr)
+
+
+def expire(ws):
+    """Make all cached suggestions in ``ws`` an hour older."""
+    conn = sqlite3.connect(os.path.join(ws.cachedir, 'searches.db'))
+    with conn:
+        conn.execute('UPDATE entries SET created = created - 3600')
+    conn.close()
+
+
+def search(ws, query, env):
+    """Run ``search`` and return its items and the seconds it took."""
+    start = time.time()
+    p = ws.execute([SEARCH, query], 'search', env=env)
+    elapsed = time.time() - start
+    try:
+        items = json.loads(p.stdout.decode('utf-8'))['items']
+    except (ValueError, KeyError):
+        items = []
+
+    return items, elapsed
+
+
+def check(ws, name, ok, slow, timeout):
+    """Check searches against ``slow`` server.
+
+    Args:
+        ws (Workspace): Workspace to run ``search`` in.
+        name (str): Name of case.
+        ok (str): URL of fixture server that answers normally.
+        slow (str): URL of fixture server that trickles.
+        timeout (float): Deadline of searches.
+
+    Returns:
+        int: Number of failed checks.
+
+    """
+    env = {'SEARCHIO_FIXTURE_SERVER': slow, 'SEARCHIO_TIMEOUT': str(timeout)}
+    limit = timeout + SLACK
+    failed = 0
+
+    # Prime cache with fast server, then expire suggestions
+    cached, _ = search(ws, name + ' cached', {'SEARCHIO_FIXTURE_SERVER': ok})
+    expire(ws)
+
+    cases = [
+        ('uncached', name + ' new', 1),
+        ('expired', name + ' cached', len(cached)),
+    ]
+    for case, query, count in cases:
+        items, elapsed = search(ws, query, env)
+        titles = [it.get('title', '') for it in items]
+        ok_ = (elapsed <= limit and len(items) == count and
+               not [t for t in titles if t.startswith('Error')])
+        failed += not ok_
+        log('%-5s %-7s %-9s %d item(s) in %0.2fs (limit %0.2fs)',
+            'ok' if ok_ else 'FAIL', name, case, len(items), elapsed, limit)
+        if not ok_:
+            log('  %r', titles[:5])
+
+    return failed
+
+
+def main():
+    """Run checks."""
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('-t', '--timeout', type=float, default=1.0,
+                    help='deadline of searches (default: %(default)s)')
+    args = ap.parse_args()
+
+    ok = FixtureServer()
+    slow = FixtureServer(faults=Faults.parse(['trickle:1.0'], trickle=0.2))
+    ok.start()
+    slow.start()
+    ws = Workspace(ok.url)
+    try:
+        ws.add_search(SEARCH)
+        failed = check(ws, 'web', ok.url, slow.url, args.timeout)
+
+        ws.run(['daemon', 'start'])
+        path = client.socket_path(ws.cachedir)
+        for _ in range(50):
+            if client.call(['ping'], env={}, path=path):
+                break
+            time.sleep(0.1)
+        else:
+            log('FAIL  daemon did not start')
+            return 1
+
+        try:
+            failed += check(ws, 'daemon', ok.url, slow.url, args.timeout)
+        finally:
+            ws.run(['daemon', 'stop'])
+    finally:
+        ws.remove()
+        ok.stop()
+        slow.stop()
+
+    if failed:
+        log('%d check(s) failed', failed)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
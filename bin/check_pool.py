@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Check that `searchio.pool` reuses HTTP connections.
+
+Starts a local keep-alive HTTP server that counts the TCP
+connections it accepts, fetches suggestions through a
+`ConnectionPool` and through `workflow.web`, and compares
+the pool's counters with what the server saw.
+
+Exits with status 1 if connections weren't reused.
+
+Usage:
+    check_pool.py [-n <count>]
+"""
+
+from __future__ import print_function, absolute_import
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import sys
+import threading
+import time
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '../src/lib'))
+
+from workflow import web  # noqa: E402
+from searchio.pool import ConnectionPool  # noqa: E402
+
+
+class Handler(BaseHTTPRequestHandler):
+    """OpenSearch-style suggestions over HTTP/1.1."""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+        self.server.connections += 1
+
+    def do_GET(self):
+        body = json.dumps(['q', ['a', 'b', 'c']]).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # Drop the connection without telling the client
+        if self.server.hangup:
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+def log(s, *args):
+    """Simple STDERR logger."""
+    if args:
+        s = s % args
+    print(s, file=sys.stderr)
+
+
+def fetch(get, url, count):
+    """Call ``get`` ``count`` times and return seconds taken."""
+    start = time.time()
+    for i in range(count):
+        get('{}?q={}'.format(url, i)).json()
+    return time.time() - start
+
+
+def main():
+    """Run checks."""
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('-n', '--count', type=int, default=50,
+                    help='number of requests')
+    args = ap.parse_args()
+    n = args.count
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.connections = 0
+    server.hangup = False
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{}/complete'.format(server.server_port)
+    ok = True
+
+    # workflow.web: one connection per request
+    secs = fetch(web.get, url, n)
+    log('workflow.web : %3d request(s), %3d connection(s), %0.1fms/req',
+        n, server.connections, secs / n * 1000)
+
+    # pool: one connection for all requests
+    server.connections = 0
+    pool = ConnectionPool()
+    secs = fetch(pool.get, url, n)
+    log('pool         : %3d request(s), %3d connection(s), %0.1fms/req',
+        n, server.connections, secs / n * 1000)
+    log('pool stats   : %r', pool.stats)
+    if server.connections != 1 or pool.stats['reused'] != n - 1:
+        log('FAIL: connections not reused')
+        ok = False
+
+    # idle connections expire
+    server.connections = 0
+    pool = ConnectionPool(idle_timeout=0.1)
+    pool.get(url).json()
+    time.sleep(0.2)
+    pool.get(url).json()
+    log('idle timeout : %r', pool.stats)
+    if server.connections != 2 or pool.stats['discarded'] != 1:
+        log('FAIL: idle connection not discarded')
+        ok = False
+
+    # connections closed by the server are replaced
+    server.connections = 0
+    server.hangup = True
+    pool = ConnectionPool()
+    pool.get(url).json()
+    time.sleep(0.1)
+    pool.get(url).json()
+    log('stale        : %r', pool.stats)
+    if server.connections != 2:
+        log('FAIL: stale connection not replaced')
+        ok = False
+
+    server.shutdown()
+    log('OK' if ok else 'FAILED')
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Check the fast path of the ``search`` Script Filter program.
+
+Runs ``searchio search`` and ``search`` for the same queries in a
+throwaway workspace (see `benchmark.workspace`) against the fixture
+server, and checks that
+
+- both write exactly the same output, whether the query is cached
+  or not, the search doesn't exist, Alfred's debugger is open or
+  session variables are set, and that
+
+- answering a cached query with ``search`` imports none of
+  `FORBIDDEN` and spends at most `BUDGET` of the time ``searchio
+  search`` spends importing modules (medians of ``python -X
+  importtime``). The budget is relative, as absolute import times
+  vary too much from machine to machine.
+
+Exits with status 1 if a check fails.
+
+Usage (from the ``bin`` directory):
+    check_search.py [-n <count>] [-b <fraction>]
+"""
+
+from __future__ import print_function, absolute_import
+
+import argparse
+import statistics
+import sys
+
+from benchmark.workspace import Workspace
+from fixtures.server import FixtureServer
+
+# Search the checks use
+SEARCH = 'check'
+
+# Max. median import time of a cached search as a fraction of
+# `searchio search`'s
+BUDGET = 0.7
+
+# Modules a cached search must not import
+FORBIDDEN = ('docopt', 'workflow')
+
+
+def log(s, *args):
+    """Simple STDERR logger."""
+    if args:
+        s = s % args
+    print(s, file=sys.stderr)
+
+
+def imports(stderr):
+    """Parse ``-X importtime`` report.
+
+    Returns:
+        tuple: Names of imported modules and the total
+            (cumulative) import time in milliseconds.
+
+    """
+    names = []
+    total = 0
+    for line in stderr.decode('utf-8', 'replace').splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[12:].split('|')
+        if not cumulative.strip().isdigit():  # header
+            continue
+        names.append(name.strip())
+        if not name[1:].startswith(' '):  # top-level import
+            total += int(cumulative)
+
+    return names, total / 1000.0
+
+
+def check_output(ws):
+    """Compare output of ``searchio search`` and ``search``.
+
+    Returns:
+        int: Number of cases whose output differs.
+
+    """
+    cases = [
+        ('miss, then hit', [SEARCH, 'first query'], {}),
+        ('unicode', [SEARCH, u'münchen'], {}),
+        ('unknown search', ['no-such-search', 'query'], {}),
+        ('debugger open', [SEARCH, 'debug query'], {'alfred_debug': '1'}),
+        ('session', [SEARCH, 'session query'], {'_WF_SESSION_ID': 'abc'}),
+    ]
+    failed = 0
+    for name, argv, env in cases:
+        # each program gets to go first with an empty cache
+        for first, second in (('searchio', 'search'),
+                              ('search', 'searchio')):
+            ws.clear_cache()
+            outputs = {}
+            for program in (first, second):
+                args = ['search'] + argv if program == 'searchio' else argv
+                outputs[program] = ws.execute(args, program, env=env).stdout
+
+            ok = outputs['searchio'] == outputs['search']
+            failed += not ok
+            log('%-5s %-16s %s first', 'ok' if ok else 'FAIL', name, first)
+            if not ok:
+                log('  searchio: %r', outputs['searchio'][:200])
+                log('  search:   %r', outputs['search'][:200])
+
+    return failed
+
+
+def check_imports(ws, count, budget):
+    """Check imports of ``search`` answering a cached query.
+
+    Returns:
+        int: Number of failed checks.
+
+    """
+    argv = [SEARCH, 'cached query']
+    ws.execute(argv, 'search')
+
+    fast, slow = [], []
+    modules = set()
+    for _ in range(count):
+        p = ws.execute(argv, 'search', ['-X', 'importtime'])
+        names, total = imports(p.stderr)
+        modules.update(names)
+        fast.append(total)
+        p = ws.execute(['search'] + argv, 'searchio', ['-X', 'importtime'])
+        slow.append(imports(p.stderr)[1])
+
+    failed = 0
+    forbidden = sorted([m for m in modules
+                        if m.split('.')[0] in FORBIDDEN])
+    if forbidden:
+        failed += 1
+        log('FAIL  imported %s', ', '.join(forbidden))
+    else:
+        log('ok    imported none of %s', ', '.join(FORBIDDEN))
+
+    median, limit = statistics.median(fast), statistics.median(slow) * budget
+    ok = median <= limit
+    failed += not ok
+    log('%-5s imports: %0.1fms median, budget %0.1fms '
+        '(%d%% of `searchio search`), %d modules',
+        'ok' if ok else 'FAIL', median, limit, budget * 100, len(modules))
+
+    return failed
+
+
+def main():
+    """Run checks."""
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('-n', '--count', type=int, default=10,
+                    help='runs to take median import time of')
+    ap.add_argument('-b', '--budget', type=float, default=BUDGET,
+                    help="max. import time as a fraction of "
+                    "`searchio search`'s (default: %(default)s)")
+    args = ap.parse_args()
+
+    server = FixtureServer()
+    server.start()
+    ws = Workspace(server.url)
+    try:
+        ws.add_search(SEARCH)
+        failed = check_output(ws) + check_imports(ws, args.count,
+                                                  args.budget)
+    finally:
+        ws.remove()
+        server.stop()
+
+    if failed:
+        log('%d check(s) failed', failed)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
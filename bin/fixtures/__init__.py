@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Local stand-in for the suggest APIs of the shipped engines.
+
+`fixtures.server.FixtureServer` answers requests with recorded (or
+made-up) suggestions in the wire format of the API each URL
+belongs to (see `fixtures.formats`), with configurable latency,
+jitter, gzip compression and injected errors.
+
+searchio sends its requests to the server instead of the real
+APIs when ``SEARCHIO_FIXTURE_SERVER`` is set to the server's URL
+(or when a function is set with `searchio.util.set_rewrite()`).
+
+Run from the ``bin`` directory:
+
+    python3 -m fixtures [-p <port>] [--latency <secs>] [--jitter <secs>]
+                        [--gzip] [--fault <kind>:<rate>]... [--seed <n>]
+    python3 -m fixtures --check
+
+"""
+
+__version__ = '1.0'
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Run the fixture server, or check searchio against it.
+
+Usage (from the ``bin`` directory):
+    python3 -m fixtures [-p <port>] [--latency <secs>] [--jitter <secs>]
+                        [--gzip] [--fault <kind>:<rate>]... [--seed <n>]
+    python3 -m fixtures --check [--gzip]
+
+Faults are an HTTP status code or ``reset``, ``hang``, ``garbage`` or
+``trickle`` and the probability of a response being one, e.g.
+``503:0.05``.
+"""
+
+from __future__ import print_function, absolute_import
+
+import argparse
+import os
+import sys
+
+from fixtures import formats
+from fixtures.server import Faults, FixtureServer
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, '../../src/lib'))
+
+# Query every engine is checked with
+QUERY = u'münchen'
+
+
+def log(s, *args):
+    """Simple STDERR logger."""
+    if args:
+        s = s % args
+    print(s, file=sys.stderr)
+
+
+def check(server):
+    """Fetch suggestions for every shipped engine from ``server``.
+
+    Returns:
+        int: Number of engines whose suggestions were wrong.
+
+    """
+    from searchio import engines, jpath, util
+
+    # the Google Places URLs need an API key
+    os.environ.setdefault('GOOGLE_PLACES_API_KEY', 'fixture')
+    util.set_rewrite(lambda url: util.fixture_url(server.url, url))
+    want = formats.suggestions(QUERY)
+    failed = 0
+    try:
+        dirpath = os.path.join(here, '../../src/lib/searchio/engines')
+        for e in engines.load(dirpath):
+            v = e.variants[0]
+            s = v.search
+            url = util.mkurl(s.suggest_url, QUERY, s.pcencode)
+            f = formats.find(url.split('://', 1)[1])
+            got = util.findjson(url, jpath.compile(s.jsonpath))
+            ok = got == want
+            failed += not ok
+            log('%-5s %-20s %-14s %d suggestion(s)', 'ok' if ok else 'FAIL',
+                e.uid, f.name, len(got))
+    finally:
+        util.set_rewrite(None)
+
+    return failed
+
+
+def main():
+    """Run fixture server."""
+    ap = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('-p', '--port', type=int, default=0,
+                    help='port to listen on (default: any free port)')
+    ap.add_argument('--latency', type=float, default=0.0,
+                    help='seconds to wait before answering')
+    ap.add_argument('--jitter', type=float, default=0.0,
+                    help='max. seconds to add to or take from latency')
+    ap.add_argument('--gzip', action='store_true',
+                    help='gzip responses if client accepts it')
+    ap.add_argument('--fault', action='append', default=[],
+                    metavar='KIND:RATE', help='inject errors '
+                    '(may be repeated)')
+    ap.add_argument('--hang', type=float, default=30.0,
+                    help='seconds a "hang" fault lasts (default: '
+                    '%(default)s)')
+    ap.add_argument('--trickle', type=float, default=0.5,
+                    help='seconds between bytes of a "trickle" fault '
+                    '(default: %(default)s)')
+    ap.add_argument('--seed', type=int, default=0,
+                    help='seed of random delays and faults')
+    ap.add_argument('--check', action='store_true',
+                    help='check suggestions of every shipped engine '
+                    'and exit')
+    args = ap.parse_args()
+
+    try:
+        faults = Faults.parse(args.fault, args.hang, args.trickle)
+    except ValueError as err:
+        ap.error(str(err))
+
+    server = FixtureServer(args.port, args.latency, args.jitter, args.gzip,
+                           faults, args.seed)
+    if args.check:
+        server.start()
+        try:
+            failed = check(server)
+        finally:
+            server.stop()
+
+        if failed:
+            log('%d engine(s) failed', failed)
+            return 1
+        return 0
+
+    print('export SEARCHIO_FIXTURE_SERVER={}'.format(server.url))
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
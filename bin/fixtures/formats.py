@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Response formats of the suggest APIs the shipped engines use.
+
+Each format has a `Format` that recognises the API's URLs, finds
+the query in them and renders suggestions the way the API does.
+`RECORDED` (``recorded.json``) has suggestions for some queries;
+suggestions for any other query are made up from the query, so
+every query gets the same response every time.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import json
+import os
+import re
+from urllib.parse import parse_qs, quote
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+# Number of suggestions made up for queries that aren't recorded
+SUGGESTIONS = 10
+
+# Words made-up suggestions are made of
+WORDS = [
+    'tutorial', 'download', 'online', 'list', 'dictionary', 'meaning',
+    'definition', 'review', 'price', 'near me', 'map', 'wiki', 'lyrics',
+    'movie', 'book', 'game', 'recipe', 'weather', 'news', 'images',
+]
+
+with open(os.path.join(here, 'recorded.json')) as _fp:
+    # query -> suggestions
+    RECORDED = json.load(_fp)
+
+
+def suggestions(query):
+    """Return recorded or made-up suggestions for ``query``."""
+    hit = RECORDED.get(query.lower())
+    if hit:
+        return list(hit)
+
+    if not query:
+        return []
+
+    i = sum([ord(c) for c in query]) % len(WORDS)
+    words = (WORDS[i:] + WORDS[:i])[:SUGGESTIONS]
+    return [u'{} {}'.format(query, w) for w in words]
+
+
+def opensearch(query, terms):
+    """OpenSearch suggestions: ``[query, [term, ...]]``."""
+    return [query, terms]
+
+
+def google(query, terms):
+    """Google's ``client=firefox``: OpenSearch plus metadata."""
+    return [query, terms, [],
+            {'google:suggestsubtypes': [[512, 433] for _ in terms]}]
+
+
+def mediawiki(query, terms):
+    """MediaWiki ``action=opensearch``: terms, descriptions, URLs."""
+    return [query, terms, [u'' for _ in terms],
+            [u'https://example.org/wiki/' + quote(t.replace(' ', '_'))
+             for t in terms]]
+
+
+def duckduckgo(query, terms):
+    """DuckDuckGo: list of ``{"phrase": term}`` objects."""
+    return [{'phrase': t} for t in terms]
+
+
+def amazon(query, terms):
+    """Amazon completion API 2017."""
+    return {
+        'alias': 'aps',
+        'prefix': query,
+        'suffix': None,
+        'suggestions': [{'suggType': 'KeywordSuggestion', 'type': 'KEYWORD',
+                         'value': t, 'refTag': 'nb_sb_ss_i_{}_{}'.format(
+                             i + 1, len(query))}
+                        for i, t in enumerate(terms)],
+        'suggestionTitleId': None,
+        'responseId': '1Q2W3E4R5T6Y7U8I9O0P',
+        'shuffled': False,
+    }
+
+
+def google_places(query, terms):
+    """Google Places query autocomplete."""
+    return {
+        'predictions': [{'description': t,
+                         'matched_substrings': [{'length': len(query),
+                                                 'offset': 0}],
+                         'terms': [{'offset': 0, 'value': t}]}
+                        for t in terms],
+        'status': 'OK',
+    }
+
+
+class Format(object):
+    """Response format of a suggest API.
+
+    Attributes:
+        name (str): Name of format.
+        params (tuple): Names of query parameter that may hold the
+            query.
+        pattern (re.Pattern): Matches ``<host><path>?<query>`` of
+            the API's URLs.
+        render (callable): ``render(query, terms)`` returns the
+            JSON-serialisable response.
+
+    """
+
+    def __init__(self, name, pattern, params, render):
+        """Create new `Format`."""
+        self.name = name
+        self.pattern = re.compile(pattern)
+        self.params = params
+        self.render = render
+
+    def query(self, qs):
+        """Return query from query string ``qs``."""
+        d = parse_qs(qs)
+        for k in self.params:
+            if d.get(k):
+                return d[k][0]
+
+        return u''
+
+
+FORMATS = [
+    Format('google-places', r'^maps\.googleapis\.com/', ('input',),
+           google_places),
+    Format('amazon', r'^completion\.amazon\.', ('prefix',), amazon),
+    Format('duckduckgo', r'^duckduckgo\.com/ac/', ('q',), duckduckgo),
+    Format('mediawiki', r'[?&]action=opensearch', ('search',), mediawiki),
+    Format('google', r'^suggestqueries\.google\.com/', ('q',), google),
+    Format('bing', r'^api\.bing\.com/osjson', ('query',), opensearch),
+    Format('ebay', r'^autosug\.ebay\.com/', ('kwd',), opensearch),
+    Format('yandex', r'^suggest\.yandex\.', ('part',), opensearch),
+    Format('naver', r'^ac\.search\.naver\.com/', ('q',), opensearch),
+]
+
+# Anything else is answered as OpenSearch
+DEFAULT = Format('opensearch', r'', ('q', 'query', 'search', 'term'),
+                 opensearch)
+
+
+def find(target):
+    """Return `Format` of URL ``target`` (``<host><path>?<query>``)."""
+    for f in FORMATS:
+        if f.pattern.search(target):
+            return f
+
+    return DEFAULT
+
+
+def response(target):
+    """Return format and body of response to ``target``.
+
+    Args:
+        target (str): Requested URL minus scheme,
+            i.e. ``<host><path>?<query>``.
+
+    Returns:
+        tuple: ``(Format, bytes)``.
+
+    """
+    f = find(target)
+    qs = target.split('?', 1)[1] if '?' in target else ''
+    query = f.query(qs)
+    body = json.dumps(f.render(query, suggestions(query)),
+                      ensure_ascii=False).encode('utf-8')
+    return f, body
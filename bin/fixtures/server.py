@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""HTTP server that stands in for the engines' suggest APIs.
+
+A request for ``/<host><path>?<query>`` is answered the way
+``<scheme>://<host><path>?<query>`` would be (see
+`fixtures.formats`), which is where `searchio.util.fixture_url()`
+sends requests when ``SEARCHIO_FIXTURE_SERVER`` is set.
+
+Responses can be delayed (`FixtureServer.latency` plus or minus up
+to `FixtureServer.jitter`), gzipped and, at random, replaced with
+faults (see `Faults`). The random numbers come from a generator
+with a fixed seed, so a run of requests gets the same delays and
+faults every time.
+
+``/_stats`` returns counts of requests by format and of faults.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import random
+import threading
+import time
+
+from fixtures import formats
+
+# Kinds of faults besides HTTP status codes
+RESET = 'reset'      # close connection without a response
+HANG = 'hang'        # don't answer for `Faults.hang` seconds
+GARBAGE = 'garbage'  # truncated JSON
+TRICKLE = 'trickle'  # send a byte of the body every `Faults.trickle` seconds
+
+KINDS = (RESET, HANG, GARBAGE, TRICKLE)
+
+
+class Faults(object):
+    """Errors to inject, and how often.
+
+    Attributes:
+        hang (float): Seconds a `HANG` fault lasts.
+        rates (list): ``(kind, probability)`` tuples. ``kind`` is an
+            HTTP status code or one of `KINDS`.
+        trickle (float): Seconds between bytes of a `TRICKLE` fault.
+
+    """
+
+    def __init__(self, rates=None, hang=30.0, trickle=0.5):
+        """Create new `Faults`."""
+        self.rates = list(rates or [])
+        self.hang = hang
+        self.trickle = trickle
+
+    @classmethod
+    def parse(cls, specs, hang=30.0, trickle=0.5):
+        """Create `Faults` from ``kind:probability`` strings.
+
+        Raises:
+            ValueError: Raised if a spec is invalid.
+
+        """
+        rates = []
+        for spec in specs:
+            kind, _, rate = spec.partition(':')
+            if kind.isdigit():
+                kind = int(kind)
+            elif kind not in KINDS:
+                raise ValueError('Unknown fault: {!r}'.format(kind))
+
+            rate = float(rate or 1)
+            if not 0 <= rate <= 1:
+                raise ValueError('Invalid probability: {!r}'.format(spec))
+            rates.append((kind, rate))
+
+        return cls(rates, hang, trickle)
+
+    def pick(self, rand):
+        """Return a fault chosen with ``rand`` or ``None``."""
+        x = rand.random()
+        for kind, rate in self.rates:
+            if x < rate:
+                return kind
+            x -= rate
+
+        return None
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answer a request like the suggest API it's for."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        """Send response for requested URL."""
+        server = self.server
+        if self.path == '/_stats':
+            return self._send(200, json.dumps(server.stats).encode('utf-8'))
+
+        delay, fault = server.draw()
+        if delay:
+            time.sleep(delay)
+
+        f, body = formats.response(self.path.lstrip('/'))
+        server.count(f.name, fault)
+
+        if fault == RESET:
+            self.close_connection = True
+            return
+
+        if fault == HANG:
+            time.sleep(server.faults.hang)
+            self.close_connection = True
+            return
+
+        if fault == GARBAGE:
+            body = body[:len(body) // 2]
+        elif fault == TRICKLE:
+            return self._send(200, body, server.faults.trickle)
+        elif fault is not None:
+            body = json.dumps({'error': fault}).encode('utf-8')
+            return self._send(fault, body)
+
+        self._send(200, body)
+
+    def _send(self, status, body, interval=0.0):
+        headers = {'Content-Type': 'application/json; charset=utf-8'}
+        if (self.server.gzip and
+                'gzip' in self.headers.get('Accept-Encoding', '')):
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
+
+        headers['Content-Length'] = str(len(body))
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.end_headers()
+        if not interval:
+            self.wfile.write(body)
+            return
+
+        try:
+            for i in range(len(body)):
+                self.wfile.write(body[i:i + 1])
+                time.sleep(interval)
+        except (BrokenPipeError, ConnectionResetError):  # client gave up
+            self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """Stand-in for all the suggest APIs.
+
+    Attributes:
+        faults (Faults): Errors to inject.
+        gzip (bool): Whether to gzip responses to clients that
+            accept it.
+        jitter (float): Max. seconds to add to or take from `latency`.
+        latency (float): Seconds to wait before answering.
+        stats (dict): Number of ``requests`` by format and ``faults``
+            by kind.
+
+    """
+
+    daemon_threads = True
+
+    def __init__(self, port=0, latency=0.0, jitter=0.0, gzip=False,
+                 faults=None, seed=0):
+        """Create new `FixtureServer` on localhost.
+
+        Args:
+            port (int, optional): Port to listen on. ``0`` picks a
+                free port.
+            seed (int, optional): Seed of random delays and faults.
+
+        """
+        ThreadingHTTPServer.__init__(self, ('127.0.0.1', port), Handler)
+        self.latency = latency
+        self.jitter = jitter
+        self.gzip = gzip
+        self.faults = faults or Faults()
+        self.stats = dict(requests={}, faults={})
+        self._rand = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        """Base URL of server, for ``SEARCHIO_FIXTURE_SERVER``."""
+        return 'http://127.0.0.1:{}'.format(self.server_address[1])
+
+    def draw(self):
+        """Return delay and fault (or ``None``) for a request."""
+        with self._lock:
+            delay = self.latency
+            if self.jitter:
+                delay += self._rand.uniform(-self.jitter, self.jitter)
+            fault = self.faults.pick(self._rand)
+
+        return max(0.0, delay), fault
+
+    def count(self, name, fault):
+        """Count a request of format ``name``."""
+        with self._lock:
+            d = self.stats['requests']
+            d[name] = d.get(name, 0) + 1
+            if fault is not None:
+                d = self.stats['faults']
+                d[str(fault)] = d.get(str(fault), 0) + 1
+
+    def start(self):
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop serving requests."""
+        self.shutdown()
+        self.server_close()
@@ -42,8 +42,13 @@ class JsonPathParser(object):
             module_name = __name__
         
         parsing_table_module = '_'.join([module_name, start_symbol, 'parsetab'])
+        # Qualify with the package name so PLY can import the pre-built
+        # tables shipped alongside this module instead of rebuilding them.
+        if __package__:
+            parsing_table_module = '.'.join([__package__, parsing_table_module])
 
-        # And we regenerate the parse table every time; it doesn't actually take that long!
+        # Tables are not written at runtime; the shipped tables are used if
+        # their signature matches the grammar, otherwise they're regenerated.
         new_parser = ply.yacc.yacc(module=self,
                                    debug=self.debug,
                                    tabmodule = parsing_table_module,
@@ -24,6 +24,14 @@ HELP_URL = "https://github.com/giovannicoppola/alfred-searchio"
 # Cache search results for 15 minutes
 MAX_CACHE_AGE = 900
 
+# Stop reading suggestions after this many (0 = no limit)
+MAX_SUGGESTIONS = 20
+
+# Give up on fetching suggestions after this many seconds
+TIMEOUT = 3
+# of which at most this many may be spent connecting
+CONNECT_TIMEOUT = 1
+
 IMAGE_EXTENSIONS = [
     ".png",
     ".icns",
@@ -0,0 +1,882 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Cache for search suggestions.
+
+Suggestions are cached per search UID and query. There are two
+backends:
+
+`SQLiteStore` (the default) keeps everything in a single SQLite
+database, indexed on ``(uid, query hash)``, with creation and
+access times, so lookups are a single indexed query, expiry is a
+single ``DELETE`` and the cache can be held to a maximum size by
+evicting the least recently used entries.
+
+`FileStore` is the original layout: one file per query in
+``searches/<uid>/<xx>/<yy>/<md5>.<serializer>`` in the cache
+directory.
+
+Both backends store suggestions in the compact format of
+`searchio.results.ResultsSerializer` by default.
+
+Both backends can also find the longest cached prefix of a query
+(see `Store.prefix()`), so suggestions for "pyth" can stand in
+for "python" while the real ones are fetched.
+
+`Leases` coordinates the processes fetching suggestions: a newer
+query for a search supersedes older ones, which give up before
+hitting the network, and processes fetching the same query wait
+for the first one instead of sending the same request again.
+
+The backend is chosen with the ``SEARCHIO_CACHE`` workflow
+variable (``sqlite`` or ``files``). When the SQLite database is
+opened, any file cache left by an earlier version is migrated
+into it (see `migrate()`).
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import bisect
+from collections import namedtuple
+from contextlib import contextmanager
+import fcntl
+import hashlib
+import json
+from io import BytesIO
+import os
+import shutil
+import sqlite3
+import threading
+from time import time
+
+from searchio.results import SERIALIZER, ResultsSerializer
+from searchio import util
+
+log = util.logger(__name__)
+
+# Default backend
+BACKEND = 'sqlite'
+# Default max. size of SQLite cache in megabytes
+MAX_SIZE = 20
+# Fraction of max. size SQLite cache is shrunk to when it's full
+EVICT_TO = 0.9
+# Don't update an entry's access time more often than this (seconds)
+ACCESS_INTERVAL = 60
+# Serializers of file caches written by earlier versions
+LEGACY_SERIALIZERS = ('pickle',)
+# Don't refresh a query in the background for this many seconds
+# after fetching it failed
+RETRY_AFTER = 60
+
+# A cached value and when it was created
+Entry = namedtuple('Entry', 'data created')
+
+# Open stores keyed by path, so a long-running process
+# reuses its database connection.
+_stores = {}
+
+
+def serializer(name):
+    """Return serializer called ``name``.
+
+    `SERIALIZER` is returned directly, although `searchio.metadata`
+    also registers it with `workflow.manager`, so the cache doesn't
+    import all of `workflow` just to look it up. Anything else is
+    looked up in `workflow.manager`.
+
+    Args:
+        name (str): Name of serializer.
+
+    Returns:
+        object: Serializer with ``dump()`` and ``load()`` methods.
+
+    """
+    if name == SERIALIZER:
+        return ResultsSerializer
+
+    from workflow.workflow import manager
+    return manager.serializer(name)
+
+
+def qhash(query):
+    """Return cache key for ``query``.
+
+    Args:
+        query (unicode): Search query.
+
+    Returns:
+        str: MD5 hex digest of UTF-8 encoded query.
+
+    """
+    return hashlib.md5(query.encode('utf-8')).hexdigest()
+
+
+class Store(object):
+    """Base class for suggestion caches.
+
+    Attributes:
+        serializer (str): Name of serializer values are stored
+            with (see `serializer()`).
+
+    """
+
+    def __init__(self, serializer=SERIALIZER):
+        """Create new `Store`."""
+        self.serializer = serializer
+
+    def _dumps(self, data):
+        fp = BytesIO()
+        serializer(self.serializer).dump(data, fp)
+        return fp.getvalue()
+
+    def _loads(self, blob):
+        return serializer(self.serializer).load(BytesIO(blob))
+
+    def get(self, uid, query):
+        """Return cached `Entry` for ``query`` or ``None``.
+
+        Args:
+            uid (str): Search UID.
+            query (unicode): Search query.
+
+        Returns:
+            Entry: Cached data and its creation time.
+
+        """
+        raise NotImplementedError
+
+    def set(self, uid, query, data):
+        """Cache ``data`` for ``query``.
+
+        Args:
+            uid (str): Search UID.
+            query (unicode): Search query.
+            data (object): Data to cache.
+
+        """
+        raise NotImplementedError
+
+    def prefix(self, uid, query):
+        """Return entry for the longest cached prefix of ``query``.
+
+        Only proper prefixes are considered, i.e. not ``query`` itself.
+
+        Args:
+            uid (str): Search UID.
+            query (unicode): Search query.
+
+        Returns:
+            tuple: ``(prefix, Entry)`` or ``None`` if no prefix
+                of ``query`` is cached.
+
+        """
+        for i in range(len(query) - 1, 0, -1):
+            entry = self.get(uid, query[:i])
+            if entry:
+                return query[:i], entry
+
+        return None
+
+    def expire(self, max_age):
+        """Delete entries older than ``max_age`` seconds.
+
+        Args:
+            max_age (int): Max. age of entries in seconds.
+
+        Returns:
+            int: Number of entries deleted.
+
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """Delete all entries."""
+        raise NotImplementedError
+
+
+class FileStore(Store):
+    """Cache entries in individual files.
+
+    As filenames are hashes, each search also has an index file
+    (``<uid>/queries.json``) containing a sorted list of the queries
+    that have been cached, which `prefix()` searches. Processes
+    change the index while holding a lock on the ``<uid>``
+    directory, and `expire()` removes queries whose entries have
+    been deleted.
+
+    Attributes:
+        dirpath (str): Root directory of cache.
+
+    """
+
+    def __init__(self, dirpath, serializer=SERIALIZER):
+        """Create new `FileStore` rooted at ``dirpath``."""
+        super(FileStore, self).__init__(serializer)
+        self.dirpath = dirpath
+        self._queries = {}  # uid -> sorted list of queries
+
+    def _index(self, uid):
+        """Return sorted list of queries cached for ``uid``."""
+        if uid not in self._queries:
+            p = os.path.join(self.dirpath, uid, 'queries.json')
+            try:
+                with open(p) as fp:
+                    self._queries[uid] = sorted(json.load(fp))
+            except (IOError, OSError, ValueError):
+                self._queries[uid] = []
+
+        return self._queries[uid]
+
+    def _update_index(self, uid, update):
+        """Change index of ``uid`` with lock held.
+
+        The index is re-read while locked, so queries added by
+        other processes aren't lost.
+
+        Args:
+            uid (str): Search UID.
+            update (callable): Called with the sorted list of
+                queries. Returns `True` if it changed the list.
+
+        Returns:
+            list: Updated queries.
+
+        """
+        from workflow.util import atomic_writer
+
+        root = os.path.join(self.dirpath, uid)
+        fd = os.open(root, os.O_RDONLY)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            self._queries.pop(uid, None)
+            queries = self._index(uid)
+            if update(queries):
+                p = os.path.join(root, 'queries.json')
+                if queries:
+                    with atomic_writer(p, 'w') as fp:
+                        json.dump(queries, fp)
+                elif os.path.exists(p):
+                    os.unlink(p)
+        finally:
+            os.close(fd)  # releases lock
+
+        return queries
+
+    def _path(self, uid, query):
+        h = qhash(query)
+        return os.path.join(self.dirpath, uid, h[:2], h[2:4],
+                            '{}.{}'.format(h, self.serializer))
+
+    def get(self, uid, query):
+        """Return cached `Entry` for ``query`` or ``None``."""
+        try:
+            with open(self._path(uid, query), 'rb') as fp:
+                created = os.fstat(fp.fileno()).st_mtime
+                return Entry(self._loads(fp.read()), created)
+        except (IOError, OSError):
+            return None
+
+    def set(self, uid, query, data):
+        """Cache ``data`` for ``query``."""
+        from workflow.util import atomic_writer
+
+        p = self._path(uid, query)
+        try:
+            os.makedirs(os.path.dirname(p))
+        except OSError as err:
+            if err.errno != 17:  # ignore file exists
+                raise err
+
+        with atomic_writer(p, 'wb') as fp:
+            fp.write(self._dumps(data))
+
+        def add(queries):
+            i = bisect.bisect_left(queries, query)
+            if i == len(queries) or queries[i] != query:
+                queries.insert(i, query)
+                return True
+            return False
+
+        self._update_index(uid, add)
+
+    def prefix(self, uid, query):
+        """Return entry for the longest cached prefix of ``query``."""
+        queries = self._index(uid)
+        # Prefixes of query sort before it, so only entries to the
+        # left of its insertion point need checking.
+        i = bisect.bisect_left(queries, query)
+        while i > 0:
+            i -= 1
+            q = queries[i]
+            if q[:1] != query[:1]:
+                break
+            if query.startswith(q):
+                entry = self.get(uid, q)
+                if entry:  # index may list expired entries
+                    return q, entry
+
+        return None
+
+    def __iter__(self):
+        """Yield ``(uid, qhash, path)`` for all cache files."""
+        if not os.path.exists(self.dirpath):
+            return
+
+        for uid in os.listdir(self.dirpath):
+            root = os.path.join(self.dirpath, uid)
+            if not os.path.isdir(root):
+                continue
+
+            for dirpath, _, filenames in os.walk(root):
+                for fn in filenames:
+                    h, x = os.path.splitext(fn)
+                    if x == '.' + self.serializer:
+                        yield uid, h, os.path.join(dirpath, fn)
+
+    def expire(self, max_age):
+        """Delete entries older than ``max_age`` seconds."""
+        if not os.path.exists(self.dirpath):
+            return 0
+
+        def _emptydir(p):
+            for fn in os.listdir(p):
+                if fn in ('.DS_Store', 'Icon\r'):
+                    continue
+                return False
+
+            return True
+
+        i = 0
+        now = time()
+        for root, dirnames, filenames in os.walk(self.dirpath, topdown=False):
+            for fn in filenames:
+                if fn == 'queries.json':  # pruned below
+                    continue
+                p = os.path.join(root, fn)
+                if now - os.path.getmtime(p) > max_age:
+                    log.debug('[cache/expired] %r', p)
+                    os.unlink(p)
+                    i += 1
+
+            for dn in dirnames:
+                p = os.path.join(root, dn)
+                if _emptydir(p):
+                    log.debug('[cache/empty] %r', p)
+                    shutil.rmtree(p)
+
+        def prune(uid):
+            def _prune(queries):
+                n = len(queries)
+                queries[:] = [q for q in queries
+                              if os.path.exists(self._path(uid, q))]
+                return len(queries) != n
+            return _prune
+
+        for uid in os.listdir(self.dirpath):
+            root = os.path.join(self.dirpath, uid)
+            if os.path.isdir(root):
+                self._update_index(uid, prune(uid))
+                if _emptydir(root):
+                    log.debug('[cache/empty] %r', root)
+                    shutil.rmtree(root)
+
+        return i
+
+    def clear(self):
+        """Delete all entries."""
+        self._queries = {}
+        if os.path.exists(self.dirpath):
+            shutil.rmtree(self.dirpath)
+
+
+class SQLiteStore(Store):
+    """Cache entries in an SQLite database.
+
+    The total size of cached data is kept up to date by triggers
+    in the ``total`` table, so checking it costs nothing, whichever
+    process changed the database.
+
+    Attributes:
+        max_size (int): Max. total size of cached data in bytes.
+            When exceeded, least recently used entries are evicted
+            till the cache is down to `EVICT_TO` of ``max_size``.
+        path (str): Path to database.
+
+    """
+
+    schema = """
+    CREATE TABLE IF NOT EXISTS entries (
+        uid TEXT NOT NULL,
+        qhash TEXT NOT NULL,
+        query TEXT,
+        data BLOB NOT NULL,
+        size INTEGER NOT NULL,
+        created REAL NOT NULL,
+        accessed REAL NOT NULL,
+        UNIQUE (uid, qhash)
+    );
+    CREATE INDEX IF NOT EXISTS entries_created ON entries (created);
+    CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+    CREATE INDEX IF NOT EXISTS entries_query ON entries (uid, query);
+    CREATE TABLE IF NOT EXISTS total (
+        id INTEGER PRIMARY KEY CHECK (id = 0),
+        size INTEGER NOT NULL
+    );
+    CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries
+    BEGIN
+        UPDATE total SET size = size + new.size;
+    END;
+    CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size
+    ON entries
+    BEGIN
+        UPDATE total SET size = size - old.size + new.size;
+    END;
+    CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries
+    BEGIN
+        UPDATE total SET size = size - old.size;
+    END;
+    """
+
+    def __init__(self, path, max_size=MAX_SIZE * 1024 * 1024,
+                 serializer=SERIALIZER):
+        """Open (and if necessary create) database at ``path``."""
+        super(SQLiteStore, self).__init__(serializer)
+        self.path = path
+        self.max_size = max_size
+        # Connection is shared by the threads of a long-running process
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5,
+                                     isolation_level=None,
+                                     check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(self.schema)
+        if self._conn.execute('SELECT 1 FROM total').fetchone() is None:
+            # new database or one created before `total` existed
+            self._conn.execute(
+                'INSERT OR IGNORE INTO total (id, size) '
+                'SELECT 0, COALESCE(SUM(size), 0) FROM entries')
+
+    def get(self, uid, query):
+        """Return cached `Entry` for ``query`` or ``None``."""
+        h = qhash(query)
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT data, created, accessed FROM entries '
+                'WHERE uid = ? AND qhash = ?', (uid, h)).fetchone()
+            if row is None:
+                return None
+
+            # Eviction doesn't need exact LRU order, and a hit
+            # shouldn't be a write on every keystroke
+            now = time()
+            if now - row[2] > ACCESS_INTERVAL:
+                self._conn.execute(
+                    'UPDATE entries SET accessed = ? '
+                    'WHERE uid = ? AND qhash = ?', (now, uid, h))
+
+        return Entry(self._loads(row[0]), row[1])
+
+    def set(self, uid, query, data):
+        """Cache ``data`` for ``query``."""
+        self.put(uid, qhash(query), query, self._dumps(data), time())
+
+    def put(self, uid, h, query, blob, created):
+        """Store already-serialised data.
+
+        Data already cached for the query is only replaced if it's
+        older than ``created``.
+
+        Args:
+            uid (str): Search UID.
+            h (str): Hash of query (see `qhash()`).
+            query (unicode): Search query or ``None`` if unknown.
+            blob (bytes): Serialised data.
+            created (float): Timestamp of data.
+
+        """
+        # Not INSERT OR REPLACE: the rows it replaces don't fire
+        # `entries_delete`, so `total` would be wrong.
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO entries '
+                '(uid, qhash, query, data, size, created, accessed) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (uid, qhash) DO UPDATE SET '
+                'query = excluded.query, data = excluded.data, '
+                'size = excluded.size, created = excluded.created, '
+                'accessed = excluded.accessed '
+                'WHERE excluded.created >= entries.created',
+                (uid, h, query, sqlite3.Binary(blob), len(blob), created,
+                 time()))
+            self._evict()
+
+    def prefix(self, uid, query):
+        """Return entry for the longest cached prefix of ``query``."""
+        prefixes = [query[:i] for i in range(1, len(query))]
+        if not prefixes:
+            return None
+
+        sql = ('SELECT query, data, created FROM entries '
+               'WHERE uid = ? AND query IN ({}) '
+               'ORDER BY length(query) DESC LIMIT 1').format(
+                   ', '.join('?' * len(prefixes)))
+        with self._lock:
+            row = self._conn.execute(sql, [uid] + prefixes).fetchone()
+
+        if row is None:
+            return None
+
+        return row[0], Entry(self._loads(row[1]), row[2])
+
+    def _evict(self):
+        """Delete least recently used entries above `max_size`."""
+        if not self.max_size:
+            return
+
+        total = self._conn.execute('SELECT size FROM total').fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        # Shrink below `max_size`, so the next insert doesn't evict again
+        c = self._conn.execute(
+            'DELETE FROM entries WHERE rowid IN ('
+            ' SELECT rowid FROM ('
+            '  SELECT rowid, SUM(size) OVER (ORDER BY accessed DESC) AS total'
+            '  FROM entries)'
+            ' WHERE total > ?)', (int(self.max_size * EVICT_TO),))
+        log.debug('[cache] evicted %d entries', c.rowcount)
+
+    def expire(self, max_age):
+        """Delete entries older than ``max_age`` seconds."""
+        with self._lock:
+            c = self._conn.execute('DELETE FROM entries WHERE created < ?',
+                                   (time() - max_age,))
+        return c.rowcount
+
+    def clear(self):
+        """Delete all entries."""
+        with self._lock:
+            self._conn.execute('DELETE FROM entries')
+
+    def close(self):
+        """Close database connection."""
+        self._conn.close()
+
+
+class Leases(object):
+    """Coordinate fetches between concurrent processes.
+
+    Alfred may run several ``searchio search`` processes at once as
+    the user types. Each one calls `claim()` with its query, which
+    supersedes any older query for the same search. Before fetching,
+    processes use `fetching()` to hold a lock on their query, so
+    that only one of them at a time hits the network for it.
+
+    Failed fetches are recorded with `failed()`, so callers can
+    check `backoff()` before refreshing a query in the background
+    again.
+
+    Attributes:
+        dirpath (str): Directory lease and lock files are kept in.
+
+    """
+
+    def __init__(self, dirpath):
+        """Create new `Leases` with files in ``dirpath``."""
+        self.dirpath = dirpath
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+    def _path(self, name):
+        return os.path.join(self.dirpath, name)
+
+    def claim(self, uid, query):
+        """Make ``query`` the current query for search ``uid``.
+
+        Args:
+            uid (str): Search UID.
+            query (unicode): Search query.
+
+        """
+        p = self._path(uid + '.latest')
+        tmp = '{}.{}.tmp'.format(p, os.getpid())
+        with open(tmp, 'wb') as fp:
+            fp.write(query.encode('utf-8'))
+        os.rename(tmp, p)
+
+    def superseded(self, uid, query):
+        """Return `True` if a newer query has been claimed.
+
+        Args:
+            uid (str): Search UID.
+            query (unicode): Search query.
+
+        Returns:
+            bool: `True` if current query for ``uid`` isn't ``query``.
+
+        """
+        try:
+            with open(self._path(uid + '.latest'), 'rb') as fp:
+                return fp.read().decode('utf-8') != query
+        except (IOError, OSError):  # nothing claimed
+            return False
+
+    @contextmanager
+    def fetching(self, uid, query):
+        """Hold the fetch lock for ``query``.
+
+        Blocks while another process holds it.
+
+        Args:
+            uid (str): Search UID.
+            query (unicode): Search query.
+
+        Yields:
+            bool: `True` if another process held the lock, i.e. it
+                has probably just fetched (and cached) ``query``.
+
+        """
+        p = self._path('{}-{}.lock'.format(uid, qhash(query)))
+        with open(p, 'a') as fp:
+            try:
+                fcntl.flock(fp, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                waited = False
+            except (IOError, OSError):
+                fcntl.flock(fp, fcntl.LOCK_EX)
+                waited = True
+
+            try:
+                yield waited
+            finally:
+                # Remove file while still locked, so it doesn't pile
+                # up. Waiting processes hold the unlinked file, so a
+                # newcomer may fetch alongside them, but no more.
+                if not waited:
+                    try:
+                        os.unlink(p)
+                    except OSError:
+                        pass
+                fcntl.flock(fp, fcntl.LOCK_UN)
+
+    def failed(self, uid, query):
+        """Record that fetching ``query`` failed.
+
+        Args:
+            uid (str): Search UID.
+            query (unicode): Search query.
+
+        """
+        p = self._path('{}-{}.failed'.format(uid, qhash(query)))
+        with open(p, 'a'):
+            os.utime(p, None)
+
+    def succeeded(self, uid, query):
+        """Forget any failure of ``query`` recorded by `failed()`.
+
+        Args:
+            uid (str): Search UID.
+            query (unicode): Search query.
+
+        """
+        try:
+            os.unlink(self._path('{}-{}.failed'.format(uid, qhash(query))))
+        except OSError:
+            pass
+
+    def backoff(self, uid, query, retry_after=RETRY_AFTER):
+        """Return `True` if fetching ``query`` failed recently.
+
+        Args:
+            uid (str): Search UID.
+            query (unicode): Search query.
+            retry_after (float, optional): Seconds a failure counts.
+
+        Returns:
+            bool: `True` if `failed()` was called for ``query`` less
+                than ``retry_after`` seconds ago.
+
+        """
+        p = self._path('{}-{}.failed'.format(uid, qhash(query)))
+        try:
+            return time() - os.stat(p).st_mtime < retry_after
+        except OSError:
+            return False
+
+    def count(self, name):
+        """Increment counter ``name``.
+
+        Args:
+            name (str): ``coalesced`` or ``cancelled``.
+
+        """
+        fd = os.open(self._path('counters.json'), os.O_RDWR | os.O_CREAT)
+        with os.fdopen(fd, 'r+') as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            try:
+                counters = json.load(fp)
+            except ValueError:  # new file
+                counters = {}
+
+            counters[name] = counters.get(name, 0) + 1
+            fp.seek(0)
+            fp.truncate()
+            json.dump(counters, fp)
+
+    def counters(self):
+        """Return counters.
+
+        Returns:
+            dict: Number of requests ``coalesced`` (answered by
+                another process's fetch) and ``cancelled`` (given up
+                because a newer query superseded them).
+
+        """
+        counters = dict(coalesced=0, cancelled=0)
+        try:
+            with open(self._path('counters.json')) as fp:
+                counters.update(json.load(fp))
+        except (IOError, OSError, ValueError):
+            pass
+
+        return counters
+
+    def expire(self, max_age):
+        """Delete lease files unused for ``max_age`` seconds.
+
+        Lock files a process is holding are kept.
+
+        Args:
+            max_age (float): Max. age of files in seconds.
+
+        Returns:
+            int: Number of files deleted.
+
+        """
+        i = 0
+        cutoff = time() - max_age
+        for name in os.listdir(self.dirpath):
+            if name == 'counters.json':
+                continue
+
+            p = self._path(name)
+            try:
+                if os.path.getmtime(p) > cutoff:
+                    continue
+
+                if name.endswith('.lock'):
+                    with open(p, 'a') as fp:
+                        try:
+                            fcntl.flock(fp, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        except (IOError, OSError):  # being fetched
+                            continue
+                        os.unlink(p)
+                else:
+                    os.unlink(p)
+            except OSError:  # deleted by another process
+                continue
+
+            i += 1
+
+        return i
+
+
+def migrate(dirpath, dest):
+    """Copy entries from a file cache into an `SQLiteStore`.
+
+    Both current entries and those of `LEGACY_SERIALIZERS` are
+    copied. Legacy entries are converted to the format of ``dest``.
+    Queries aren't recorded by `FileStore`, so migrated entries
+    only have the query hash.
+
+    Each file is deleted once it has been copied, or if it can't
+    be read, so a migration that is interrupted carries on where
+    it left off next time.
+
+    Args:
+        dirpath (str): Root directory of file cache.
+        dest (SQLiteStore): Store to copy to.
+
+    Returns:
+        tuple: Number of entries migrated and number that
+            couldn't be read (and were deleted).
+
+    """
+    i = failed = 0
+    for name in (dest.serializer,) + LEGACY_SERIALIZERS:
+        src = FileStore(dirpath, serializer=name)
+        for uid, h, p in src:
+            try:
+                with open(p, 'rb') as fp:
+                    blob = fp.read()
+                created = os.path.getmtime(p)
+            except (IOError, OSError):  # deleted by another process
+                continue
+
+            if name != dest.serializer:
+                try:
+                    blob = dest._dumps(src._loads(blob))
+                except Exception as err:
+                    log.warning('[cache] could not migrate %r: %s', p, err)
+                    os.unlink(p)
+                    failed += 1
+                    continue
+
+            dest.put(uid, h, None, blob, created)
+            os.unlink(p)
+            i += 1
+
+    log.info('[cache] migrated %d entries to %s', i, dest.path)
+    return i, failed
+
+
+def open_store(wf):
+    """Return the configured cache store for Workflow.
+
+    Args:
+        wf (workflow.Workflow): Active workflow object.
+
+    Returns:
+        Store: `SQLiteStore` or `FileStore`, depending on the
+            ``SEARCHIO_CACHE`` workflow variable.
+
+    """
+    backend = (os.getenv('SEARCHIO_CACHE') or BACKEND).lower()
+    dirpath = wf.cachefile('searches')
+
+    if backend == 'files':
+        path = dirpath
+    elif backend == 'sqlite':
+        path = wf.cachefile('searches.db')
+    else:
+        raise ValueError('Unknown cache backend: {!r}'.format(backend))
+
+    store = _stores.get(path)
+    if store is not None:
+        return store
+
+    if backend == 'files':
+        store = FileStore(dirpath)
+
+    else:
+        size = int(os.getenv('SEARCHIO_CACHE_SIZE') or MAX_SIZE)
+        store = SQLiteStore(path, size * 1024 * 1024)
+        if os.path.exists(dirpath):
+            try:
+                migrate(dirpath, store)
+            except (IOError, OSError, sqlite3.Error) as err:
+                # the rest is migrated next time
+                log.error('[cache] migration failed: %s', err)
+            else:
+                shutil.rmtree(dirpath, ignore_errors=True)
+
+    _stores[path] = store
+    return store
@@ -0,0 +1,378 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Compiled catalog of engines.
+
+`engines.load()` parses every engine's JSON file, variants and
+all, which is most of the work of ``searchio list``, although that
+only shows each engine's title and number of variants.
+
+A `Catalog` compiles the engine files into a single file in the
+cache directory, in two parts: a header listing every engine's
+settings and number of variants, followed by the variants of each
+engine, marshalled separately. Listing engines only reads the
+header, and an engine's variants are only read (from their offset
+in the file) when they're accessed. The engines keep the catalog
+open, so their variants are read from the catalog they were
+loaded from, even if it has since been rebuilt.
+
+Alongside the catalog, an n-gram index of every variant's UID,
+title and name is saved, so variants can be found across all
+engines without loading them all (see `Catalog.find_variants()`).
+
+The catalog and index are rebuilt when an engine file is added,
+removed or modified.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+from array import array
+import json
+import marshal
+import os
+import struct
+
+from searchio.engines import Engine
+from searchio import util
+
+log = util.logger(__name__)
+
+# Bump when the layout changes
+VERSION = 1
+
+# Length of header
+_prefix = struct.Struct('<I')
+
+# Max. length of n-grams in variant index. Query words longer than
+# this are looked up by all their n-grams of this length.
+NGRAM = 3
+
+
+def ngrams(word):
+    """Return n-grams to look up ``word`` by.
+
+    Args:
+        word (unicode): Lowercase word.
+
+    Returns:
+        set: ``word`` itself if it's no longer than `NGRAM`,
+            otherwise its n-grams of length `NGRAM`.
+
+    """
+    if len(word) <= NGRAM:
+        return set([word])
+
+    return set([word[i:i + NGRAM] for i in range(len(word) - NGRAM + 1)])
+
+
+def index_text(text):
+    """Normalise ``text`` for the variant index."""
+    from searchio.fuzzy import fold
+    return fold(text).lower()
+
+
+class _Handle(object):
+    """Read-only file descriptor, closed when no longer referenced.
+
+    Attributes:
+        fd (int): File descriptor.
+
+    """
+
+    def __init__(self, path):
+        """Open ``path``."""
+        self.fd = os.open(path, os.O_RDONLY)
+
+    def read(self, size, offset):
+        """Read ``size`` bytes at ``offset``."""
+        return os.pread(self.fd, size, offset)
+
+    def close(self):
+        """Close file descriptor."""
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+    def __del__(self):
+        self.close()
+
+
+class LazyVariants(object):
+    """Variant dicts of an engine, loaded from catalog when needed.
+
+    Attributes:
+        count (int): Number of variants.
+
+    """
+
+    def __init__(self, handle, offset, size, count):
+        """Create new `LazyVariants` at ``offset`` in open catalog."""
+        self.count = count
+        self._handle = handle
+        self._offset = offset
+        self._size = size
+        self._variants = None
+
+    def _load(self):
+        if self._variants is None:
+            data = self._handle.read(self._size, self._offset)
+            self._variants = marshal.loads(data)
+            self._handle = None
+
+        return self._variants
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self._load())
+
+
+class Catalog(object):
+    """Engines compiled from JSON files.
+
+    Attributes:
+        dirpaths (list): Directories engine files are loaded from.
+        index_path (str): Path to variant index.
+        path (str): Path to compiled catalog.
+
+    """
+
+    def __init__(self, path, dirpaths):
+        """Create new `Catalog` of engines in ``dirpaths``."""
+        self.path = path
+        self.index_path = os.path.splitext(path)[0] + '.index'
+        self.dirpaths = dirpaths
+
+    def _stamp(self):
+        """Return paths, sizes and mtimes of engine files."""
+        return [(p, st.st_size, st.st_mtime) for p, st in
+                [(p, os.stat(p)) for p in
+                 util.FileFinder(self.dirpaths, ['json'])]]
+
+    def _read(self):
+        """Return header, offset of variants and open catalog or ``None``.
+
+        The catalog is left open for reading the variants.
+        """
+        try:
+            handle = _Handle(self.path)
+        except (IOError, OSError):
+            return None
+
+        try:
+            n = _prefix.unpack(handle.read(_prefix.size, 0))[0]
+            header = marshal.loads(handle.read(n, _prefix.size))
+        except (IOError, OSError, EOFError, ValueError, TypeError,
+                struct.error):
+            header = None
+
+        if not isinstance(header, dict) or header.get('version') != VERSION:
+            handle.close()
+            return None
+
+        return header, _prefix.size + n, handle
+
+    def build(self):
+        """Compile engine files into catalog.
+
+        Returns:
+            tuple: Catalog header and offset of variants in file.
+
+        """
+        from workflow.util import atomic_writer
+
+        stamp = self._stamp()
+        engines = []
+        bodies = []
+        offset = 0
+        docs = []  # (engine UID, variant no., text) for index
+        for p, _, _ in stamp:
+            with open(p) as fp:
+                d = json.load(fp)
+
+            # Validate settings the same way as `engines.load()`
+            d['uid'] = util.path2uid(p)
+            Engine.from_dict(d)
+
+            variants = d.pop('variants')
+            for i, v in enumerate(variants):
+                text = u'{}-{} {} {}'.format(d['uid'], v.get('uid', ''),
+                                             v.get('title', ''),
+                                             v.get('name', ''))
+                docs.append((d['uid'], i, index_text(text)))
+
+            body = marshal.dumps(variants)
+            d.update(offset=offset, size=len(body), count=len(variants))
+            engines.append(d)
+            bodies.append(body)
+            offset += len(body)
+
+        header = dict(version=VERSION, stamp=stamp, engines=engines)
+        data = marshal.dumps(header)
+        with atomic_writer(self.path, 'wb') as fp:
+            fp.write(_prefix.pack(len(data)))
+            fp.write(data)
+            for body in bodies:
+                fp.write(body)
+
+        log.debug('[catalog] compiled %d engine(s) to %s',
+                  len(engines), self.path)
+        self._build_index(stamp, docs)
+        return header, _prefix.size + len(data)
+
+    def _build_index(self, stamp, docs):
+        """Save n-gram index of variants.
+
+        Args:
+            stamp (list): Engine files the index was built from.
+            docs (list): ``(engine UID, variant no., text)`` for
+                every variant.
+
+        """
+        from workflow.util import atomic_writer
+
+        postings = {}
+        for i, (_, _, text) in enumerate(docs):
+            for token in set(text.split()):
+                for n in range(1, NGRAM + 1):
+                    for j in range(len(token) - n + 1):
+                        postings.setdefault(token[j:j + n], set()).add(i)
+
+        grams = {}
+        for gram, ids in postings.items():
+            grams[gram] = array('I', sorted(ids)).tobytes()
+
+        data = marshal.dumps(dict(version=VERSION, stamp=stamp,
+                                  docs=docs, grams=grams))
+        with atomic_writer(self.index_path, 'wb') as fp:
+            fp.write(data)
+
+        log.debug('[catalog] indexed %d variant(s) with %d n-grams',
+                  len(docs), len(grams))
+
+    def engines(self, stamp=None):
+        """Return all engines sorted by title.
+
+        Variants aren't loaded until they're accessed.
+
+        Args:
+            stamp (list, optional): Current engine files (see
+                `_stamp()`), if the caller already has them.
+
+        Returns:
+            list: `searchio.engines.Engine` objects.
+
+        """
+        if stamp is None:
+            stamp = self._stamp()
+
+        hit = self._read()
+        if hit and hit[0]['stamp'] != stamp:
+            hit[2].close()
+            hit = None
+
+        if not hit:
+            self.build()
+            hit = self._read()
+            if not hit:
+                raise IOError('could not read catalog: %s' % self.path)
+
+        header, start, handle = hit
+
+        engines = []
+        for d in header['engines']:
+            d = dict(d)
+            d['variants'] = LazyVariants(handle, start + d.pop('offset'),
+                                         d.pop('size'), d.pop('count'))
+            engines.append(Engine.from_dict(d))
+
+        engines.sort(key=lambda e: e.title)
+        return engines
+
+    def find_variants(self, query, max_results=0):
+        """Find variants of all engines matching ``query``.
+
+        Every word of ``query`` must be part of a variant's UID,
+        title or name. Matches are ordered like `fuzzy.filter()`.
+
+        Args:
+            query (unicode): Search query.
+            max_results (int, optional): Max. number of results.
+
+        Returns:
+            list: ``(engine, variant)`` tuples.
+
+        """
+        from searchio.fuzzy import FilterIndex
+
+        index = None
+        try:
+            with open(self.index_path, 'rb') as fp:
+                index = marshal.loads(fp.read())
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            pass
+
+        stamp = self._stamp()
+        if (not isinstance(index, dict) or index.get('version') != VERSION or
+                index.get('stamp') != stamp):
+            self.build()
+            with open(self.index_path, 'rb') as fp:
+                index = marshal.loads(fp.read())
+
+        words = index_text(query).split()
+        if not words:
+            return []
+
+        # Variants containing all n-grams of all words
+        ids = None
+        for gram in set().union(*[ngrams(w) for w in words]):
+            data = index['grams'].get(gram)
+            if data is None:
+                return []
+
+            if ids is None:
+                ids = set(array('I', data))
+            else:
+                ids.intersection_update(array('I', data))
+
+        docs = index['docs']
+        ids = [i for i in sorted(ids)
+               if all([w in docs[i][2] for w in words])]
+
+        ranked = FilterIndex([docs[i][2] for i in ids]).search(
+            u' '.join(words), max_results=max_results)
+
+        engines = dict([(e.uid, e) for e in self.engines(stamp)])
+        results = []
+        for j, _, _ in ranked:
+            uid, n, _ = docs[ids[j]]
+            e = engines[uid]
+            results.append((e, e.variants[n]))
+
+        return results
+
+    def engine(self, uid):
+        """Return engine with UID ``uid``.
+
+        Args:
+            uid (str): Engine UID.
+
+        Returns:
+            searchio.engines.Engine: Engine or ``None`` if there is
+                no such engine.
+
+        """
+        for e in self.engines():
+            if e.uid == uid:
+                return e
+
+        return None
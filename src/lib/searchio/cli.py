@@ -25,11 +25,14 @@ Commands:
     add          Add a new search to the workflow
     clean        Delete stale cache files
     config       Display (filtered) settings
+    daemon       Manage the background search server
     delete       Delete a search engine
     help         Show help for a command
     list         Display (filtered) list of engines
+    multi        Perform a search with several engines at once
     reload       Update info.plist
     search       Perform a search
+    stats        Display latency and cache statistics
     variants     Display (filtered) list of engine variants
     web          Import a new search from a URL
 """
@@ -39,6 +42,7 @@ from __future__ import absolute_import, print_function
 import os
 import sys
 
+from searchio import trace
 from searchio import util
 
 log = util.logger(__name__)
@@ -58,13 +62,18 @@ def cli(wf):
     """
     from docopt import docopt
 
-    vstr = "{} v{}".format(wf.name, wf.version)
-    wf.args
-    args = docopt(usage(wf), version=vstr, options_first=True)
+    with trace.span("docopt"):
+        # name and version may have to be read from info.plist,
+        # so only look them up if they'll be shown
+        vstr = None
+        if "--version" in wf.args:
+            vstr = "{} v{}".format(wf.name, wf.version)
+        args = docopt(usage(wf), version=vstr, options_first=True)
     log.debug("args=%r", args)
 
     cmd = args.get("<command>")
     argv = [cmd] + args.get("<args>")
+    trace.annotate(argv=argv)
 
     # ---------------------------------------------------------
     # Initialise
@@ -94,6 +103,11 @@ def cli(wf):
 
         return run(wf, argv)
 
+    elif cmd == "daemon":
+        from searchio.cmd.daemon import run
+
+        return run(wf, argv)
+
     elif cmd == "delete":
         from searchio.cmd.delete import run
 
@@ -114,13 +128,25 @@ def cli(wf):
 
         return run(wf, argv)
 
+    elif cmd == "multi":
+        with trace.span("imports", module="searchio.cmd.multi"):
+            from searchio.cmd.multi import run
+
+        return run(wf, argv)
+
     elif cmd == "reload":
         from searchio.cmd.reload import run
 
         return run(wf, argv)
 
     elif cmd == "search":
-        from searchio.cmd.search import run
+        with trace.span("imports", module="searchio.cmd.search"):
+            from searchio.cmd.search import run
+
+        return run(wf, argv)
+
+    elif cmd == "stats":
+        from searchio.cmd.stats import run
 
         return run(wf, argv)
 
@@ -149,9 +175,15 @@ def cli(wf):
 
 
 def main():
-    from workflow import Workflow3
+    with trace.span("imports", module="workflow"):
+        from searchio.metadata import Workflow
 
     from searchio import HELP_URL
 
-    wf = Workflow3(help_url=HELP_URL)
-    sys.exit(wf.run(cli))
+    with trace.span("Workflow3"):
+        wf = Workflow(help_url=HELP_URL)
+    try:
+        status = wf.run(cli)
+    finally:
+        trace.save(wf.cachedir)
+    sys.exit(status)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Client for the searchio daemon.
+
+This module is imported on every keystroke by the ``search``
+Script Filter shim, so it deliberately imports nothing but the
+standard library modules it needs to talk to the daemon.
+
+The wire protocol is a single line of JSON from the client
+(``{"argv": [...], "env": {...}}``), answered by a single line
+of JSON (``{"status": <int>}``) followed by the raw output of
+the command.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import json
+import os
+import socket
+import sys
+
+# How long to wait for the daemon to accept a connection
+CONNECT_TIMEOUT = 0.1
+# How long to wait for the daemon to answer a request
+READ_TIMEOUT = 30
+
+# Max. length of a socket path (``sun_path`` is 104 bytes on macOS)
+MAX_SOCKET_PATH = 103
+
+
+def enabled():
+    """Return `True` if the daemon is switched on by the user.
+
+    The daemon is opt-in via the ``SEARCHIO_DAEMON`` workflow
+    variable.
+
+    Returns:
+        bool: Whether the daemon should be auto-started.
+
+    """
+    return (os.getenv('SEARCHIO_DAEMON') or '').lower() in ('1', 'yes', 'on')
+
+
+def socket_path(cachedir=None):
+    """Return path of the daemon's Unix domain socket.
+
+    The socket lives in the workflow's cache directory, so a daemon
+    started in a shell and the Script Filters Alfred runs agree on
+    it. If that path is too long for a socket, the socket is in
+    ``/tmp`` instead, named after a hash of the cache directory.
+
+    Args:
+        cachedir (str, optional): Workflow's cache directory.
+            Defaults to ``alfred_workflow_cache`` from the environment.
+
+    Returns:
+        str: Path to socket or ``None`` if the cache directory is
+            unknown.
+
+    """
+    cachedir = cachedir or os.getenv('alfred_workflow_cache')
+    if not cachedir:
+        return None
+
+    path = os.path.join(cachedir, 'daemon.sock')
+    if len(path.encode('utf-8')) <= MAX_SOCKET_PATH:
+        return path
+
+    import hashlib
+
+    h = hashlib.sha1(cachedir.encode('utf-8')).hexdigest()[:16]
+    return '/tmp/searchio-{}.sock'.format(h)
+
+
+def call(argv, env=None, path=None):
+    """Run a ``searchio`` command in the daemon.
+
+    Args:
+        argv (list): Command and arguments, e.g.
+            ``['search', 'google-en', 'python']``.
+        env (dict, optional): Environment to run command in.
+            Defaults to ``os.environ``.
+        path (str, optional): Path to daemon socket. Defaults to
+            `socket_path()`.
+
+    Returns:
+        tuple: ``(status, output)`` or ``None`` if the daemon
+            isn't running or failed to answer.
+
+    """
+    path = path or socket_path()
+    if not path:
+        return None
+
+    # Don't send the environment to another user's socket
+    # (`socket_path()` may be in /tmp)
+    try:
+        if os.stat(path).st_uid != os.getuid():
+            return None
+    except OSError:  # daemon not running
+        return None
+
+    if env is None:
+        env = dict(os.environ)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(path)
+        sock.settimeout(READ_TIMEOUT)
+        msg = json.dumps(dict(argv=argv, env=env)) + '\n'
+        sock.sendall(msg.encode('utf-8'))
+        fp = sock.makefile('rb')
+        header = json.loads(fp.readline().decode('utf-8'))
+        output = fp.read()
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+    return header.get('status', 0), output
+
+
+def start(program, idle=None):
+    """Start the daemon in a new session.
+
+    Returns immediately. If another daemon wins the race to bind
+    the socket, this one exits.
+
+    Args:
+        program (str): Path to the ``searchio`` program.
+        idle (int, optional): Seconds without a request before the
+            daemon exits. Defaults to ``searchio daemon``'s default.
+
+    """
+    import subprocess
+
+    cmd = [sys.executable, program, 'daemon', 'run']
+    if idle is not None:
+        cmd += ['--idle', str(idle)]
+
+    with open(os.devnull, 'r+b') as null:
+        subprocess.Popen(cmd, stdin=null, stdout=null, stderr=null,
+                         start_new_session=True)
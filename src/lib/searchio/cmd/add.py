@@ -10,14 +10,22 @@
 
 """searchio add [options] <title> <url>
 
-Display help message for command(s).
+Add a new search or, with --batch, all the searches in a manifest.
+
+A JSON manifest is a list of objects, and a TSV manifest has a header
+row, both using the keys of a search's JSON file (title, keyword,
+search_url, suggest_url, icon, jsonpath, pcencode) plus an optional
+uid. All searches are validated before any are saved, and info.plist
+is only updated once.
 
 Usage:
     searchio add [-s <url>] [-i <path>] [-j <jpath>] [-u <uid>] [-p] <keyword> <title> <url>
     searchio add --env
+    searchio add --batch <file>
     searchio add -h
 
 Options:
+    -b, --batch <file>         Add all searches in JSON or TSV manifest
     -e, --env                  Read input from environment variables
     -i, --icon <path>          Path of icon for search
     -j, --json-path <jpath>    JSON path for results
@@ -29,9 +37,9 @@ Options:
 
 from __future__ import print_function, absolute_import
 
+import csv
 import json
 import os
-import plistlib
 
 from docopt import docopt
 from workflow.notify import notify
@@ -39,7 +47,7 @@ from workflow.notify import notify
 from searchio.core import Context
 from searchio import engines
 from searchio import util
-from searchio.cmd.reload import remove_script_filters, add_script_filters, Search, link_icons
+from searchio.cmd.reload import Search, deleted_defaults, update_info_plist
 
 log = util.logger(__name__)
 
@@ -92,11 +100,23 @@ def parse_args(wf, args):
     return d
 
 
-def run(wf, argv):
-    """Run ``searchio add`` sub-command."""
-    args = docopt(usage(wf), argv)
-    ctx = Context(wf)
-    d = parse_args(wf, args)
+def make_search(d):
+    """Create a validated `Search` from a search `dict`.
+
+    Args:
+        d (dict): Search configuration, as from `parse_args()`.
+
+    Returns:
+        searchio.engines.Search: Search object
+
+    Raises:
+        ValueError: Raised if the search is invalid.
+
+    """
+    d = dict(d)
+    for k in ('title', 'keyword', 'search_url'):
+        if not d.get(k):
+            raise ValueError('Required key "{}" missing'.format(k))
 
     # Auto-generate icon path if not provided
     if not d.get('icon'):
@@ -104,35 +124,87 @@ def run(wf, argv):
         engine_name = d.get('title', '').split()[0].lower()
         d['icon'] = f'icons/engines/{engine_name}.png'
         log.info(f"Auto-generated icon path: {d['icon']}")
-    
-    s = engines.Search.from_dict(d)
 
     if not util.valid_url(d['search_url']):
         raise ValueError('Invalid search URL: {!r}'.format(d['search_url']))
 
-    if d['suggest_url'] and not util.valid_url(d['suggest_url']):
+    if d.get('suggest_url') and not util.valid_url(d['suggest_url']):
         raise ValueError('Invalid suggest URL: {!r}'.format(d['suggest_url']))
 
-    p = ctx.search(s.uid)
-
-    with open(p, 'w') as fp:
-        json.dump(s.dict, fp, sort_keys=True, indent=2)
-
-    log.debug('Adding new search to info.plist ...')
-    
-    # Update info.plist to include the new search
-    ip = wf.workflowfile('info.plist')
-    with open(ip, "rb") as file:
-        data = plistlib.load(file)
-    
-    # Get all existing searches (both user and default)
-    existing_searches = []
-    
-    # First, load default searches
+    return engines.Search.from_dict(d)
+
+
+def read_manifest(path):
+    """Read search dicts from a JSON or TSV manifest.
+
+    Missing keys get the same defaults as on the command line.
+
+    Args:
+        path (str): Path to manifest. Files ending in ``.json`` are
+            read as JSON, all others as TSV with a header row.
+
+    Returns:
+        list: Search `dict` objects.
+
+    Raises:
+        ValueError: Raised if the manifest isn't a list of searches.
+
+    """
+    if path.lower().endswith('.json'):
+        with open(path) as fp:
+            rows = json.load(fp)
+        if not isinstance(rows, list):
+            raise ValueError('JSON manifest must be a list of searches')
+    else:
+        with open(path, newline='') as fp:
+            rows = list(csv.DictReader(fp, delimiter='\t'))
+
+    dicts = []
+    errors = []
+    for i, row in enumerate(rows):
+        if not isinstance(row, dict):
+            errors.append('search #{}: not an object: {!r}'.format(i + 1, row))
+            continue
+
+        d = dict(uid=util.uuid(), pcencode=False, suggest_url='',
+                 icon='', jsonpath='[1]')
+        d.update([(k.strip(), v) for k, v in row.items()
+                  if k and v not in (None, '')])
+        if not isinstance(d['pcencode'], bool):
+            d['pcencode'] = str(d['pcencode']).lower() in ('1', 'true', 'yes')
+        for k, v in d.items():
+            if isinstance(v, str):
+                d[k] = v.strip()
+        dicts.append(d)
+
+    if errors:
+        raise ValueError('Invalid manifest {!r}:\n{}'.format(
+                         path, '\n'.join(errors)))
+
+    return dicts
+
+
+def load_searches(wf):
+    """Return existing default and user searches by UID.
+
+    Unreadable user search files are deleted.
+
+    Args:
+        wf (workflow.Workflow3): Current workflow
+
+    Returns:
+        dict: `Search` objects keyed by UID.
+
+    """
+    searches = {}
+
+    # First, load default searches (excluding deleted ones)
     from .reload import DEFAULTS
+    deleted = deleted_defaults(wf)
     for default_data in DEFAULTS:
-        existing_searches.append(Search.from_dict(default_data))
-    
+        if default_data['uid'] not in deleted:
+            searches[default_data['uid']] = Search.from_dict(default_data)
+
     # Then, load user searches (these will override defaults if same UID)
     searches_dir = wf.datadir + '/searches'
     if os.path.exists(searches_dir):
@@ -148,16 +220,14 @@ def run(wf, argv):
                             continue
                         search_data = json.loads(content)
                         search_data['uid'] = search_id
-                        
+
                         # Auto-generate icon path if not provided
                         if not search_data.get('icon'):
                             engine_name = search_data.get('title', '').split()[0].lower()
                             search_data['icon'] = f'icons/engines/{engine_name}.png'
                             log.info(f"Auto-generated icon path for existing search {search_id}: {search_data['icon']}")
-                        
-                        # Remove any existing search with same UID (to allow override)
-                        existing_searches = [s for s in existing_searches if s.uid != search_id]
-                        existing_searches.append(Search.from_dict(search_data))
+
+                        searches[search_id] = Search.from_dict(search_data)
                 except Exception as e:
                     log.warning(f"Failed to load search {search_id}: {e}")
                     # Remove corrupted file
@@ -166,18 +236,99 @@ def run(wf, argv):
                         log.info(f"Removed corrupted search file: {search_id}")
                     except:
                         pass
-    
-    # Add the new search to the list
-    existing_searches.append(s)
-    
-    # Update info.plist with all searches
-    remove_script_filters(wf, data)
-    add_script_filters(wf, data, existing_searches)
-    
-    with open(ip, "wb") as file:
-        plistlib.dump(data, file)
-    
-    # Create symlinks for Script Filter icons
-    link_icons(wf, existing_searches)
-    
-    log.info(f"Successfully added search: {s.title} ({s.uid})")
+
+    return searches
+
+
+def save_searches(wf, searches):
+    """Save ``searches`` to the user's searches directory.
+
+    Every file is written to a temporary file first, and they're
+    only renamed into place once all have been written. If renaming
+    one fails, the files already renamed are rolled back, so either
+    all of ``searches`` are saved or none are.
+
+    Args:
+        wf (workflow.Workflow3): Current workflow
+        searches (list): `Search` objects to save.
+
+    """
+    ctx = Context(wf)
+    suffix = '.{}.tmp'.format(os.getpid())
+    backup = '.{}.bak'.format(os.getpid())
+    written = []
+    renamed = []
+    try:
+        for s in searches:
+            p = ctx.search(s.uid)
+            with open(p + suffix, 'w') as fp:
+                json.dump(s.dict, fp, sort_keys=True, indent=2)
+            written.append(p)
+
+        for p in written:
+            if os.path.exists(p):  # keep search being replaced
+                os.link(p, p + backup)
+            os.rename(p + suffix, p)
+            renamed.append(p)
+
+    except Exception:
+        for p in reversed(renamed):
+            try:
+                if os.path.exists(p + backup):
+                    os.rename(p + backup, p)
+                else:
+                    os.remove(p)
+            except OSError as err:
+                log.error("couldn't roll back %s: %s", p, err)
+        raise
+
+    finally:
+        for p in written:
+            for tmp in (p + suffix, p + backup):
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+
+
+def run(wf, argv):
+    """Run ``searchio add`` sub-command."""
+    args = docopt(usage(wf), argv)
+
+    if args.get('--batch'):
+        searches = []
+        errors = []
+        uids = set()
+        for i, d in enumerate(read_manifest(args['--batch'])):
+            try:
+                s = make_search(d)
+            except (ValueError, KeyError, IndexError) as err:
+                errors.append('search #{} ({}): {}'.format(
+                              i + 1, d.get('title') or d['uid'], err))
+                continue
+
+            if s.uid in uids:
+                errors.append('search #{} ({}): duplicate UID {!r}'.format(
+                              i + 1, s.title, s.uid))
+            uids.add(s.uid)
+            searches.append(s)
+
+        if errors:
+            raise ValueError('Invalid manifest {!r}:\n{}'.format(
+                             args['--batch'], '\n'.join(errors)))
+    else:
+        searches = [make_search(parse_args(wf, args))]
+
+    save_searches(wf, searches)
+
+    log.debug('Adding %d new search(es) to info.plist ...', len(searches))
+
+    # Add the new searches (replacing any with the same UID)
+    existing_searches = load_searches(wf)
+    for s in searches:
+        existing_searches[s.uid] = s
+
+    # Update info.plist's Script Filters and icons to match
+    update_info_plist(wf, sorted(existing_searches.values(),
+                                 key=lambda x: x.title))
+
+    for s in searches:
+        log.info(f"Successfully added search: {s.title} ({s.uid})")
@@ -23,12 +23,10 @@ Options:
 
 from __future__ import print_function, absolute_import
 
-import os
-from time import time
-
 from docopt import docopt
 
 from searchio import MAX_CACHE_AGE
+from searchio.core import Context
 from searchio import util
 
 log = util.logger(__name__)
@@ -41,8 +39,6 @@ def usage(wf=None):
 
 def run(wf, argv):
     """Run ``searchio clean`` sub-command."""
-    from shutil import rmtree
-
     args = docopt(usage(wf), argv)
 
     # Clear old session data
@@ -52,40 +48,8 @@ def run(wf, argv):
     if args.get('--all'):
         return wf.clear_cache()
 
-    # Only clear state searches
-    path = wf.cachefile('searches')
-    if not os.path.exists(path):
-        return
-
-    def _relpath(p):
-        return p.replace(path + '/', '')
-
-    def _emptydir(p):
-        files = os.listdir(p)
-        if not files:
-            return True
-        for fn in files:
-            if fn in ('.DS_Store', r'Icon\r'):
-                continue
-            return False
-
-        return True
-
-    i = 0
-    for root, dirnames, filenames in os.walk(path, topdown=False):
-        for fn in filenames:
-            p = os.path.join(root, fn)
-            age = time() - os.path.getmtime(p)
-            if age > MAX_CACHE_AGE:
-                log.debug('[clean/expired] %r', _relpath(p))
-                os.unlink(p)
-                i += 1
-
-        for dn in dirnames:
-            p = os.path.join(root, dn)
-            if _emptydir(p):
-                log.debug('[clean/empty] %r', _relpath(p))
-                rmtree(p)
-                i += 1
-
+    # Only clear stale searches and leases
+    ctx = Context(wf)
+    i = ctx.cache.expire(MAX_CACHE_AGE)
+    i += ctx.leases.expire(MAX_CACHE_AGE)
     log.info('[clean] %d stale item(s) deleted', i)
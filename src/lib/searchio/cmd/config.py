@@ -29,6 +29,7 @@ from docopt import docopt
 from workflow import ICON_WARNING  # ICON_SETTINGS,
 
 # from searchio.engines import Manager as EngineManager
+from searchio import fuzzy
 from searchio import util
 from searchio.core import Context
 
@@ -135,7 +136,7 @@ def run(wf, argv):
     # Show results
 
     if query:
-        items = wf.filter(query, items, key=itemgetter("title"))
+        items = fuzzy.filter(wf, query, items, key=itemgetter("title"))
 
     if not items:
         wf.add_item("No matching items", "Try a different query?", icon=ICON_WARNING)
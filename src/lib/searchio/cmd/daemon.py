@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""searchio daemon [options] <action>
+
+Manage the background search server.
+
+The daemon answers searches from the ``search`` Script Filter
+program, so Python doesn't have to start up on every keystroke.
+Set the ``SEARCHIO_DAEMON`` workflow variable to ``1`` to have it
+started automatically.
+
+Usage:
+    searchio daemon [-i <secs>] (start|run)
+    searchio daemon (stop|status)
+    searchio daemon -h
+
+Options:
+    -i, --idle <secs>  Exit after this many idle seconds [default: 600]
+    -h, --help         Display this help message
+"""
+
+from __future__ import print_function, absolute_import
+
+import sys
+
+from docopt import docopt
+
+from searchio import client
+from searchio import daemon
+from searchio.core import Context
+from searchio import util
+
+log = util.logger(__name__)
+
+
+def usage(wf=None):
+    """CLI usage instructions."""
+    return __doc__
+
+
+def run(wf, argv):
+    """Run ``searchio daemon`` sub-command."""
+    args = docopt(usage(wf), argv)
+    path = client.socket_path(wf.cachedir)
+    log.debug('args=%r', args)
+
+    if args.get('run'):
+        daemon.serve(path, int(args.get('--idle')))
+
+    elif args.get('start'):
+        if daemon.status(path):
+            log.info('[daemon] already running')
+            return
+
+        client.start(wf.workflowfile('searchio'), int(args.get('--idle')))
+        log.info('[daemon] started')
+
+    elif args.get('stop'):
+        if daemon.stop(path):
+            log.info('[daemon] stopped')
+        else:
+            log.info('[daemon] not running')
+
+    else:
+        info = daemon.status(path)
+        if info:
+            print('running (pid {pid}), {requests} request(s) in '
+                  '{uptime:0.0f}s'.format(**info), file=sys.stderr)
+            print('connections: {connections} opened, {reused} reused, '
+                  '{discarded} discarded'.format(**info['pool']),
+                  file=sys.stderr)
+        else:
+            print('not running', file=sys.stderr)
+
+        # Shared by all search processes, not just the daemon
+        print('fetches: {coalesced} coalesced, {cancelled} cancelled'
+              .format(**Context(wf).leases.counters()), file=sys.stderr)
+        return 0 if info else 1
@@ -45,10 +45,13 @@ def run(wf, argv):
     import searchio.cmd.add
     import searchio.cmd.clean
     import searchio.cmd.config
+    import searchio.cmd.daemon
     import searchio.cmd.delete
     import searchio.cmd.list
+    import searchio.cmd.multi
     import searchio.cmd.reload
     import searchio.cmd.search
+    import searchio.cmd.stats
     import searchio.cmd.user
     import searchio.cmd.variants
 
@@ -56,11 +59,14 @@ def run(wf, argv):
         'add': searchio.cmd.add.usage,
         'clean': searchio.cmd.clean.usage,
         'config': searchio.cmd.config.usage,
+        'daemon': searchio.cmd.daemon.usage,
         'delete': searchio.cmd.delete.usage,
         'help': usage,
         'list': searchio.cmd.list.usage,
+        'multi': searchio.cmd.multi.usage,
         'reload': searchio.cmd.reload.usage,
         'search': searchio.cmd.search.usage,
+        'stats': searchio.cmd.stats.usage,
         'user': searchio.cmd.user.usage,
         'variants': searchio.cmd.variants.usage,
     }
@@ -30,8 +30,7 @@ import sys
 from docopt import docopt
 
 from searchio.core import Context
-from searchio import engines
-# from searchio.engines import load as load_engines
+from searchio import fuzzy
 from searchio import util
 
 log = util.logger(__name__)
@@ -57,11 +56,10 @@ def run(wf, argv):
     query = wf.decode(args.get('<query>') or '').strip()
     ICON_BACK = ctx.icon('back')
 
-    engs = engines.load(*ctx.engine_dirs)
-    # engs = engines.engines()
+    engs = ctx.catalog.engines()
 
     if query:
-        engs = wf.filter(query, engs, key=attrgetter('title'))
+        engs = fuzzy.filter(wf, query, engs, key=attrgetter('title'))
     else:
         it = wf.add_item(
             u'Configuration',
@@ -77,7 +75,7 @@ def run(wf, argv):
 
         table = util.Table([u'ID', u'Name', u'Description', u'Variants'])
         for e in engs:
-            n = '{:>8}'.format(len(e.variants))
+            n = '{:>8}'.format(e.variant_count)
             table.add_row((e.uid, e.title, e.description, n))
 
         print(table)
@@ -86,8 +84,8 @@ def run(wf, argv):
     else:  # Display for Alfred
         for e in engs:
             title = u'{} …'.format(e.title)
-            subtitle = (str(len(e.variants)) + ' variant' +
-                        ('s', '')[len(e.variants) == 1])
+            subtitle = (str(e.variant_count) + ' variant' +
+                        ('s', '')[e.variant_count == 1])
             it = wf.add_item(
                 title,
                 subtitle,
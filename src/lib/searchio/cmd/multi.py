@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""searchio multi [options] <searches> <query>
+
+Ask several searches for suggestions for <query> at once.
+<searches> is a comma-separated list of search UIDs.
+
+Searches are queried concurrently and their suggestions merged.
+Searches that haven't answered by the deadline are left out.
+
+Usage:
+    searchio multi [-d <secs>] <searches> <query>
+    searchio multi -h
+
+Options:
+    -d, --deadline <secs>  Max. time to wait for suggestions [default: 1.5]
+    -h, --help             Display this help message
+"""
+
+from __future__ import print_function, absolute_import
+
+import os
+import threading
+from time import time
+
+from docopt import docopt
+
+from searchio.cmd.search import cached_search, load_search
+from searchio.core import Context
+from searchio import trace
+from searchio import util
+
+log = util.logger(__name__)
+
+
+def usage(wf):
+    """CLI usage instructions."""
+    return __doc__
+
+
+def fan_out(ctx, searches, query, deadline):
+    """Call `cached_search()` for each search concurrently.
+
+    Each search runs in its own daemon thread, so a search that
+    misses the deadline doesn't keep the process alive. (In the
+    daemon, it keeps running and its suggestions are cached for
+    next time. The daemon waits for it before handling another
+    request, see `searchio.daemon.Server.execute()`.)
+
+    Args:
+        ctx (core.Context): Current context
+        searches (list): `searchio.engines.Search` objects
+        query (unicode): Search query
+        deadline (float): Seconds to wait for all searches
+
+    Returns:
+        list: Lists of `searchio.results.Result` objects, in the
+            same order as `searches`. ``None`` for searches that
+            failed or missed the deadline.
+
+    """
+    results = [None] * len(searches)
+    cond = threading.Condition()
+    pending = [len(searches)]
+
+    def _search(i, search):
+        start = time()
+        try:
+            with trace.span('search', search=search.uid):
+                results[i] = cached_search(ctx, search, query)
+        except Exception as err:
+            log.error('[multi/%s] %s', search.uid, err)
+        log.debug('[multi/%s] finished in %0.3fs', search.uid, time() - start)
+
+        with cond:
+            pending[0] -= 1
+            cond.notify()
+
+    for i, search in enumerate(searches):
+        t = threading.Thread(target=_search, args=(i, search))
+        t.daemon = True
+        t.start()
+
+    end = time() + deadline
+    with cond:
+        while pending[0]:
+            remaining = end - time()
+            if remaining <= 0:
+                break
+            cond.wait(remaining)
+
+        # Copy, as late searches may still write to `results`
+        results = list(results)
+
+    for search, r in zip(searches, results):
+        if r is None:
+            log.warning('[multi/%s] no suggestions within %0.1fs',
+                        search.uid, deadline)
+
+    return results
+
+
+def merge(searches, results):
+    """Interleave results from several searches.
+
+    Top suggestions from each search come first. Results whose
+    URL has already been seen are dropped.
+
+    Args:
+        searches (list): `searchio.engines.Search` objects
+        results (list): Results for each search (see `fan_out()`)
+
+    Returns:
+        list: ``(search, result)`` tuples.
+
+    """
+    merged = []
+    urls = set()
+    results = [r or [] for r in results]
+    for i in range(max([len(r) for r in results] or [0])):
+        for search, r in zip(searches, results):
+            if i < len(r) and r[i].url not in urls:
+                urls.add(r[i].url)
+                merged.append((search, r[i]))
+
+    return merged
+
+
+def run(wf, argv):
+    """Run ``searchio multi`` sub-command."""
+    with trace.span('docopt', command='multi'):
+        args = docopt(usage(wf), argv)
+    ctx = Context(wf)
+    query = wf.decode(args.get('<query>') or '').strip()
+    uids = [s.strip() for s in
+            wf.decode(args.get('<searches>') or '').split(',') if s.strip()]
+    if not uids or not query:
+        raise RuntimeError('<searches> and <query> are required')
+
+    start = time()
+    searches = []
+    for uid in uids:
+        p = ctx.search(uid)
+        if not os.path.exists(p):
+            raise ValueError('Unknown search "{}" ({!r})'.format(uid, p))
+        searches.append(load_search(p))
+
+    results = fan_out(ctx, searches, query, float(args.get('--deadline')))
+    merged = merge(searches, results)
+
+    log.debug('[multi] %d result(s) from %d search(es) in %0.3fs',
+              len(merged), len(searches), time() - start)
+
+    with trace.span('items', count=len(merged)):
+        for search, r in merged:
+            wf.add_item(
+                r.term,
+                u'Search {} for "{}"'.format(r.source, r.term),
+                arg=r.url,
+                autocomplete=r.term + u' ',
+                valid=True,
+                icon=search.icon,
+            )
+
+    with trace.span('send_feedback'):
+        wf.send_feedback()
@@ -24,15 +24,18 @@ Options:
 
 from __future__ import print_function, absolute_import
 
+import copy
+import hashlib
 import json
 import os
 #from plistlib import readPlist, readPlistFromString, writePlist
 import plistlib
 from docopt import docopt
+from workflow.util import atomic_writer
 from searchio.core import Context
 from searchio.engines import Search
+from searchio import metadata
 from searchio import util
-import json
 
 log = util.logger(__name__)
 
@@ -43,6 +46,9 @@ YPOS = 220
 # Vertical space between (top of) each Script Filter
 YOFFSET = 170
 
+# Type of generated Script Filters
+SCRIPT_FILTER_TYPE = 'alfred.workflow.input.scriptfilter'
+
 # UID of action to connect Script Filters to
 OPEN_URL_UID = '1133DEAA-5A8F-4E7D-9E9C-A76CB82D9F92'
 SCRIPT_FILTER = dict (
@@ -161,150 +167,289 @@ def usage(wf=None):
     return __doc__
 
 
-def remove_script_filters(wf, data):
-    """Remove auto-generated Script Filters from info.plist data."""
-    ids = set()
-    for k, d in data['uidata'].items():
-        if 'colorindex' not in d:
-            ids.add(k)
+def deleted_defaults(wf):
+    """Return UIDs of default searches the user has deleted."""
+    deleted = wf.settings.get('deleted_defaults', '')
+    return set(deleted.split(',')) if deleted else set()
 
-    keep = []
-    delete = []
 
-    for obj in data['objects']:
-        if obj['uid'] in ids and \
-                obj['type'] == 'alfred.workflow.input.scriptfilter':
-            log.info('Removed Script Filter "%s" (%s)',
-                     obj['config']['title'], obj['uid'])
-            delete.append(obj['uid'])
-            continue
-        keep.append(obj)
+def load_searches(wf):
+    """Return default and user searches sorted by title.
 
-    data['objects'] = keep
+    User searches override defaults with the same UID, and
+    defaults the user has deleted are left out.
 
-    # Remove connections and uidata
-    for uid in delete:
-        del data['connections'][uid]
-        del data['uidata'][uid]
+    Args:
+        wf (workflow.Workflow3): Current workflow.
 
+    Returns:
+        list: `searchio.engines.Search` objects.
 
-def add_script_filters(wf, data, searches=None):
-    """Add user searches to info.plist data."""
+    """
     ctx = Context(wf)
-    only = set()
-
-    if searches:  # add them to the user's searches dir
-        # Get list of deleted default engines to avoid saving them
-        deleted_defaults = set()
-        deleted_config = wf.settings.get('deleted_defaults', '')
-        if deleted_config:
-            deleted_defaults = set(deleted_config.split(','))
-        
-        for s in searches:
-            # Don't save defaults that are marked as deleted
-            if s.uid in deleted_defaults:
-                log.info('Skipping deleted default search "%s"', s.title)
-                continue
-                
-            path = os.path.join(ctx.searches_dir, s.uid + '.json')
-            with open(path, 'w') as fp:
-                json.dump(s.dict, fp, indent=2)
-            only.add(s.uid)
-            log.info('Saved search "%s"', s.title)
-
-    # Load both default and user searches (like user.py does)
-    all_searches = []
-    
-    # Get list of deleted default engines from workflow settings
-    deleted_defaults = set()
-    deleted_config = wf.settings.get('deleted_defaults', '')
-    if deleted_config:
-        deleted_defaults = set(deleted_config.split(','))
-    
-    # First, load default searches (excluding deleted ones)
-    for default_data in DEFAULTS:
-        if default_data['uid'] not in deleted_defaults:
-            all_searches.append(Search.from_dict(default_data))
-    
-    # Then, load user searches (these will override defaults if same UID)
+    deleted = deleted_defaults(wf)
+    searches = [Search.from_dict(d) for d in DEFAULTS
+                if d['uid'] not in deleted]
+
     f = util.FileFinder([ctx.searches_dir], ['json'])
     user_searches = [Search.from_file(p) for p in f]
-    
-    # Merge user searches with defaults, with user searches taking precedence
     user_uids = {s.uid for s in user_searches}
-    searches = [s for s in all_searches if s.uid not in user_uids] + user_searches
-    
-    if only:
-        searches = [s for s in searches if s.uid in only]
+    searches = [s for s in searches if s.uid not in user_uids] + user_searches
 
     searches.sort(key=lambda s: s.title)
-    log.info("SEARCHES=====")
-    
+    return searches
+
+
+def save_searches(wf, searches):
+    """Save ``searches`` to the user's searches directory.
+
+    Defaults the user has deleted are not saved.
+
+    Args:
+        wf (workflow.Workflow3): Current workflow.
+        searches (list): `searchio.engines.Search` objects.
+
+    Returns:
+        list: The searches that were saved.
+
+    """
+    ctx = Context(wf)
+    deleted = deleted_defaults(wf)
+    saved = []
+    for s in searches:
+        if s.uid in deleted:
+            log.info('Skipping deleted default search "%s"', s.title)
+            continue
+
+        path = os.path.join(ctx.searches_dir, s.uid + '.json')
+        with open(path, 'w') as fp:
+            json.dump(s.dict, fp, indent=2)
+        saved.append(s)
+        log.info('Saved search "%s"', s.title)
 
+    return saved
+
+
+def generated_uids(data):
+    """Return UIDs of auto-generated Script Filters in info.plist data.
+
+    Generated Script Filters are the ones without a colour.
+
+    """
+    ids = set([k for k, d in data['uidata'].items() if 'colorindex' not in d])
+    return set([o['uid'] for o in data['objects']
+                if o['uid'] in ids and o['type'] == SCRIPT_FILTER_TYPE])
+
+
+def script_filter(s, ypos):
+    """Return info.plist entries for the Script Filter of search ``s``.
+
+    Args:
+        s (searchio.engines.Search): Search to generate Script Filter for.
+        ypos (int): Vertical position of Script Filter.
+
+    Returns:
+        tuple: ``(object, connections, uidata)``.
+
+    """
+    d = copy.deepcopy(SCRIPT_FILTER)
+    d['uid'] = s.uid
+    d['config']['title'] = s.title
+    d['config']['script'] = './search {} "$1"'.format(s.uid)
+    d['config']['keyword'] = s.keyword
+    connections = [{
+        'destinationuid': OPEN_URL_UID,
+        'modifiers': 0,
+        'modifiersubtext': '',
+        'vitoclose': False,
+    }]
+    uidata = {
+        'note': s.title,
+        'xpos': XPOS,
+        'ypos': ypos,
+    }
+    return d, connections, uidata
+
+
+def script_filters(searches):
+    """Return info.plist entries for ``searches`` in order.
+
+    Searches without a keyword are skipped.
+
+    Returns:
+        list: ``(object, connections, uidata)`` tuples.
+
+    """
+    entries = []
     ypos = YPOS
     for s in searches:
-        log.info(s.keyword)
         if not s.keyword:
             log.error('No keyword for search "%s" (%s)', s.title, s.uid)
             continue
-        
-        d13 = plistlib.dumps(SCRIPT_FILTER)
-        d = plistlib.loads(d13)
-        
-        log.info(type(d))
-        log.info(d)
-        #d = plistlib.loads(SCRIPT_FILTER.encode('utf-8'))
-        #d = readPlistFromString(SCRIPT_FILTER)
-              
-        
-        d['uid'] = s.uid
-        d['config']['title'] = s.title
-        # d['config']['script'] = './searchio search {} "$1"'.format(s.uid)
-        d['config']['script'] = './search {} "$1"'.format(s.uid)
-        d['config']['keyword'] = s.keyword
-        # Note: Alfred expects icon files named after the Script Filter UID
-        # We'll create symlinks in the link_icons function below
-        data['objects'].append(d)
-        data['connections'][s.uid] = [{
-            'destinationuid': OPEN_URL_UID,
-            'modifiers': 0,
-            'modifiersubtext': '',
-            'vitoclose': False,
-        }]
-        data['uidata'][s.uid] = {
-            'note': s.title,
-            'xpos': XPOS,
-            'ypos': ypos,
-        }
+
+        entries.append(script_filter(s, ypos))
         ypos += YOFFSET
-        log.info('Added Script Filter "%s" (%s)', s.title, s.uid)
 
-    # Create symlinks for Script Filter icons
+    return entries
+
+
+def digest(obj):
+    """Return hash of info.plist data ``obj``."""
+    s = json.dumps(obj, sort_keys=True, default=str)
+    return hashlib.md5(s.encode('utf-8')).hexdigest()
+
+
+def reconcile(data, entries):
+    """Update generated Script Filters in info.plist data.
+
+    Entries are matched to existing Script Filters by UID, and only
+    Script Filters whose content has changed are replaced. New ones
+    are added below the existing ones and ones without an entry are
+    removed. Other objects are left alone.
+
+    Existing Script Filters keep their position, so adding or
+    removing one search doesn't move (and change) all the others.
+
+    Args:
+        data (dict): info.plist data.
+        entries (list): ``(object, connections, uidata)`` tuples
+            as returned by `script_filters()`.
+
+    Returns:
+        tuple: Numbers of Script Filters ``(added, updated, removed)``.
+
+    """
+    existing = generated_uids(data)
+    positions = dict([(o['uid'], i) for i, o in enumerate(data['objects'])
+                      if o['uid'] in existing])
+    wanted = set([e[0]['uid'] for e in entries])
+    kept = [data['uidata'][uid].get('ypos', 0) for uid in existing & wanted]
+    bottom = max(kept) if kept else None
+    added = updated = 0
+
+    for obj, connections, uidata in entries:
+        uid = obj['uid']
+        title = obj['config']['title']
+        if uid in positions:
+            i = positions[uid]
+            uidata = dict(uidata, ypos=data['uidata'][uid].get('ypos', 0))
+            current = (data['objects'][i], data['connections'].get(uid),
+                       data['uidata'].get(uid))
+            if digest(current) == digest((obj, connections, uidata)):
+                continue
+
+            data['objects'][i] = obj
+            updated += 1
+            log.info('Updated Script Filter "%s" (%s)', title, uid)
+        else:
+            if bottom is not None:
+                bottom += YOFFSET
+                uidata = dict(uidata, ypos=bottom)
+            data['objects'].append(obj)
+            added += 1
+            log.info('Added Script Filter "%s" (%s)', title, uid)
+
+        data['connections'][uid] = connections
+        data['uidata'][uid] = uidata
+
+    removed = existing - wanted
+    if removed:
+        data['objects'] = [o for o in data['objects']
+                           if o['uid'] not in removed]
+        for uid in removed:
+            data['connections'].pop(uid, None)
+            data['uidata'].pop(uid, None)
+            log.info('Removed Script Filter (%s)', uid)
+
+    return added, updated, len(removed)
+
+
+def update_info_plist(wf, searches=None):
+    """Make info.plist's generated Script Filters match ``searches``.
+
+    info.plist is only rewritten if a Script Filter was added,
+    changed or removed. If neither info.plist nor the Script Filters
+    have changed since the last update, info.plist isn't even read.
+
+    Args:
+        wf (workflow.Workflow3): Current workflow.
+        searches (list, optional): Searches to generate Script
+            Filters for. Defaults to `load_searches()`.
+
+    Returns:
+        bool: `True` if info.plist was changed.
+
+    """
+    if searches is None:
+        searches = load_searches(wf)
+
+    ip = wf.workflowfile('info.plist')
+    stamp_path = wf.cachefile('info.plist.stamp')
+    entries = script_filters(searches)
+    want = digest(entries)
+
+    def stamp():
+        st = os.stat(ip)
+        return [st.st_size, st.st_mtime, want]
+
+    changed = False
+    try:
+        with open(stamp_path) as fp:
+            fresh = json.load(fp) == stamp()
+    except (IOError, OSError, ValueError):
+        fresh = False
+
+    if fresh:
+        log.debug('info.plist is up to date')
+    else:
+        with open(ip, 'rb') as fp:
+            data = plistlib.load(fp)
+
+        counts = reconcile(data, entries)
+        log.info('%d Script Filter(s) added, %d updated, %d removed', *counts)
+        if any(counts):
+            with atomic_writer(ip, 'wb') as fp:
+                plistlib.dump(data, fp)
+            metadata.save(wf.workflowdir, data)
+            changed = True
+
+        with open(stamp_path, 'w') as fp:
+            json.dump(stamp(), fp)
+
     link_icons(wf, searches)
+    return changed
 
 
 def link_icons(wf, searches):
-    """Create symlinks for Script Filter icons."""
-    # Remove existing icon symlinks
-    for fn in os.listdir(wf.workflowdir):
-        if not fn.endswith('.png'):
+    """Create symlinks for Script Filter icons.
+
+    Alfred expects a Script Filter's icon at ``<uid>.png``. Only
+    missing or wrong symlinks are changed, and symlinks for searches
+    that no longer exist are removed.
+
+    """
+    wanted = dict([(s.uid + '.png', os.path.relpath(s.icon, wf.workflowdir))
+                   for s in searches])
+
+    # scandir() knows which entries are symlinks without a stat()
+    for entry in os.scandir(wf.workflowdir):
+        fn = entry.name
+        if not fn.endswith('.png') or not entry.is_symlink():
             continue
-        p = wf.workflowfile(fn)
-        if not os.path.islink(p):
+
+        if wanted.get(fn) == os.readlink(entry.path):
+            del wanted[fn]
             continue
 
-        os.unlink(p)
-        log.debug('Removed search icon "%s"', p)
+        os.unlink(entry.path)
+        log.debug('Removed search icon "%s"', entry.path)
 
-    for s in searches:
-        src = s.icon
-        dest = wf.workflowfile(s.uid + '.png')
-        if os.path.exists(dest):
+    for fn, src in wanted.items():
+        dest = wf.workflowfile(fn)
+        if os.path.lexists(dest):
             continue
 
-        src = os.path.relpath(src, wf.workflowdir)
-        dest = os.path.relpath(dest, wf.workflowdir)
-        log.debug('Linking "%s" to "%s"', src, dest)
+        log.debug('Linking "%s" to "%s"', src, fn)
         os.symlink(src, dest)
 
 
@@ -315,19 +460,6 @@ def run(wf, argv):
     log.debug('args=%r', args)
 
     if args['--defaults']:
-        searches = [Search.from_dict(d) for d in DEFAULTS]
+        searches = save_searches(wf, [Search.from_dict(d) for d in DEFAULTS])
 
-    ip = wf.workflowfile('info.plist')
-    #data = readPlist(ip)
-    with open(ip, "rb") as file:
-        data = plistlib.load(file)
-    
-    #log.debug(data)
-    remove_script_filters(wf, data)
-    #log.debug("COMPLETED REMOVE SCRIPT ----------")
-    #log.debug(f"data type is {type(data)}")
-    
-    add_script_filters(wf, data, searches)
-    with open(ip, "wb") as file:
-        plistlib.dump(data, file)
-    #writePlist(data, ip)
+    update_info_plist(wf, searches)
@@ -15,34 +15,42 @@ Ask specified engine for suggestions for <query>.
 
 Usage:
     searchio search [-t] <search> <query>
+    searchio search --refresh <search> <query>
     searchio search -h
 
 <search> may be a path or a UID.
 
 Options:
+    -r, --refresh  Update cached suggestions without showing them
     -t, --text     Print results as text, not Alfred JSON
     -h, --help     Display this help message
 """
 
 from __future__ import print_function, absolute_import
 
-from collections import namedtuple
-import hashlib
 import os
 import sys
 from time import time
 
-from docopt import docopt
-
-from searchio import MAX_CACHE_AGE
+from searchio import MAX_CACHE_AGE, MAX_SUGGESTIONS
 from searchio import engines
+from searchio import jpath
+from searchio.cache import RETRY_AFTER
 from searchio.core import Context
+from searchio.results import Result
+from searchio import trace
 from searchio import util
 
 log = util.logger(__name__)
 
 
-Result = namedtuple('Result', 'term url source')
+# How often Alfred should re-run the Script Filter while
+# suggestions are being refreshed in the background
+RERUN_INTERVAL = 0.3
+
+# Searches loaded by this process, keyed by path. Only pays off
+# in a long-running process, i.e. the daemon.
+_searches = {}
 
 
 def usage(wf):
@@ -50,10 +58,102 @@ def usage(wf):
     return __doc__
 
 
-def cached_search(ctx, search, query):
-    """Perform a cache-backed search.
+def load_search(p):
+    """Load a `Search`, reusing it if its file hasn't changed.
+
+    Args:
+        p (str): Path to JSON search config.
+
+    Returns:
+        searchio.engines.Search: Search configured from file.
+
+    """
+    mtime = os.stat(p).st_mtime
+    hit = _searches.get(p)
+    if hit and hit[0] == mtime:
+        return hit[1]
+
+    search = engines.Search.from_file(p)
+    _searches[p] = (mtime, search)
+    return search
 
-    Cached entries are expired after ``MAX_CACHE_AGE`` seconds.
+
+def make_results(search, query, terms):
+    """Turn suggested terms into results.
+
+    Args:
+        search (searchio.engines.Search): Search configuration
+        query (unicode): Search query the terms were suggested for
+        terms (list): Suggestions for `query`
+
+    Returns:
+        list: `Result` objects, with a result for `query` itself
+            at the end unless it's one of `terms`.
+
+    """
+    # results = OrderedDict()
+    results = []
+    urls = set()  # URLs to results
+
+    mkurl = util.urltemplate(search.search_url, search.pcencode)
+
+    # result based on user's query
+    qr = Result(query, mkurl(query), search.title, mkurl)
+
+    for term in terms:
+        r = Result(term, mkurl(term), search.title, mkurl)
+        results.append(r)
+        urls.add(r.url)
+
+    # add query-based result at the end if it's not a duplicate
+    if qr.url not in urls:
+        results.append(qr)
+
+    return results
+
+
+def fetch(search, query, deadline=None, limiter=None):
+    """Fetch and parse suggestions from the search's API.
+
+    Args:
+        search (searchio.engines.Search): Search configuration
+        query (unicode): Search query to return suggestions for
+        deadline (util.Deadline, optional): Time budget for request
+        limiter (searchio.ratelimit.RateLimiter, optional): Rate
+            limiter for request
+
+    Returns:
+        list: `Result` objects.
+
+    Raises:
+        TimeoutError: Raised if ``deadline`` is exceeded.
+
+    """
+    url = util.urltemplate(search.suggest_url, search.pcencode)(query)
+    limit = int(os.getenv('SEARCHIO_MAX_SUGGESTIONS') or MAX_SUGGESTIONS)
+
+    # match JSONPath while reading response and unwrap results
+    jx = jpath.compile(search.jsonpath)
+
+    terms = []
+    for v in util.findjson(url, jx, limit, deadline, limiter):
+        if isinstance(v, str):
+            terms.append(v)
+        elif isinstance(v, list):
+            terms.extend(v)
+
+    if limit:
+        terms = terms[:limit]
+
+    return make_results(search, query, terms)
+
+
+def provisional(ctx, search, query):
+    """Return results for `query` from a cached prefix of it.
+
+    Suggestions for the longest cached prefix that also start
+    with `query` are used, so "python" can be answered from the
+    suggestions for "pyth" while its own are fetched.
 
     Args:
         ctx (core.Context): Current context
@@ -61,88 +161,279 @@ def cached_search(ctx, search, query):
         query (unicode): Search query to return suggestions for
 
     Returns:
-        list: Search suggestions. Sequence of Unicode strings.
+        list: `Result` objects or ``None`` if no cached prefix
+            has any matching suggestions.
+
+    """
+    hit = ctx.cache.prefix(search.uid, query)
+    if not hit:
+        return None
+
+    prefix, entry = hit
+    if (time() - entry.created >= MAX_CACHE_AGE and
+            not ctx.getbool('SEARCHIO_STALE_WHILE_REVALIDATE')):
+        return None
+
+    q = query.lower()
+    terms = [r.term for r in entry.data if r.term.lower().startswith(q)]
+    if not terms:
+        return None
+
+    log.debug('[search/%s] %d provisional result(s) from "%s"',
+              search.uid, len(terms), prefix)
+    return make_results(search, query, terms)
+
+
+def update(ctx, search, query):
+    """Fetch and cache suggestions unless the query is superseded.
+
+    If another process is already fetching the same query, waits
+    for it and uses its results instead. If the user has since
+    entered a newer query, gives up without fetching.
+
+    If the search's deadline (see `core.Context.deadline()`) is
+    exceeded, expired cached suggestions are returned, if there
+    are any, or just a result for `query`, so Alfred isn't kept
+    waiting. Failed fetches are recorded (see
+    `searchio.cache.Leases.failed()`).
+
+    Args:
+        ctx (core.Context): Current context
+        search (searchio.engines.Search): Search configuration
+        query (unicode): Search query to fetch suggestions for
+
+    Returns:
+        list: `Result` objects or ``None`` if cancelled.
+
+    """
+    deadline = ctx.deadline(search)
+    leases = ctx.leases
+    with leases.fetching(search.uid, query) as waited:
+        if waited:
+            entry = ctx.cache.get(search.uid, query)
+            if entry and time() - entry.created < MAX_CACHE_AGE:
+                log.debug('[search/%s] coalesced "%s"', search.uid, query)
+                leases.count('coalesced')
+                trace.note(outcome='coalesced')
+                return entry.data
+
+        if leases.superseded(search.uid, query):
+            log.debug('[search/%s] cancelled "%s"', search.uid, query)
+            leases.count('cancelled')
+            trace.note(outcome='cancelled')
+            return None
+
+        try:
+            results = fetch(search, query, deadline, ctx.ratelimiter)
+        except TimeoutError as err:
+            log.warning('[search/%s] "%s": %s', search.uid, query, err)
+            trace.note(outcome='timeout')
+            leases.failed(search.uid, query)
+            entry = ctx.cache.get(search.uid, query)
+            return entry.data if entry else make_results(search, query, [])
+        except Exception:
+            leases.failed(search.uid, query)
+            raise
+
+        leases.succeeded(search.uid, query)
+        with trace.span('cache store', search=search.uid):
+            ctx.cache.set(search.uid, query, results)
+
+    return results
+
+
+def refresh(ctx, search, query):
+    """Update cached suggestions in the background.
+
+    Also tells Alfred to re-run the Script Filter, so it picks up
+    the new suggestions when they arrive.
+
+    Args:
+        ctx (core.Context): Current context
+        search (searchio.engines.Search): Search configuration
+        query (unicode): Search query to fetch suggestions for
+
+    """
+    from workflow.background import is_running, run_in_background
+    from searchio.cache import qhash
+
+    name = 'refresh-{}-{}'.format(search.uid, qhash(query))
+    if not is_running(name):
+        cmd = [sys.executable, ctx.wf.workflowfile('searchio'),
+               'search', '--refresh', search.uid, query]
+        run_in_background(name, cmd)
+
+    ctx.wf.rerun = RERUN_INTERVAL
+
 
-    No Longer Raises:
-        ValueError: Raised if search is unknown
+def revalidate(ctx, search, query):
+    """Refresh stale or provisional results unless that just failed.
+
+    If fetching `query` failed in the last ``RETRY_AFTER`` seconds,
+    e.g. because the engine is down or rate-limited, nothing is
+    fetched and Alfred isn't asked to re-run the Script Filter, so
+    it doesn't retry every `RERUN_INTERVAL` seconds.
+
+    Args:
+        ctx (core.Context): Current context
+        search (searchio.engines.Search): Search configuration
+        query (unicode): Search query to fetch suggestions for
 
     """
+    if ctx.leases.backoff(search.uid, query):
+        log.warning('[search/%s] fetching "%s" failed, retrying in %ds',
+                    search.uid, query, RETRY_AFTER)
+        return
+
+    refresh(ctx, search, query)
+
+
+def cached_search(ctx, search, query):
+    """Perform a cache-backed search and record its metrics.
+
+    See `lookup()` for how suggestions are found. How the search
+    was answered and how long it took are added to the metrics log
+    (see `searchio.metrics`).
+
+    Args:
+        ctx (core.Context): Current context
+        search (searchio.engines.Search): Search configuration
+        query (unicode): Search query to return suggestions for
+
+    Returns:
+        list: `Result` objects.
+
+    """
+    from searchio.metrics import Record
+
     if not search.suggest_url:
         log.debug('[search/%s] Suggestions not supported', search.uid)
         return []
 
-    url = util.mkurl(search.suggest_url, query, search.pcencode)
-
-    # Caching configuration
-    h = hashlib.md5(query.encode('utf-8')).hexdigest()
-    reldir = 'searches/{}/{}/{}'.format(search.uid, h[:2], h[2:4])
-    # Ensure cache directory exists
-    dirpath = os.path.join(ctx.wf.cachedir, reldir)
     try:
-        os.makedirs(dirpath)
-    except OSError as err:
-        if err.errno != 17:
-            raise err
+        with trace.measure() as totals:
+            try:
+                results = lookup(ctx, search, query)
+            except Exception:
+                trace.note(outcome='error')
+                raise
+    finally:
+        ctx.metrics.append(Record.from_totals(search.uid, totals))
 
-    key = u'{}/{}'.format(reldir, h)
+    return results
 
-    def _search():
-        """Fetch and parse JSON response."""
-        from jsonpath_rw import parse
-        # results = OrderedDict()
-        results = []
-        urls = set()  # URLs to results
 
-        # result based on user's query
-        qr = Result(query,
-                    util.mkurl(search.search_url, query, search.pcencode),
-                    search.title)
+def lookup(ctx, search, query):
+    """Return cached or fetched suggestions for ``query``.
 
-        data = util.getjson(url)
+    Cached entries are expired after ``MAX_CACHE_AGE`` seconds.
+    If the ``SEARCHIO_STALE_WHILE_REVALIDATE`` workflow variable
+    is set, expired entries are returned anyway and refreshed in
+    the background (see `revalidate()`).
 
-        # parse JSONPath and unwrap results
-        jx = parse(search.jsonpath)
+    If `query` isn't cached, matching suggestions for a cached
+    prefix of it are returned instead (see `provisional()`), and
+    the real ones are fetched in the background, too. Set the
+    ``SEARCHIO_PREFIX_CACHE`` workflow variable to ``0`` to turn
+    this off.
 
-        terms = []
-        for m in jx.find(data):
-            v = m.value
-            if isinstance(v, unicode):
-                terms.append(v)
-            elif isinstance(v, list):
-                terms.extend(v)
+    Fetches are coordinated with other processes (see `update()`),
+    so if `query` is superseded by a newer one before it's fetched,
+    no results are returned.
 
-        for term in terms:
-            r = Result(term,
-                       util.mkurl(search.search_url, term, search.pcencode),
-                       search.title)
-            results.append(r)
-            urls.add(r.url)
+    Args:
+        ctx (core.Context): Current context
+        search (searchio.engines.Search): Search configuration
+        query (unicode): Search query to return suggestions for
+
+    Returns:
+        list: `Result` objects.
 
-        # add query-based result at the end if it's not a duplicate
-        if qr.url not in urls:
-            results.append(qr)
+    """
+    ctx.leases.claim(search.uid, query)
+    with trace.span('cache lookup', search=search.uid) as sp:
+        entry = ctx.cache.get(search.uid, query)
+        sp.note(hit=entry is not None)
+    if entry:
+        age = time() - entry.created
+        if age < MAX_CACHE_AGE:
+            log.debug('[search/%s] cache hit', search.uid)
+            trace.note(outcome='hit')
+            return entry.data
+
+        if ctx.getbool('SEARCHIO_STALE_WHILE_REVALIDATE'):
+            log.debug('[search/%s] stale cache hit (%0.0fs old)',
+                      search.uid, age)
+            trace.note(outcome='stale')
+            revalidate(ctx, search, query)
+            return entry.data
+
+    elif ctx.getbool('SEARCHIO_PREFIX_CACHE', True):
+        results = provisional(ctx, search, query)
+        if results:
+            trace.note(outcome='provisional')
+            revalidate(ctx, search, query)
+            return results
+
+    return update(ctx, search, query) or []
+
+
+def get_search(ctx, uid):
+    """Return search ``uid``.
 
-        return results
+    Args:
+        ctx (core.Context): Current context
+        uid (unicode): UID of search
+
+    Returns:
+        searchio.engines.Search: Search configuration.
+
+    Raises:
+        ValueError: Raised if there is no such search.
+
+    """
+    p = ctx.search(uid)
+    if not os.path.exists(p):
+        raise ValueError('Unknown search "{}" ({!r})'.format(uid, p))
 
-    return ctx.wf.cached_data(key, _search, max_age=MAX_CACHE_AGE)
+    with trace.span('load search', search=uid):
+        return load_search(p)
 
 
 def run(wf, argv):
     """Run ``searchio search`` sub-command."""
-    args = docopt(usage(wf), argv)
-    ctx = Context(wf)
+    with trace.span('docopt', command='search'):
+        # imported here, as `searchio.scriptfilter` doesn't need it
+        from docopt import docopt
+        args = docopt(usage(wf), argv)
     query = wf.decode(args.get('<query>') or '').strip()
     uid = wf.decode(args.get('<search>') or '').strip()
     if not uid or not query:
         raise RuntimeError('<search> and <query> are required')
 
-    start = time()
-    p = ctx.search(uid)
-    if not os.path.exists(p):
-        raise ValueError('Unknown search "{}" ({!r})'.format(uid, p))
+    if args.get('--refresh'):
+        ctx = Context(wf)
+        if update(ctx, get_search(ctx, uid), query) is not None:
+            log.debug('[search/%s] refreshed "%s"', uid, query)
+        return
+
+    show(wf, uid, query, args.get('--text') or util.textmode())
 
-    search = engines.Search.from_file(p)
 
+def show(wf, uid, query, text=False):
+    """Search for ``query`` and show the results.
+
+    Args:
+        wf (workflow.Workflow3): Active workflow object, or
+            a `searchio.scriptfilter.ScriptFilter`.
+        uid (unicode): UID of search
+        query (unicode): Search query
+        text (bool, optional): Print a table, not Alfred JSON.
+
+    """
+    ctx = Context(wf)
+    start = time()
+    search = get_search(ctx, uid)
     results = cached_search(ctx, search, query)
 
     log.debug('[search/%s] %d result(s) in %0.3fs',
@@ -151,7 +442,7 @@ def run(wf, argv):
     # ---------------------------------------------------------
     # Text results
 
-    if args.get('--text') or util.textmode():
+    if text:
         print()
         msg = u'{:d} result(s) for "{:s}"'.format(len(results), query)
         print(msg, file=sys.stderr)
@@ -159,7 +450,7 @@ def run(wf, argv):
         print()
         table = util.Table([u'Suggestion', u'URL'])
         for r in results:
-            table.add_row(r[:2])
+            table.add_row((r.term, r.url))
             # print('{0}\t{1}'.format(term, url))
         print(table)
         print()
@@ -168,14 +459,16 @@ def run(wf, argv):
     # Alfred results
 
     else:
-        for r in results:
-            wf.add_item(
-                r.term,
-                u'Search {} for "{}"'.format(r.source, r.term),
-                arg=r.url,
-                autocomplete=r.term + u' ',
-                valid=True,
-                icon=search.icon,
-            )
-
-        wf.send_feedback()
+        with trace.span('items', count=len(results)):
+            for r in results:
+                wf.add_item(
+                    r.term,
+                    u'Search {} for "{}"'.format(r.source, r.term),
+                    arg=r.url,
+                    autocomplete=r.term + u' ',
+                    valid=True,
+                    icon=search.icon,
+                )
+
+        with trace.span('send_feedback'):
+            wf.send_feedback()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""searchio stats [-t] [<query>]
+
+Display (and optionally filter) latency and cache statistics
+for each search.
+
+Usage:
+    searchio stats [-t] [<query>]
+    searchio stats --clear
+    searchio stats -h
+
+Times are percentiles of how long searches took to answer
+Alfred. Searches count as cache hits if they were answered
+with cached suggestions.
+
+Options:
+    -c, --clear    Delete recorded statistics
+    -t, --text     Print results as text, not Alfred JSON
+    -h, --help     Display this help message
+"""
+
+from __future__ import print_function, absolute_import
+
+import os
+import sys
+
+from docopt import docopt
+
+from searchio.core import Context
+from searchio import engines
+from searchio import fuzzy
+from searchio.metrics import summarise
+from searchio import util
+
+log = util.logger(__name__)
+
+
+def usage(wf=None):
+    """CLI usage instructions."""
+    return __doc__
+
+
+def ms(seconds):
+    """Format ``seconds`` as milliseconds."""
+    if seconds is None:
+        return u'–'
+
+    return u'{:0.0f} ms'.format(seconds * 1000)
+
+
+def size(n):
+    """Format ``n`` bytes for humans."""
+    if n < 1024:
+        return u'{:d} B'.format(n)
+    if n < 1024 * 1024:
+        return u'{:0.1f} KB'.format(n / 1024.0)
+    return u'{:0.1f} MB'.format(n / 1024.0 / 1024.0)
+
+
+def search_info(ctx, uid):
+    """Return title and icon of search ``uid``.
+
+    Returns:
+        tuple: ``(title, icon)``. ``(uid, None)`` if the search has
+            been deleted.
+
+    """
+    p = ctx.search(uid)
+    if not os.path.exists(p):
+        return uid, None
+
+    try:
+        s = engines.Search.from_file(p)
+    except Exception as err:
+        log.warning('[stats] could not load search %s: %s', uid, err)
+        return uid, None
+
+    return s.title, s.icon
+
+
+def run(wf, argv):
+    """Run ``searchio stats`` sub-command."""
+    args = docopt(usage(wf), argv)
+    ctx = Context(wf)
+    query = wf.decode(args.get('<query>') or '').strip()
+    metrics = ctx.metrics
+
+    if args.get('--clear'):
+        metrics.clear()
+        log.info('Deleted search statistics')
+        return
+
+    records = metrics.records()
+    total, searches = summarise(records)
+    summaries = sorted(searches.values(), key=lambda s: -s.count)
+    info = dict([(s.uid, search_info(ctx, s.uid)) for s in summaries])
+    if query:
+        summaries = fuzzy.filter(wf, query, summaries,
+                                 key=lambda s: info[s.uid][0])
+
+    # ---------------------------------------------------------
+    # Text results
+
+    if args.get('--text') or util.textmode():
+        print()
+        msg = u'{:d} search(es) recorded'.format(total.count)
+        print(msg, file=sys.stderr)
+        print()
+        table = util.Table([u'Search', u'ID', u'Searches', u'Cache hits',
+                            u'p50', u'p95', u'p99', u'HTTP p50',
+                            u'Fetched', u'Failed'])
+        rows = [(s, info[s.uid][0], s.uid) for s in summaries]
+        if not query:
+            rows.append((total, u'All searches', u''))
+
+        for s, title, uid in rows:
+            table.add_row((title, uid, s.count,
+                           u'{:0.0%}'.format(s.hit_ratio),
+                           ms(s.latency(50)), ms(s.latency(95)),
+                           ms(s.latency(99)), ms(s.network_latency(50)),
+                           size(s.bytes), s.failed))
+
+        print(table)
+        print()
+
+    # ---------------------------------------------------------
+    # Alfred results
+
+    else:
+        if not records:
+            wf.add_item(u'No statistics yet',
+                        u'Statistics are recorded when you search',
+                        icon=ctx.icon('help'))
+
+        rows = [(s,) + info[s.uid] for s in summaries]
+        if records and not query:
+            rows.insert(0, (total, u'All searches', None))
+
+        for s, title, icon in rows:
+            subtitle = (u'p50 {} · p95 {} · p99 {} · {:0.0%} cached · '
+                        u'{:d} search(es) · {} fetched').format(
+                            ms(s.latency(50)), ms(s.latency(95)),
+                            ms(s.latency(99)), s.hit_ratio, s.count,
+                            size(s.bytes))
+            wf.add_item(title, subtitle, icon=icon or ctx.icon('help'))
+
+        wf.send_feedback()
@@ -29,6 +29,7 @@ import sys
 from docopt import docopt
 
 from searchio.core import Context
+from searchio import fuzzy
 from searchio.engines import Search
 from searchio import util
 
@@ -79,7 +80,7 @@ def run(wf, argv):
     searches.sort(key=attrgetter('title'))
 
     if query:
-        searches = wf.filter(query, searches, key=attrgetter('title'))
+        searches = fuzzy.filter(wf, query, searches, key=attrgetter('title'))
     else:
         it = wf.add_item(
             u'Configuration',
@@ -11,13 +11,15 @@
 """searchio variants <engine> [<query>]
 
 Display (and optionally filter) variants of an
-engine.
+engine, or search the variants of all engines.
 
 Usage:
     searchio variants [-t] <engine> [<query>]
+    searchio variants [-t] --all <query>
     searchio variants -h
 
 Options:
+    -a, --all           Search variants of all engines
     -t, --text          Print results as text, not Alfred JSON
     -h, --help          Display this help message
 """
@@ -30,7 +32,7 @@ import sys
 from docopt import docopt
 
 from searchio.core import Context
-from searchio import engines
+from searchio import fuzzy
 from searchio import util
 
 log = util.logger(__name__)
@@ -43,9 +45,17 @@ To specify a when searching, use:
 
 """
 
+_text_help_all = """\
+Searches matching "{query}":
+
+"""
+
 # Simple data model
 Variant = namedtuple('Variant', 'id name')
 
+# Max. number of results for --all
+MAX_RESULTS = 50
+
 
 def usage(wf):
     """CLI usage instructions."""
@@ -60,46 +70,53 @@ def run(wf, argv):
     query = wf.decode(args.get('<query>') or '').strip()
     ICON_BACK = ctx.icon('back')
 
-    engs = engines.load(*ctx.engine_dirs)
-    for e in engs:
-        if e.uid == engine_id:
-            engine = e
-            break
-    else:
-        raise ValueError('Unknown engine : {!r}'.format(engine_id))
-
     # get user searches so we can highlight already-installed searches
     uids = set([util.path2uid(p) for p in
                 util.FileFinder([ctx.searches_dir], ['json'])])
 
-    log.debug('engine=%r', engine)
-    variants = engine.variants
-
-    def _key(s):
-        return u'{} {}'.format(s.uid, s.title.lower())
+    if args.get('--all'):
+        engine = None
+        results = ctx.catalog.find_variants(query, MAX_RESULTS)
+        log.debug('%d variant(s) matching %r', len(results), query)
 
-    if query:
-        variants = wf.filter(query, variants, _key)
     else:
-        it = wf.add_item(
-            u'All Engines \U00002026',
-            u'Go back to engine list',
-            arg=engine.uid,
-            valid=True,
-            icon=ICON_BACK)
-        it.setvar('action', 'back')
+        engine = ctx.catalog.engine(engine_id)
+        if engine is None:
+            raise ValueError('Unknown engine : {!r}'.format(engine_id))
+
+        log.debug('engine=%r', engine)
+        variants = engine.variants
+
+        def _key(s):
+            return u'{} {}'.format(s.uid, s.title.lower())
+
+        if query:
+            variants = fuzzy.filter(wf, query, variants, _key)
+        else:
+            it = wf.add_item(
+                u'All Engines \U00002026',
+                u'Go back to engine list',
+                arg=engine.uid,
+                valid=True,
+                icon=ICON_BACK)
+            it.setvar('action', 'back')
+
+            #variants.sort()
 
-        #variants.sort()
+        results = [(engine, v) for v in variants]
 
     # ---------------------------------------------------------
     # Show results
 
     if args.get('--text') or util.textmode():  # Display for terminal
 
-        print(_text_help.format(engine=engine), file=sys.stderr)
+        if engine:
+            print(_text_help.format(engine=engine), file=sys.stderr)
+        else:
+            print(_text_help_all.format(query=query), file=sys.stderr)
 
         table = util.Table([u'ID', u'Installed', u'Title'])
-        for v in variants:
+        for _, v in results:
             installed = (u'', u'yes')[v.uid in uids]
             table.add_row((v.uid, installed, v.title))
 
@@ -109,16 +126,16 @@ def run(wf, argv):
     else:  # Display for Alfred
         wf.setvar('action', 'new')
         # TODO: Delimited browse action instead of nested Script Filters?
-        icon = ctx.icon(engine.uid)
 
-        for v in variants:
+        for e, v in results:
+            icon = ctx.icon(e.uid)
             it = wf.add_item(
                 v.title,
-                u'{} > {}'.format(engine.title, v.name),
+                u'{} > {}'.format(e.title, v.name),
                 arg=v.uid,
                 valid=True,
                 icon=icon)
-            it.setvar('engine', engine.uid)
+            it.setvar('engine', e.uid)
             it.setvar('uid', v.uid)
             it.setvar('title', v.title)
             it.setvar('name', v.name)
@@ -14,7 +14,7 @@ from __future__ import print_function, absolute_import
 
 import os
 
-from searchio import DEFAULT_ENGINE
+from searchio import CONNECT_TIMEOUT, DEFAULT_ENGINE, TIMEOUT
 from searchio import util
 
 log = util.logger(__name__)
@@ -38,9 +38,101 @@ class Context(object):
             if not os.path.exists(p):
                 os.makedirs(p)
 
+    @property
+    def cache(self):
+        """Cache for search suggestions.
+
+        Returns:
+            searchio.cache.Store: Configured cache backend.
+
+        """
+        from searchio.cache import open_store
+        return open_store(self.wf)
+
+    @property
+    def catalog(self):
+        """Compiled catalog of installed engines.
+
+        Returns:
+            searchio.catalog.Catalog: Catalog of engines in
+                `engine_dirs`.
+
+        """
+        from searchio.catalog import Catalog
+        return Catalog(self.wf.cachefile('engines.catalog'),
+                       self.engine_dirs)
+
+    @property
+    def leases(self):
+        """Coordinator for concurrent suggestion fetches.
+
+        Returns:
+            searchio.cache.Leases: Leases in the cache directory.
+
+        """
+        from searchio.cache import Leases
+        return Leases(self.wf.cachefile('leases'))
+
+    @property
+    def metrics(self):
+        """Log of search latencies and cache hits.
+
+        Returns:
+            searchio.metrics.MetricsLog: Log in the cache directory.
+
+        """
+        from searchio.metrics import MetricsLog
+        return MetricsLog(self.wf.cachefile('metrics.log'))
+
+    @property
+    def ratelimiter(self):
+        """Per-host rate limits shared by all processes.
+
+        Returns:
+            searchio.ratelimit.RateLimiter: Limiter with buckets
+                in the cache directory.
+
+        """
+        from searchio.ratelimit import RateLimiter
+        return RateLimiter(self.wf.cachefile('ratelimit.json'))
+
+    def deadline(self, search):
+        """Return time budget for fetching suggestions.
+
+        Uses the search's own timeout, if set, otherwise the
+        ``SEARCHIO_TIMEOUT`` and ``SEARCHIO_CONNECT_TIMEOUT``
+        workflow variables.
+
+        Args:
+            search (searchio.engines.Search): Search to fetch.
+
+        Returns:
+            searchio.util.Deadline: Deadline starting now.
+
+        """
+        timeout = search.timeout or float(os.getenv('SEARCHIO_TIMEOUT') or
+                                          TIMEOUT)
+        connect = float(os.getenv('SEARCHIO_CONNECT_TIMEOUT') or
+                        CONNECT_TIMEOUT)
+        return util.Deadline(timeout, connect)
+
     def icon(self, name):
+        """Return path to icon ``name`` from `icon_dirs`.
+
+        Icons are looked up in an index saved in the cache
+        directory, which is rebuilt when an icon directory changes.
+
+        Args:
+            name (str): Name of icon (minus extension).
+
+        Returns:
+            str: Path to icon or the workflow icon if there is
+                no icon called ``name``.
+
+        """
         if not self._icon_finder:
-            self._icon_finder = util.FileFinder(self.icon_dirs, IMAGE_EXTS)
+            self._icon_finder = util.FileIndex(
+                self.icon_dirs, IMAGE_EXTS, self.wf.cachefile('icons.json'))
 
         return self._icon_finder.find(name, 'icon.png')
 
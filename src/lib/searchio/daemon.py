@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Long-running search server.
+
+Every keystroke in a Script Filter normally starts a new Python
+process that has to import `workflow`, `docopt` and `searchio`
+before it can even think about the network. The daemon keeps one
+process alive that answers ``searchio search`` and ``searchio
+multi`` requests over a Unix domain socket, so imports, loaded
+searches, compiled JSON Paths and HTTP connections (see
+`searchio.pool`) are reused between keystrokes.
+
+Requests are handled one at a time: each one runs the normal
+CLI code with the client's environment and arguments, and its
+STDOUT is captured and sent back to the client. See
+`searchio.client` for the protocol.
+
+The CLI code reads its environment, arguments and STDOUT from
+`os.environ`, `sys.argv` and `sys.stdout`, so `Server.execute()`
+swaps the client's into those process globals for the duration
+of a request. That only works because requests are never handled
+concurrently: `Server` must not be combined with
+`socketserver.ThreadingMixIn`, and `Server.execute()` raises
+`RuntimeError` if it's called while another request is running.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+from searchio import client
+from searchio import pool
+from searchio import trace
+from searchio import util
+
+log = util.logger(__name__)
+
+# Commands the daemon will run. Anything else is rejected.
+COMMANDS = ('multi', 'search')
+
+# Exit after this many seconds without a request
+IDLE_TIMEOUT = 600
+
+
+class _Terminated(BaseException):
+    """Raised by the SIGTERM handler to leave `Server.serve()`.
+
+    Not an `Exception`, so `socketserver` doesn't catch it while
+    handling a request.
+
+    """
+
+
+def _terminate(signum, frame):
+    raise _Terminated()
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """Answer a single client request."""
+
+    def handle(self):
+        """Read request, run command and write its output."""
+        try:
+            req = json.loads(self.rfile.readline().decode('utf-8'))
+        except ValueError as err:
+            log.error('[daemon] invalid request: %s', err)
+            return
+
+        argv = req.get('argv') or []
+        self.server.execute(argv, req.get('env') or {}, self.reply)
+
+    def reply(self, status, output):
+        """Send exit status and output of command to client."""
+        header = json.dumps(dict(status=status)) + '\n'
+        self.wfile.write(header.encode('utf-8'))
+        self.wfile.write(output)
+        # The client reads until EOF, and the request isn't over
+        # until threads the command started have finished.
+        self.connection.shutdown(socket.SHUT_WR)
+
+
+class Server(socketserver.UnixStreamServer):
+    """Search server listening on a Unix domain socket.
+
+    Attributes:
+        idle_timeout (int): Seconds without a request before the
+            server exits.
+        requests (int): Number of requests handled.
+
+    """
+
+    def __init__(self, path, idle_timeout=IDLE_TIMEOUT):
+        """Create new `Server` bound to socket at ``path``.
+
+        Raises:
+            RuntimeError: Raised if another daemon is already
+                listening on ``path``.
+
+        """
+        if os.path.exists(path):
+            if client.call(['ping'], path=path) is not None:
+                raise RuntimeError('daemon already running')
+            # Stale socket left by a daemon that died
+            os.unlink(path)
+
+        # Create socket without access for anyone else. Changing its
+        # permissions after `bind()` would leave a window open.
+        umask = os.umask(0o077)
+        try:
+            socketserver.UnixStreamServer.__init__(self, path, Handler)
+        finally:
+            os.umask(umask)
+        self.path = path
+        self.idle_timeout = idle_timeout
+        self.timeout = idle_timeout or None
+        self.requests = 0
+        self.started = time.time()
+        self.pool = pool.ConnectionPool.from_environment()
+        self._running = False
+        self._lock = threading.Lock()
+
+    def execute(self, argv, env, reply):
+        """Run ``searchio`` with ``argv`` and capture its output.
+
+        The command runs with ``env`` as `os.environ`, ``argv`` as
+        `sys.argv` and a buffer as `sys.stdout`, which are restored
+        afterwards. See the module docstring.
+
+        ``reply`` is called as soon as the command returns, but the
+        globals are only restored once any threads it started (e.g.
+        ``multi``'s searches that missed the deadline) have finished,
+        as they still read the client's environment.
+
+        Args:
+            argv (list): Command and arguments.
+            env (dict): Environment variables of the client.
+            reply (callable): Called with the exit status and the
+                `bytes` written to STDOUT.
+
+        Raises:
+            RuntimeError: Raised if another request is running.
+
+        """
+        cmd = argv[0] if argv else None
+        if cmd == 'ping':
+            info = dict(pid=os.getpid(), requests=self.requests,
+                        uptime=time.time() - self.started,
+                        pool=self.pool.stats)
+            return reply(0, json.dumps(info).encode('utf-8'))
+
+        if cmd == 'stop':
+            self._running = False
+            return reply(0, b'')
+
+        if cmd not in COMMANDS:
+            log.error('[daemon] command not allowed: %r', cmd)
+            return reply(1, b'')
+
+        if not self._lock.acquire(False):
+            raise RuntimeError('requests must be handled one at a time')
+        try:
+            self._execute(argv, env, reply)
+        finally:
+            self._lock.release()
+
+    def _execute(self, argv, env, reply):
+        from searchio import HELP_URL, cli
+        from searchio.metadata import Workflow
+
+        self.requests += 1
+        start = time.time()
+        buf = io.BytesIO()
+        stdout = io.TextIOWrapper(buf, encoding='utf-8')
+        saved = sys.stdout, sys.argv, dict(os.environ)
+        threads = set(threading.enumerate())
+        wf = None
+        try:
+            sys.stdout = stdout
+            sys.argv = ['searchio'] + list(argv)
+            os.environ.clear()
+            os.environ.update(env)
+            trace.start()
+            trace.annotate(daemon=True)
+            try:
+                with trace.span('Workflow3'):
+                    wf = Workflow(help_url=HELP_URL)
+                status = wf.run(cli.cli)
+            except SystemExit as err:  # docopt exits on --help etc.
+                status = err.code if isinstance(err.code, int) else 1
+            finally:
+                if wf is not None:
+                    trace.save(wf.cachedir)
+                stdout.flush()
+                stdout.detach()
+
+            log.debug('[daemon] %r in %0.3fs', argv, time.time() - start)
+            reply(status, buf.getvalue())
+        finally:
+            self._join(threads)
+            sys.stdout, sys.argv = saved[:2]
+            os.environ.clear()
+            os.environ.update(saved[2])
+
+    def _join(self, threads):
+        """Wait for threads that aren't in ``threads`` to finish."""
+        for t in threading.enumerate():
+            if t not in threads:
+                log.debug('[daemon] waiting for thread %r ...', t.name)
+                t.join()
+
+    def handle_timeout(self):
+        """Shut down server when idle."""
+        log.info('[daemon] idle for %ds, exiting ...', self.idle_timeout)
+        self._running = False
+
+    def serve(self):
+        """Handle requests until idle, stopped or killed."""
+        # Just clearing `_running` isn't enough, as `select()` in
+        # `handle_request()` resumes after the signal (PEP 475).
+        signal.signal(signal.SIGTERM, _terminate)
+        self._running = True
+        util.set_pool(self.pool)
+        log.info('[daemon] listening on %s (pid %d)', self.path, os.getpid())
+        try:
+            while self._running:
+                self.handle_request()
+        except _Terminated:
+            log.info('[daemon] terminated')
+        finally:
+            util.set_pool(None)
+            self.pool.close()
+            self.server_close()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            log.info('[daemon] stopped after %d request(s)', self.requests)
+
+
+def status(path=None):
+    """Return info about running daemon.
+
+    Args:
+        path (str, optional): Path to daemon socket.
+
+    Returns:
+        dict: Daemon's PID, number of requests, uptime and connection
+            pool counters, or ``None`` if the daemon isn't running.
+
+    """
+    res = client.call(['ping'], path=path)
+    if res is None:
+        return None
+
+    return json.loads(res[1].decode('utf-8'))
+
+
+def stop(path=None):
+    """Ask running daemon to exit.
+
+    Args:
+        path (str, optional): Path to daemon socket.
+
+    Returns:
+        bool: `True` if a daemon was running.
+
+    """
+    return client.call(['stop'], path=path) is not None
+
+
+def serve(path, idle_timeout=IDLE_TIMEOUT):
+    """Run a daemon on socket ``path`` in this process.
+
+    Args:
+        path (str): Path to Unix domain socket.
+        idle_timeout (int, optional): Exit after this many idle seconds.
+
+    Returns:
+        bool: `False` if another daemon is already running.
+
+    """
+    try:
+        server = Server(path, idle_timeout)
+    except (RuntimeError, socket.error) as err:
+        log.info('[daemon] not starting: %s', err)
+        return False
+
+    server.serve()
+    return True
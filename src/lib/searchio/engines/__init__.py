@@ -28,6 +28,10 @@ Each `Variant` exports a `Search`, which is the actual
 model for fetching search suggestions and open search
 results.
 
+The models use ``__slots__``, as the shipped engines alone have
+hundreds of variants, and an engine's `Variant` objects are
+only created when first accessed.
+
 """
 
 from __future__ import print_function, absolute_import
@@ -129,6 +133,10 @@ class Engine(object):
     # e.g. "_attribute", not "attribute".
     _private = ('variants',)
 
+    # Variants hold weak references to their engine
+    __slots__ = ('uid', 'title', 'description', 'jsonpath', 'pcencode',
+                 '_variants', '_variant_objs', '__weakref__')
+
     @classmethod
     def from_dict(cls, d):
         """Create a new `Engine` from a dictionary.
@@ -173,16 +181,36 @@ class Engine(object):
         self.jsonpath = u'$[1][*]'
         self.pcencode = False
         self._variants = []
+        self._variant_objs = None
 
     @property
     def variants(self):
         """Engine variants.
 
+        Created on first access.
+
         Returns:
             list: Sequence of `Variant` objects for this engine.
 
         """
-        return [Variant.from_dict(self, d) for d in self._variants]
+        if self._variant_objs is None:
+            self._variant_objs = [Variant.from_dict(self, d)
+                                  for d in self._variants]
+
+        return self._variant_objs
+
+    @property
+    def variant_count(self):
+        """Number of variants.
+
+        Unlike ``len(engine.variants)``, doesn't create `Variant`
+        objects (or load them from the catalog).
+
+        Returns:
+            int: Number of variants.
+
+        """
+        return len(self._variants)
 
 
 class Variant(object):
@@ -203,6 +231,9 @@ class Variant(object):
     _optional = ('suggest_url', 'icon')
     _private = ('uid', 'icon')
 
+    __slots__ = ('_engine', '_uid', 'name', 'pcencode', 'title',
+                 'search_url', 'suggest_url', '_icon')
+
     @classmethod
     def from_dict(cls, engine, d):
         """Create a new `Variant` from an `Engine` and a `dict`.
@@ -299,15 +330,19 @@ class Search(object):
             of plus encoding).
         search_url (str): URL for search results.
         suggest_url (str): URL for search suggestions.
+        timeout (float): Seconds to wait for suggestions. If ``0``,
+            the ``SEARCHIO_TIMEOUT`` workflow variable is used.
         title (unicode): Full search title, e.g. "Google (English)".
         uid (str): UID of search. This is a combination of engine and
             variant UIDs.
 
     """
     _required = ('title', 'icon', 'jsonpath', 'search_url')
-    _optional = ('pcencode', 'suggest_url', 'keyword')
+    _optional = ('pcencode', 'suggest_url', 'keyword', 'timeout')
     _private = ()
 
+    __slots__ = _required + _optional + ('uid',)
+
     @classmethod
     def from_variant(cls, v):
         """Create a new `Search` from a `Variant`.
@@ -322,7 +357,7 @@ class Search(object):
         s = cls(v.uid)
 
         for k in cls._required + cls._optional:
-            setattr(s, k, getattr(v, k))
+            setattr(s, k, getattr(v, k, getattr(s, k)))
 
         return s
 
@@ -376,6 +411,7 @@ class Search(object):
         self.pcencode = False
         self.search_url = ''
         self.suggest_url = ''
+        self.timeout = 0
 
     @property
     def dict(self):
@@ -396,4 +432,7 @@ class Search(object):
         if self.suggest_url:
             d['suggest_url'] = self.suggest_url
 
+        if self.timeout:
+            d['timeout'] = self.timeout
+
         return d
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Indexed fuzzy filtering.
+
+A drop-in replacement for `workflow.Workflow.filter()`, which
+works out the lowercase version, capitals, "atoms" and initials
+of every item for every word of the query, and then sorts all
+the matches even if only a few are wanted.
+
+`FilterIndex` keeps a bitmask of the keys containing each
+character, so the keys that contain all the characters of the query
+(the only ones that can match) are found by ANDing the masks of the
+query's characters. Only those keys are scored, and their derived
+values are worked out once and kept. With ``max_results``, only the
+best matches are picked from a heap instead of sorting all of them.
+
+Results (and scores) are the same as `Workflow.filter()`'s, except
+that items with identical sort keys keep their original order.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import heapq
+import re
+import unicodedata
+
+from workflow.workflow import (
+    ASCII_REPLACEMENTS,
+    INITIALS,
+    MATCH_ALL,
+    MATCH_ALLCHARS,
+    MATCH_ATOM,
+    MATCH_CAPITALS,
+    MATCH_INITIALS_CONTAIN,
+    MATCH_INITIALS_STARTSWITH,
+    MATCH_STARTSWITH,
+    MATCH_SUBSTRING,
+    isascii,
+    split_on_delimiters,
+)
+
+# Indices keyed by search keys, so the same keys are only indexed
+# once per process.
+_indexes = {}
+# Max. number of indices to keep
+MAX_INDEXES = 8
+
+
+def fold(text):
+    """Same as `workflow.Workflow.fold_to_ascii()`."""
+    if isascii(text):
+        return text
+    text = ''.join([ASCII_REPLACEMENTS.get(c, c) for c in text])
+    return unicodedata.normalize('NFKD', text)
+
+
+class Key(object):
+    """Search key and the values derived from it.
+
+    Attributes:
+        atoms (list): Lowercase words of `value`.
+        capitals (unicode): Lowercase capitals and digits of `value`.
+        initials (unicode): First letters of `atoms`.
+        lower (unicode): Lowercase `value`.
+        value (unicode): Search key.
+
+    """
+
+    __slots__ = ('value', 'lower', 'capitals', 'atoms', 'initials')
+
+    def __init__(self, value, lower):
+        """Create new `Key` for ``value``."""
+        self.value = value
+        self.lower = lower
+        self.capitals = ''.join([c for c in value if c in INITIALS]).lower()
+        self.atoms = [s.lower() for s in split_on_delimiters(value)]
+        self.initials = ''.join([s[0] for s in self.atoms if s])
+
+
+class Word(object):
+    """One word of a query.
+
+    Attributes:
+        ascii (bool): Whether `query` is ASCII-only.
+        query (unicode): Lowercase word.
+        search (callable): Regex search for `MATCH_ALLCHARS`.
+
+    """
+
+    __slots__ = ('query', 'ascii', 'search')
+
+    def __init__(self, word):
+        """Create new `Word`."""
+        self.query = word.lower()
+        self.ascii = isascii(self.query)
+        pattern = ''.join(['.*?' + re.escape(c) for c in self.query])
+        self.search = re.compile(pattern, re.IGNORECASE).search
+
+    def score(self, k, match_on):
+        """Score `Key` ``k`` like `Workflow._filter_item()`.
+
+        ``k`` must contain all the characters of the word.
+
+        Returns:
+            tuple: ``(score, rule)``.
+
+        """
+        q = self.query
+        if match_on & MATCH_STARTSWITH and k.lower.startswith(q):
+            return (100.0 - (len(k.value) / len(q)), MATCH_STARTSWITH)
+
+        if match_on & MATCH_CAPITALS and k.capitals.startswith(q):
+            return (100.0 - (len(k.capitals) / len(q)), MATCH_CAPITALS)
+
+        if match_on & MATCH_ATOM and q in k.atoms:
+            return (100.0 - (len(k.value) / len(q)), MATCH_ATOM)
+
+        if match_on & MATCH_INITIALS_STARTSWITH and k.initials.startswith(q):
+            return (100.0 - (len(k.initials) / len(q)),
+                    MATCH_INITIALS_STARTSWITH)
+
+        elif match_on & MATCH_INITIALS_CONTAIN and q in k.initials:
+            return (95.0 - (len(k.initials) / len(q)), MATCH_INITIALS_CONTAIN)
+
+        if match_on & MATCH_SUBSTRING and q in k.lower:
+            return (90.0 - (len(k.value) / len(q)), MATCH_SUBSTRING)
+
+        if match_on & MATCH_ALLCHARS:
+            m = self.search(k.value)
+            if m:
+                return (100.0 / ((1 + m.start()) * (m.end() - m.start() + 1)),
+                        MATCH_ALLCHARS)
+
+        return (0, None)
+
+
+class Table(object):
+    """Search keys with diacritics folded or not.
+
+    Keeps a bitmask per character, with bit *i* set if key *i*
+    contains the character. ANDing the masks of a word's characters
+    gives the keys that could match it.
+
+    Masks and `Key` objects are created as they're needed.
+
+    """
+
+    def __init__(self, values, folded):
+        """Create new `Table` for stripped search keys ``values``."""
+        self.values = [fold(v) for v in values] if folded else values
+        self.lowers = [v.lower() for v in self.values]
+        self._masks = {}
+        self._keys = {}
+
+    def mask(self, c):
+        """Return bitmask of keys containing character ``c``."""
+        m = self._masks.get(c)
+        if m is None:
+            bits = ['1' if c in s else '0' for s in reversed(self.lowers)]
+            m = self._masks[c] = int(''.join(bits) or '0', 2)
+
+        return m
+
+    def candidates(self, word):
+        """Return bitmask of keys containing all characters of ``word``."""
+        m = -1
+        for c in set(word.query):
+            m &= self.mask(c)
+            if not m:
+                break
+
+        return m
+
+    def key(self, i):
+        """Return `Key` for value ``i``."""
+        k = self._keys.get(i)
+        if k is None:
+            k = self._keys[i] = Key(self.values[i], self.lowers[i])
+
+        return k
+
+
+class FilterIndex(object):
+    """Precomputed search keys for fuzzy filtering.
+
+    Attributes:
+        values (list): Search keys (stripped).
+
+    """
+
+    def __init__(self, values):
+        """Create new `FilterIndex` for search keys ``values``."""
+        self.values = [v.strip() for v in values]
+        self._sortkeys = [v.lower() for v in self.values]
+        self._tables = {}  # fold diacritics? -> `Table`
+
+    def table(self, folded):
+        """Return `Table` with diacritics folded or not.
+
+        Args:
+            folded (bool): Whether to fold diacritics.
+
+        Returns:
+            Table: Table of keys.
+
+        """
+        folded = bool(folded)
+        t = self._tables.get(folded)
+        if t is None:
+            t = self._tables[folded] = Table(self.values, folded)
+
+        return t
+
+    def search(self, query, ascending=False, min_score=0, max_results=0,
+               match_on=MATCH_ALL, fold_diacritics=True):
+        """Return indices of values that match ``query``.
+
+        Arguments are the same as `Workflow.filter()`'s.
+
+        Returns:
+            list: ``(index, score, rule)`` tuples, best match first.
+
+        """
+        words = [Word(w) for w in [s.strip() for s in query.split(' ')] if w]
+        tables = [self.table(fold_diacritics and w.ascii) for w in words]
+
+        # keys that contain all characters of every word
+        m = -1
+        for word, t in zip(words, tables):
+            m &= t.candidates(word)
+
+        bits = bin(m)[:1:-1] if m > 0 else ''
+        results = []
+        i = bits.find('1')
+        while i != -1:
+            score = 0
+            for word, t in zip(words, tables):
+                s, rule = word.score(t.key(i), match_on)
+                if not s:
+                    break
+                score += s
+            else:
+                if score and (not min_score or score > min_score):
+                    results.append((100.0 / score, self._sortkeys[i], score,
+                                    i, rule))
+
+            i = bits.find('1', i + 1)
+
+        if max_results and len(results) > max_results:
+            pick = heapq.nlargest if ascending else heapq.nsmallest
+            results = pick(max_results, results)
+        else:
+            results.sort(reverse=ascending)
+
+        return [(t[3], t[2], t[4]) for t in results]
+
+
+def index(values):
+    """Return (cached) `FilterIndex` for ``values``.
+
+    Args:
+        values (list): Search keys.
+
+    Returns:
+        FilterIndex: Index of ``values``.
+
+    """
+    values = tuple(values)
+    idx = _indexes.get(values)
+    if idx is None:
+        if len(_indexes) >= MAX_INDEXES:
+            _indexes.clear()
+        idx = _indexes[values] = FilterIndex(values)
+
+    return idx
+
+
+def filter(wf, query, items, key=lambda x: x, ascending=False,
+           include_score=False, min_score=0, max_results=0,
+           match_on=MATCH_ALL, fold_diacritics=True):
+    """Fuzzy filter ``items`` using a `FilterIndex`.
+
+    Takes the same arguments as `Workflow.filter()`, and also
+    respects the user's ``__workflow_diacritic_folding`` setting.
+
+    Args:
+        wf (workflow.Workflow): Active workflow object.
+        query (unicode): Query to filter items against.
+        items (list): Items to filter.
+        key (callable, optional): Return search key for item.
+
+    Returns:
+        list: ``items`` matching ``query`` or ``(item, score, rule)``
+            tuples if ``include_score`` is `True`.
+
+    """
+    if not query or not query.strip():
+        return items
+
+    fold_diacritics = wf.settings.get('__workflow_diacritic_folding',
+                                      fold_diacritics)
+    items = list(items)
+    idx = index([key(item) for item in items])
+    results = idx.search(query.strip(), ascending, min_score, max_results,
+                         match_on, fold_diacritics)
+
+    if include_score:
+        return [(items[i], score, rule) for i, score, rule in results]
+
+    return [items[i] for i, _, _ in results]
@@ -0,0 +1,438 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Precompiled JSON Path expressions.
+
+Parsing a JSON Path with `jsonpath_rw` means building a PLY lexer
+and parser, which costs milliseconds per call. The paths actually
+used by searches are almost always simple chains of indices,
+wildcards and field names (``$[1][*]``, ``[1]``,
+``$.suggestions[*].value``), so these are evaluated by a small
+hand-written matcher instead. Anything more complex is handed off
+to `jsonpath_rw`.
+
+Compiled expressions are memoised by path string, so each path is
+only compiled once per process.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import json
+import re
+
+from searchio import util
+
+log = util.logger(__name__)
+
+# Steps understood by the fast path
+_step = re.compile(r'\[(\d+)\]|\[(\*)\]|\.?([A-Za-z_][A-Za-z0-9_\-]*)')
+
+# Compiled expressions keyed by path string
+_cache = {}
+
+
+class Expression(object):
+    """A compiled JSON Path.
+
+    Attributes:
+        path (unicode): The JSON Path this expression was compiled from.
+
+    """
+
+    def __init__(self, path):
+        """Create new `Expression` for `path`."""
+        self.path = path
+
+    def find(self, data):
+        """Return values in ``data`` matched by this expression.
+
+        Args:
+            data (object): Deserialised JSON.
+
+        Returns:
+            list: Matched values.
+
+        """
+        raise NotImplementedError
+
+    def stream(self, chunks, max_results=0):
+        """Return values matched in JSON text read from ``chunks``.
+
+        This implementation reads all the text before matching.
+
+        Args:
+            chunks (iterator): Pieces of JSON text (unicode).
+            max_results (int, optional): Max. number of values
+                to return.
+
+        Returns:
+            list: Matched values.
+
+        """
+        values = self.find(json.loads(''.join(chunks)))
+        return values[:max_results] if max_results else values
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self.path)
+
+
+class SimpleExpression(Expression):
+    """Fast-path expression for chains of indices, wildcards and fields.
+
+    Matches the semantics of the equivalent `jsonpath_rw` expression.
+
+    Attributes:
+        steps (tuple): Sequence of ``(kind, arg)`` tuples, where
+            ``kind`` is one of ``index``, ``slice`` or ``field``.
+
+    """
+
+    def __init__(self, path, steps):
+        """Create new `SimpleExpression` from parsed steps."""
+        super(SimpleExpression, self).__init__(path)
+        self.steps = steps
+
+    def find(self, data):
+        """Return values in ``data`` matched by this expression."""
+        return _find(self.steps, data)
+
+    def stream(self, chunks, max_results=0):
+        """Return values matched in JSON text read from ``chunks``.
+
+        The text is scanned as it arrives, and only matched values
+        are decoded. No more chunks are read once ``max_results``
+        values have been found or no more values can match, e.g.
+        after the second element for ``$[1][*]``.
+
+        Args:
+            chunks (iterator): Pieces of JSON text (unicode).
+            max_results (int, optional): Max. number of values
+                to return.
+
+        Returns:
+            list: Matched values.
+
+        """
+        values = []
+        for v in self._walk(_Scanner(chunks), 0):
+            values.append(v)
+            if len(values) == max_results:
+                break
+
+        return values
+
+    def _walk(self, sc, i):
+        """Yield matches for ``steps[i:]`` of the value at ``sc.pos``.
+
+        Leaves the scanner after the value, except when no more
+        values can match (there's no wildcard in ``steps[:i]``).
+
+        """
+        if i == len(self.steps):
+            yield sc.value()
+            return
+
+        kind, arg = self.steps[i]
+        last = 'slice' not in [k for k, _ in self.steps[:i]]
+        c = sc.peek()
+        if kind in ('index', 'slice') and c == '[':
+            sc.pos += 1
+            for n, _ in enumerate(sc.items(']')):
+                if kind == 'slice' or n == arg:
+                    for v in self._walk(sc, i + 1):
+                        yield v
+                    if kind == 'index' and last:
+                        return
+                else:
+                    sc.skip()
+
+        elif kind == 'field' and c == '{':
+            sc.pos += 1
+            for key in sc.items('}'):
+                if key == arg:
+                    for v in self._walk(sc, i + 1):
+                        yield v
+                    if last:
+                        return
+                else:
+                    sc.skip()
+
+        else:  # not a container this step can descend into
+            for v in _find(self.steps[i:], sc.value()):
+                yield v
+
+
+def _find(steps, data):
+    """Return values in ``data`` matched by fast-path ``steps``."""
+    values = [data]
+    for kind, arg in steps:
+        matched = []
+        for v in values:
+            if kind == 'index':
+                if isinstance(v, (list, tuple, str)) and len(v) > arg:
+                    matched.append(v[arg])
+
+            elif kind == 'slice':
+                if isinstance(v, (list, tuple)):
+                    matched.extend(v)
+                # `jsonpath_rw` wraps scalars & objects in a list
+                elif isinstance(v, (dict, int, str)):
+                    matched.append(v)
+
+            elif isinstance(v, dict) and arg in v:  # field
+                matched.append(v[arg])
+
+        values = matched
+
+    return values
+
+
+class _Scanner(object):
+    """Incremental reader of JSON text from a sequence of chunks.
+
+    Only as many chunks are pulled from the iterator as are needed
+    to get to the current position.
+
+    Attributes:
+        buf (unicode): Text read so far (minus consumed prefix).
+        pos (int): Current position in `buf`.
+
+    """
+
+    # Characters that change nesting while skipping a value
+    _special = re.compile(r'["\[\]{}]')
+    # End of a scalar (number, true, false, null)
+    _delim = re.compile(r'[\s,\]}:]')
+
+    def __init__(self, chunks):
+        """Create new `_Scanner` reading from iterator ``chunks``."""
+        self._chunks = chunks
+        self.buf = ''
+        self.pos = 0
+        self._eof = False
+        self._hold = None  # start of value being captured
+
+    def more(self):
+        """Append another chunk to `buf`.
+
+        Returns:
+            bool: `False` if there are no more chunks.
+
+        """
+        if self._eof:
+            return False
+
+        for chunk in self._chunks:
+            if chunk:
+                self.buf += chunk
+                return True
+
+        self._eof = True
+        return False
+
+    def peek(self):
+        """Return next non-whitespace character or ``''`` at EOF."""
+        # Drop consumed text unless a value is being captured
+        if self.pos > 65536 and self._hold is None:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.more():
+                return ''
+
+    def expect(self, c):
+        """Consume character ``c`` (after any whitespace)."""
+        if self.peek() != c:
+            raise ValueError('expected {!r} at offset {}'.format(c, self.pos))
+        self.pos += 1
+
+    def _find(self, pattern, start):
+        """Return match of ``pattern`` at or after ``start``."""
+        while True:
+            m = pattern.search(self.buf, start)
+            if m:
+                return m
+            if not self.more():
+                return None
+
+    def _skip_string(self):
+        """Move past the string starting at `pos`."""
+        i = self.pos + 1
+        while True:
+            j = self.buf.find('"', i)
+            if j == -1:
+                i = len(self.buf)
+                if not self.more():
+                    raise ValueError('unterminated string')
+                continue
+
+            n = 0  # count preceding backslashes
+            while self.buf[j - n - 1] == '\\':
+                n += 1
+            if n % 2 == 0:
+                self.pos = j + 1
+                return
+            i = j + 1
+
+    def skip(self):
+        """Move past the value starting at the current position."""
+        c = self.peek()
+        if c == '"':
+            self._skip_string()
+
+        elif c in '[{':
+            depth = 0
+            while True:
+                c = self.peek()
+                if c == '"':
+                    self._skip_string()
+                    continue
+                if c in '[{':
+                    depth += 1
+                elif c in ']}':
+                    depth -= 1
+                self.pos += 1
+                if not depth:
+                    return
+                m = self._find(self._special, self.pos)
+                if not m:
+                    raise ValueError('unterminated container')
+                self.pos = m.start()
+
+        elif c:
+            m = self._find(self._delim, self.pos)
+            self.pos = m.start() if m else len(self.buf)
+
+        else:
+            raise ValueError('unexpected end of JSON')
+
+    def value(self):
+        """Decode and return the value at the current position."""
+        self.peek()
+        self._hold = start = self.pos
+        try:
+            self.skip()
+        finally:
+            self._hold = None
+
+        return json.loads(self.buf[start:self.pos])
+
+    def items(self, close):
+        """Yield once per element of the container just opened.
+
+        The caller must consume (or skip) the element's value
+        before advancing the generator, and the key and colon
+        of object members have already been consumed.
+
+        Yields:
+            unicode: Key of member (objects only) or ``None``.
+
+        """
+        if self.peek() == close:
+            self.pos += 1
+            return
+
+        while True:
+            key = None
+            if close == '}':
+                key = self.value()
+                self.expect(':')
+            yield key
+            c = self.peek()
+            self.pos += 1
+            if c == close:
+                return
+            if c != ',':
+                raise ValueError('expected "," or {!r}'.format(close))
+
+
+class ParsedExpression(Expression):
+    """Expression evaluated by `jsonpath_rw`."""
+
+    def __init__(self, path):
+        """Parse ``path`` with `jsonpath_rw`."""
+        from jsonpath_rw import parse
+
+        super(ParsedExpression, self).__init__(path)
+        self._jx = parse(path)
+
+    def find(self, data):
+        """Return values in ``data`` matched by this expression."""
+        return [m.value for m in self._jx.find(data)]
+
+
+def _parse_simple(path):
+    """Split ``path`` into fast-path steps.
+
+    Args:
+        path (unicode): JSON Path.
+
+    Returns:
+        tuple: ``(kind, arg)`` steps or ``None`` if ``path`` is
+            too complex for the fast path.
+
+    """
+    s = path.strip()
+    if s.startswith('$'):
+        s = s[1:]
+
+    steps = []
+    i = 0
+    while i < len(s):
+        m = _step.match(s, i)
+        # Field names must follow a dot, except at the very start
+        if not m or (m.group(3) and i and s[i] != '.'):
+            return None
+
+        index, star, field = m.groups()
+        if index is not None:
+            steps.append(('index', int(index)))
+        elif star:
+            steps.append(('slice', None))
+        else:
+            steps.append(('field', field))
+
+        i = m.end()
+
+    return tuple(steps)
+
+
+def compile(path):
+    """Return compiled `Expression` for JSON Path.
+
+    Results are memoised, so repeated calls with the same path
+    are dictionary lookups.
+
+    Args:
+        path (unicode): JSON Path.
+
+    Returns:
+        Expression: Compiled expression.
+
+    """
+    jx = _cache.get(path)
+    if jx is not None:
+        return jx
+
+    steps = _parse_simple(path)
+    if steps is not None:
+        jx = SimpleExpression(path, steps)
+    else:
+        log.debug('[jpath] no fast path for %r', path)
+        jx = ParsedExpression(path)
+
+    _cache[path] = jx
+    return jx
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Workflow metadata without parsing info.plist.
+
+When Alfred's variables aren't set (e.g. when running ``searchio``
+in a shell), `workflow.Workflow` gets the workflow's name, bundle
+ID and version from info.plist, which holds every generated Script
+Filter and is parsed in full to get at them.
+
+The `Workflow` here reads them from a sidecar file next to
+info.plist instead (`FILENAME`), which is rewritten whenever
+``reload`` or ``add`` rewrites info.plist (see `save()`), and
+regenerated if info.plist has changed since (see `load()`).
+`Workflow` only reads it when Alfred's variables aren't set.
+
+Importing the module also registers `searchio.results.ResultsSerializer`
+with `workflow.manager`, so the compact format can be used by name
+with the `Workflow`'s caching methods.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import json
+import os
+
+from workflow import Workflow3
+from workflow.workflow import BaseSerializer, manager
+from workflow.util import atomic_writer
+
+from searchio import util
+from searchio.results import SERIALIZER, ResultsSerializer
+
+log = util.logger(__name__)
+
+# Sidecar file in the workflow directory
+FILENAME = 'info.json'
+
+# Keys of info.plist saved in sidecar
+KEYS = ('bundleid', 'name', 'version')
+
+
+def _stamp(plist):
+    st = os.stat(plist)
+    return [st.st_size, st.st_mtime]
+
+
+def load(workflowdir):
+    """Return metadata of workflow in ``workflowdir``.
+
+    The sidecar file is regenerated from info.plist if it's
+    missing or older than info.plist.
+
+    Args:
+        workflowdir (str): Directory info.plist is in.
+
+    Returns:
+        dict: Values of `KEYS` in info.plist.
+
+    """
+    plist = os.path.join(workflowdir, 'info.plist')
+    try:
+        with open(os.path.join(workflowdir, FILENAME)) as fp:
+            data = json.load(fp)
+        if data['stamp'] == _stamp(plist):
+            return data['info']
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        pass
+
+    import plistlib
+
+    log.debug('[metadata] reading info.plist ...')
+    with open(plist, 'rb') as fp:
+        return save(workflowdir, plistlib.load(fp))
+
+
+def save(workflowdir, info):
+    """Save metadata of workflow in ``workflowdir``.
+
+    Call after writing info.plist. A workflow directory that isn't
+    writable is logged, not an error.
+
+    Args:
+        workflowdir (str): Directory info.plist is in.
+        info (dict): Contents of info.plist.
+
+    Returns:
+        dict: Values of `KEYS` in ``info``.
+
+    """
+    d = dict([(k, info.get(k)) for k in KEYS])
+    data = dict(stamp=_stamp(os.path.join(workflowdir, 'info.plist')),
+                info=d)
+    try:
+        with atomic_writer(os.path.join(workflowdir, FILENAME), 'w') as fp:
+            json.dump(data, fp)
+    except (IOError, OSError) as err:
+        log.warning("[metadata] couldn't save %s: %s", FILENAME, err)
+
+    return d
+
+
+class Workflow(Workflow3):
+    """`Workflow3` that reads metadata from the sidecar file.
+
+    `Workflow.info` only contains `KEYS`.
+
+    """
+
+    def _load_info_plist(self):
+        self._info = load(self.workflowdir)
+        self._info_loaded = True
+
+
+class WorkflowResultsSerializer(ResultsSerializer, BaseSerializer):
+    """`ResultsSerializer` with the file methods `Workflow` needs.
+
+    `ResultsSerializer` itself doesn't import `workflow`, which the
+    cache doesn't otherwise need.
+
+    """
+
+
+manager.register(SERIALIZER, WorkflowResultsSerializer)
@@ -0,0 +1,316 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Per-search latency and cache metrics.
+
+Every search Alfred waits for appends a fixed-size `Record` to a
+`MetricsLog` in the cache directory: how it was answered (from the
+cache, the network, etc.), the HTTP status, the bytes read and how
+long it took in total and in each phase. The phase timings are the
+`searchio.trace` spans totalled by `trace.measure()`.
+
+Writing a record is a single small append to a file opened with
+``O_APPEND``, so processes don't need to lock the log. When the log
+reaches its maximum size, it's renamed to ``<name>.1`` (replacing
+the previous one) and a new log is started, so at most twice
+`MAX_RECORDS` records are kept. Only rotating the log takes a lock
+(see `MetricsLog.append()`).
+
+``searchio stats`` aggregates the log with `summarise()`.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import fcntl
+import math
+import os
+import struct
+import time
+
+from searchio import util
+
+log = util.logger(__name__)
+
+# Max. number of records per log file
+MAX_RECORDS = 10000
+
+# How a search was answered. Index is stored in log.
+OUTCOMES = (
+    'hit',          # fresh cached suggestions
+    'stale',        # expired cached suggestions, refreshed in background
+    'provisional',  # suggestions for a cached prefix of the query
+    'miss',         # fetched from the network
+    'coalesced',    # waited for another process's fetch
+    'cancelled',    # superseded by a newer query
+    'timeout',      # deadline exceeded
+    'error',        # search failed
+)
+
+# Outcomes that count as cache hits
+HITS = ('hit', 'stale', 'coalesced')
+
+# Phases (`searchio.trace` spans) timed in each record
+PHASES = ('cache lookup', 'network', 'jsonpath')
+
+# Max. length of search UID in bytes. Longer UIDs are truncated.
+UID_SIZE = 48
+
+# time, outcome, HTTP status, bytes read, total µs, µs per phase, UID
+_record = struct.Struct('<dBxHII{}I{}s'.format(len(PHASES), UID_SIZE))
+
+
+class Record(object):
+    """Metrics of one search.
+
+    Attributes:
+        bytes (int): Bytes of HTTP response read.
+        outcome (str): One of `OUTCOMES`.
+        phases (dict): Seconds spent in each of `PHASES`.
+        status (int): HTTP status or 0 if there was no request.
+        time (float): UNIX timestamp of search.
+        total (float): Seconds the search took.
+        uid (str): UID of search.
+
+    """
+
+    __slots__ = ('time', 'uid', 'outcome', 'status', 'bytes', 'total',
+                 'phases')
+
+    def __init__(self, uid, outcome, total, phases=None, status=0,
+                 bytes=0, time=None):
+        """Create new `Record`."""
+        self.uid = uid
+        self.outcome = outcome
+        self.total = total
+        self.phases = phases or {}
+        self.status = status
+        self.bytes = bytes
+        self.time = time
+
+    @classmethod
+    def from_totals(cls, uid, totals):
+        """Create `Record` from spans totalled by `trace.measure()`.
+
+        Args:
+            uid (str): UID of search.
+            totals (searchio.trace.Totals): Spans of search.
+
+        Returns:
+            Record: Metrics of search.
+
+        """
+        args = totals.args
+        return cls(uid, args.get('outcome', 'miss'), totals.elapsed,
+                   dict([(k, totals.durations.get(k, 0.0)) for k in PHASES]),
+                   args.get('status') or 0, args.get('bytes_read') or 0)
+
+    def pack(self):
+        """Return record as `bytes`."""
+        values = [self.time or time.time(), OUTCOMES.index(self.outcome),
+                  min(self.status, 0xffff), min(self.bytes, 0xffffffff),
+                  int(self.total * 1e6)]
+        values += [int(self.phases.get(k, 0.0) * 1e6) for k in PHASES]
+        values.append(self.uid.encode('utf-8')[:UID_SIZE])
+        return _record.pack(*values)
+
+    @classmethod
+    def unpack(cls, data):
+        """Create `Record` from `bytes` returned by `pack()`."""
+        values = _record.unpack(data)
+        t, outcome, status, size, total = values[:5]
+        phases = dict([(k, v / 1e6) for k, v in zip(PHASES, values[5:-1])])
+        uid = values[-1].rstrip(b'\0').decode('utf-8', 'ignore')
+        return cls(uid, OUTCOMES[outcome], total / 1e6, phases, status, size,
+                   t)
+
+
+class MetricsLog(object):
+    """Append-only log of fixed-size `Record` objects.
+
+    Attributes:
+        max_records (int): Records per file before log is rotated.
+        path (str): Path to log.
+
+    """
+
+    def __init__(self, path, max_records=MAX_RECORDS):
+        """Create new `MetricsLog` at ``path``."""
+        self.path = path
+        self.max_records = max_records
+
+    def append(self, record):
+        """Add ``record`` to the log.
+
+        Errors are logged, not raised, so a full disk or the like
+        can't break a search.
+
+        Several processes may fill the log at the same time. They
+        rotate it while holding a lock on it, and only if `path`
+        is still the log they wrote to, so a process that comes
+        second doesn't rename a newly started log over the full one.
+
+        """
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                         0o600)
+            try:
+                os.write(fd, record.pack())
+                st = os.fstat(fd)
+                if st.st_size >= self.max_records * _record.size:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                    if _same_file(self.path, st):
+                        os.replace(self.path, self.path + '.1')
+            finally:
+                os.close(fd)  # releases lock
+        except (IOError, OSError) as err:
+            log.error('[metrics] could not write %s: %s', self.path, err)
+
+    def records(self):
+        """Return all records, oldest first.
+
+        Returns:
+            list: `Record` objects.
+
+        """
+        records = []
+        for p in (self.path + '.1', self.path):
+            try:
+                with open(p, 'rb') as fp:
+                    data = fp.read()
+            except (IOError, OSError):
+                continue
+
+            n = len(data) - len(data) % _record.size  # ignore torn write
+            for i in range(0, n, _record.size):
+                try:
+                    records.append(Record.unpack(data[i:i + _record.size]))
+                except (IndexError, struct.error):  # corrupt record
+                    continue
+
+        return records
+
+    def clear(self):
+        """Delete all records."""
+        for p in (self.path + '.1', self.path):
+            if os.path.exists(p):
+                os.unlink(p)
+
+
+def _same_file(path, st):
+    """Return `True` if ``path`` is the file ``st`` is the stat of."""
+    try:
+        other = os.stat(path)
+    except OSError:  # already rotated
+        return False
+    return (other.st_dev, other.st_ino) == (st.st_dev, st.st_ino)
+
+
+def percentile(values, p):
+    """Return ``p``-th percentile of sorted ``values``.
+
+    Uses the nearest-rank method, so the result is always one of
+    ``values``.
+
+    Args:
+        values (list): Sorted numbers.
+        p (float): Percentile between 0 and 100.
+
+    Returns:
+        float: Percentile or ``None`` if ``values`` is empty.
+
+    """
+    if not values:
+        return None
+
+    i = int(math.ceil(len(values) * p / 100.0)) - 1
+    return values[min(max(i, 0), len(values) - 1)]
+
+
+class Summary(object):
+    """Aggregated metrics of a search (or all searches).
+
+    Attributes:
+        bytes (int): Total bytes of HTTP responses read.
+        count (int): Number of searches.
+        fetched (int): Number of searches that read a response.
+        latencies (list): Sorted total times of searches in seconds.
+        network (list): Sorted times of HTTP requests in seconds.
+        outcomes (dict): Number of searches by outcome.
+        uid (str): UID of search or ``None`` for all searches.
+
+    """
+
+    def __init__(self, uid=None):
+        """Create new `Summary`."""
+        self.uid = uid
+        self.count = 0
+        self.fetched = 0
+        self.bytes = 0
+        self.latencies = []
+        self.network = []
+        self.outcomes = dict([(k, 0) for k in OUTCOMES])
+
+    def add(self, record):
+        """Add ``record`` to summary."""
+        self.count += 1
+        self.outcomes[record.outcome] += 1
+        self.latencies.append(record.total)
+        if record.status:
+            self.fetched += 1
+            self.bytes += record.bytes
+            self.network.append(record.phases.get('network', 0.0))
+
+    @property
+    def hit_ratio(self):
+        """Fraction of searches answered from the cache."""
+        if not self.count:
+            return 0.0
+
+        return sum([self.outcomes[k] for k in HITS]) / float(self.count)
+
+    @property
+    def failed(self):
+        """Number of searches that timed out or failed."""
+        return self.outcomes['timeout'] + self.outcomes['error']
+
+    def latency(self, p):
+        """Return ``p``-th percentile of search times in seconds."""
+        return percentile(self.latencies, p)
+
+    def network_latency(self, p):
+        """Return ``p``-th percentile of HTTP request times in seconds."""
+        return percentile(self.network, p)
+
+
+def summarise(records):
+    """Aggregate ``records`` by search.
+
+    Args:
+        records (list): `Record` objects.
+
+    Returns:
+        tuple: `Summary` of all searches and `dict` of a `Summary`
+            for each search, keyed by UID.
+
+    """
+    total = Summary()
+    searches = {}
+    for r in records:
+        total.add(r)
+        if r.uid not in searches:
+            searches[r.uid] = Summary(r.uid)
+        searches[r.uid].add(r)
+
+    for s in [total] + list(searches.values()):
+        s.latencies.sort()
+        s.network.sort()
+
+    return total, searches
@@ -0,0 +1,359 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Pool of persistent HTTP connections.
+
+`workflow.web` opens a new connection (and does a new TLS
+handshake) for every request. In a long-running process, such
+as the daemon, that's the most expensive part of fetching
+suggestions, so `ConnectionPool` keeps idle connections open
+per host and reuses them.
+
+Only ``GET`` is supported, redirects aren't followed (like
+`workflow.web.get`) and proxies are not used.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import http.client
+import json
+import os
+import threading
+import time
+from urllib.error import HTTPError
+from urllib.parse import urlsplit
+
+from workflow import web
+
+from searchio import util
+
+log = util.logger(__name__)
+
+# Max. number of idle connections kept per host
+MAX_SIZE = 4
+# Close connections that have been idle this many seconds
+IDLE_TIMEOUT = 60
+# Socket timeout
+TIMEOUT = 60
+# Read up to this many unread bytes of a closed stream to keep
+# its connection, instead of closing it
+DRAIN_SIZE = 16384
+
+# Errors that mean a kept-alive connection was closed by the server
+_stale_errors = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                 ConnectionResetError, BrokenPipeError)
+
+
+class Response(object):
+    """Response returned by `ConnectionPool.get()`.
+
+    Provides the parts of `workflow.web.Response` that
+    `util.getjson()` uses.
+
+    A streamed response reads its body with `iter_content()`.
+    Its connection goes back to the pool once the body has been
+    read, and is closed by `close()` if it hasn't.
+
+    Attributes:
+        bytes_read (int): Number of (compressed) bytes read.
+        content (bytes): Response body (decompressed) or ``None``
+            if the response is streamed.
+        headers (http.client.HTTPMessage): Response headers.
+        reason (str): HTTP reason phrase.
+        status_code (int): HTTP status.
+        url (str): URL that was requested.
+
+    """
+
+    def __init__(self, url, status_code, reason, headers, content,
+                 bytes_read=0, body=None, done=None, sock=None):
+        """Create new `Response`.
+
+        Args:
+            body (http.client.HTTPResponse, optional): Unread body
+                of a streamed response.
+            done (callable, optional): Called with `True` once
+                ``body`` has been read, or `False` if it's closed
+                before then.
+            sock (socket.socket, optional): Socket ``body`` is
+                read from.
+
+        """
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.bytes_read = bytes_read
+        self._body = body
+        self._done = done
+        self._sock = sock
+
+    def iter_content(self, chunk_size=4096, deadline=None):
+        """Iterate over (decompressed) body of streamed response.
+
+        Each read returns whatever has arrived (up to ``chunk_size``
+        bytes), so a server that sends the body slowly can't keep
+        the caller from checking ``deadline``. If it's exceeded, the
+        connection is closed, not drained or reused.
+
+        Args:
+            chunk_size (int, optional): Max. bytes to read at a time.
+            deadline (searchio.util.Deadline, optional): Time budget
+                for the whole body. The socket timeout is set to the
+                time left before every read.
+
+        Yields:
+            bytes: Decompressed data.
+
+        Raises:
+            TimeoutError: Raised if ``deadline`` is exceeded.
+
+        """
+        decoder = web.content_decoder({
+            'content-encoding': self.headers.get('Content-Encoding')})
+        while True:
+            try:
+                if deadline is not None:
+                    self._sock.settimeout(deadline.remaining())
+                chunk = self._body.read1(chunk_size)
+            except Exception:
+                self._finish(False)
+                raise
+
+            if not chunk:
+                break
+
+            self.bytes_read += len(chunk)
+            yield decoder.decompress(chunk) if decoder else chunk
+
+        if decoder:
+            yield decoder.flush()
+
+        self._finish(True)
+
+    def close(self):
+        """Discard the unread part of a streamed response.
+
+        If it's no more than `DRAIN_SIZE` bytes, it's read, so the
+        connection can go back to the pool.
+
+        """
+        if not self._done:
+            return
+
+        left = DRAIN_SIZE
+        while left > 0:
+            data = self._body.read(min(left, 8192))
+            if not data:
+                self._finish(True)
+                return
+
+            self.bytes_read += len(data)
+            left -= len(data)
+
+        self._finish(False)
+
+    def _finish(self, complete):
+        if self._done:
+            done, self._done = self._done, None
+            done(complete)
+
+    @property
+    def encoding(self):
+        """Charset from ``Content-Type`` header or ``None``."""
+        return self.headers.get_content_charset()
+
+    def json(self):
+        """Decode response contents as JSON.
+
+        Returns:
+            object: Object decoded from JSON.
+
+        """
+        if self.encoding:
+            return json.loads(self.content.decode(self.encoding, 'replace'))
+
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        """Raise `HTTPError` if status isn't 2xx."""
+        if not 200 <= self.status_code < 300:
+            raise HTTPError(self.url, self.status_code, self.reason,
+                            self.headers, None)
+
+
+class ConnectionPool(object):
+    """Per-host pool of persistent HTTP(S) connections.
+
+    Safe to use from several threads.
+
+    Attributes:
+        idle_timeout (int): Seconds after which an idle connection
+            is closed instead of reused.
+        maxsize (int): Max. number of idle connections kept per host.
+        stats (dict): Counters: ``requests``, ``connections``
+            (new connections opened), ``reused`` and ``discarded``
+            (idle connections closed because they expired or the
+            pool was full).
+        timeout (int): Socket timeout in seconds.
+
+    """
+
+    def __init__(self, maxsize=MAX_SIZE, idle_timeout=IDLE_TIMEOUT,
+                 timeout=TIMEOUT):
+        """Create new `ConnectionPool`."""
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.stats = dict(requests=0, connections=0, reused=0, discarded=0)
+        self._idle = {}  # (scheme, host, port) -> [(conn, released)]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls):
+        """Create a pool configured by workflow variables.
+
+        ``SEARCHIO_POOL_SIZE`` sets `maxsize` and
+        ``SEARCHIO_POOL_IDLE`` sets `idle_timeout`.
+
+        Returns:
+            ConnectionPool: Configured pool.
+
+        """
+        maxsize = int(os.getenv('SEARCHIO_POOL_SIZE') or MAX_SIZE)
+        idle = int(os.getenv('SEARCHIO_POOL_IDLE') or IDLE_TIMEOUT)
+        return cls(maxsize, idle)
+
+    def _count(self, key, n=1):
+        with self._lock:
+            self.stats[key] += n
+
+    def _acquire(self, key):
+        """Return ``(connection, reused)`` for host ``key``."""
+        now = time.time()
+        with self._lock:
+            idle = self._idle.get(key) or []
+            while idle:
+                conn, released = idle.pop()
+                if now - released < self.idle_timeout:
+                    self.stats['reused'] += 1
+                    return conn, True
+
+                conn.close()
+                self.stats['discarded'] += 1
+
+            self.stats['connections'] += 1
+
+        scheme, host, port = key
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(host, port,
+                                               timeout=self.timeout)
+        else:
+            conn = http.client.HTTPConnection(host, port,
+                                              timeout=self.timeout)
+        return conn, False
+
+    def _release(self, key, conn):
+        """Return ``conn`` to the pool."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append((conn, time.time()))
+                return
+
+            self.stats['discarded'] += 1
+
+        conn.close()
+
+    def get(self, url, headers=None, timeout=None, connect_timeout=None,
+            stream=False):
+        """Fetch ``url``, reusing an idle connection if possible.
+
+        Args:
+            url (str): URL to fetch.
+            headers (dict, optional): Additional HTTP headers.
+            timeout (float, optional): Socket timeout for this
+                request. Defaults to `timeout`.
+            connect_timeout (float, optional): Timeout for opening
+                a new connection. Defaults to ``timeout``.
+            stream (bool, optional): Don't read the body, but leave
+                it to `Response.iter_content()`.
+
+        Returns:
+            Response: Server's response.
+
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        hdrs = {
+            'User-Agent': web.USER_AGENT,
+            'Accept': 'application/json, text/plain, */*',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate',
+        }
+        hdrs.update(headers or {})
+
+        timeout = timeout or self.timeout
+        self._count('requests')
+        while True:
+            conn, reused = self._acquire(key)
+            try:
+                if not reused:
+                    conn.timeout = connect_timeout or timeout
+                    conn.connect()
+                conn.sock.settimeout(timeout)
+                conn.request('GET', path, headers=hdrs)
+                r = conn.getresponse()
+                content = None if stream else r.read()
+            except _stale_errors:
+                conn.close()
+                if reused:  # server closed kept-alive connection; retry
+                    log.debug('[pool] stale connection to %s', parts.netloc)
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+
+            break
+
+        def done(complete):
+            if complete and not r.will_close:
+                self._release(key, conn)
+            else:
+                conn.close()
+
+        if stream:
+            return Response(url, r.status, r.reason, r.msg, None,
+                            body=r, done=done, sock=conn.sock)
+
+        done(True)
+        size = len(content)
+        decoder = web.content_decoder({
+            'content-encoding': r.getheader('Content-Encoding')})
+        if decoder:
+            content = decoder.decompress(content) + decoder.flush()
+
+        return Response(url, r.status, r.reason, r.msg, content, size)
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            for idle in self._idle.values():
+                for conn, _ in idle:
+                    conn.close()
+
+            self._idle = {}
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Per-host rate limiting shared by all searchio processes.
+
+Each host gets a token bucket: requests take a token, and tokens
+are refilled at a fixed rate up to a maximum (the burst size).
+Alfred runs a new process for every keystroke, so the buckets are
+kept in a JSON file that processes update under a lock.
+
+Only hosts listed in `LIMITS` are limited.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import fcntl
+import json
+import os
+from time import time
+
+from searchio import util
+
+log = util.logger(__name__)
+
+# Hosts to limit and their ``(requests per second, burst size)``.
+# A key matches the host and its subdomains.
+LIMITS = {
+    'wikipedia.org': (10, 5),
+}
+
+
+class RateLimiter(object):
+    """Token buckets for hosts, persisted in a file.
+
+    Attributes:
+        limits (dict): Limits for hosts (see `LIMITS`).
+        path (str): Path to JSON file containing buckets.
+
+    """
+
+    def __init__(self, path, limits=None):
+        """Create new `RateLimiter` storing buckets at ``path``."""
+        self.path = path
+        self.limits = LIMITS if limits is None else limits
+
+    def limit(self, host):
+        """Return limit for ``host``.
+
+        Args:
+            host (str): Hostname.
+
+        Returns:
+            tuple: ``(rate, burst)`` or ``None`` if ``host``
+                isn't limited.
+
+        """
+        host = host or ''
+        for domain, limit in self.limits.items():
+            if host == domain or host.endswith('.' + domain):
+                return limit
+
+        return None
+
+    def reserve(self, host, max_wait=None):
+        """Take a token from ``host``'s bucket.
+
+        If the bucket is empty, the token is taken from the future,
+        and the caller must wait until it would have been added.
+
+        Args:
+            host (str): Hostname.
+            max_wait (float, optional): Don't take a token if the
+                caller would have to wait longer than this.
+
+        Returns:
+            float: Seconds to wait before sending the request, or
+                ``None`` if that would be longer than ``max_wait``.
+
+        """
+        limit = self.limit(host)
+        if not limit:
+            return 0
+
+        rate, burst = limit
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT)
+        with os.fdopen(fd, 'r+') as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX)
+            try:
+                buckets = json.load(fp)
+            except ValueError:  # new file
+                buckets = {}
+
+            now = time()
+            tokens, updated = buckets.get(host, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            wait = 0 if tokens >= 1 else (1 - tokens) / float(rate)
+            if max_wait is not None and wait > max_wait:
+                log.debug('[ratelimit] %s: wait of %0.2fs is too long',
+                          host, wait)
+                return None
+
+            buckets[host] = (tokens - 1, now)
+            fp.seek(0)
+            fp.truncate()
+            json.dump(buckets, fp)
+
+        if wait:
+            log.debug('[ratelimit] %s: waiting %0.2fs', host, wait)
+
+        return wait
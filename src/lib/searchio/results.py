@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Suggestion results and their compact cache format.
+
+A search's cached suggestions used to be pickled `Result` tuples,
+each repeating the search's title and a full result URL. All the
+results of one search share the title and URL template, so
+`ResultsSerializer` stores those once in a header, followed by the
+terms as length-prefixed UTF-8, compressed with zlib if that makes
+them smaller. When loaded, each `Result` builds its URL from the
+template the first time it's asked for it.
+
+Anything else (e.g. results from different searches) is pickled,
+and blobs without the compact format's magic are unpickled, so
+entries cached before the format was introduced can still be read.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+from array import array
+import pickle
+import sys
+import zlib
+
+from searchio import util
+
+log = util.logger(__name__)
+
+# Name of serializer, and extension of `FileStore` files
+SERIALIZER = 'results'
+
+# Start of compact blobs
+MAGIC = b'SRR\x01'
+
+# Flags
+_ZLIB = 0x01
+_PCENCODE = 0x02
+
+# Don't bother compressing payloads smaller than this
+MIN_COMPRESS = 128
+
+
+class Result(object):
+    """A suggested search term.
+
+    Attributes:
+        source (unicode): Title of search that suggested `term`.
+        term (unicode): Suggested term.
+        url (unicode): URL of search results for `term`, built
+            from the search's URL template when it's first needed
+            if not given.
+        urltemplate (util.URLTemplate): Template of `url` or ``None``.
+
+    """
+
+    __slots__ = ('term', 'source', 'urltemplate', '_url')
+
+    # Created via `__new__`, like the namedtuple this replaces, so
+    # pickled tuples from the cache can still be loaded.
+    def __new__(cls, term=None, url=None, source=None, urltemplate=None):
+        """Create new `Result`."""
+        self = object.__new__(cls)
+        self.term = term
+        self.source = source
+        self.urltemplate = urltemplate
+        self._url = url
+        return self
+
+    @property
+    def url(self):
+        """URL of search results for `term`."""
+        if self._url is None and self.urltemplate is not None:
+            self._url = self.urltemplate(self.term)
+
+        return self._url
+
+    def __reduce__(self):
+        return (Result, (self.term, self.url, self.source))
+
+    def __eq__(self, other):
+        if not isinstance(other, Result):
+            return NotImplemented
+        return (self.term, self.url, self.source) == \
+            (other.term, other.url, other.source)
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'Result(term={!r}, url={!r}, source={!r})'.format(
+            self.term, self.url, self.source)
+
+
+def _pack(strings):
+    """Return ``strings`` as UTF-8 with a table of lengths.
+
+    Layout: number of strings, then the byte length of each, all
+    as little-endian ``uint16``, then the concatenated strings.
+
+    Raises:
+        OverflowError: Raised if there are too many or too long strings.
+
+    """
+    data = [s.encode('utf-8') for s in strings]
+    lengths = array('H', [len(data)] + [len(b) for b in data])
+    if sys.byteorder != 'little':
+        lengths.byteswap()
+
+    return lengths.tobytes() + b''.join(data)
+
+
+def _unpack(data):
+    """Return list of strings packed by `_pack()`."""
+    n = array('H', data[:2])
+    if sys.byteorder != 'little':
+        n.byteswap()
+
+    end = 2 + 2 * n[0]
+    lengths = array('H', data[2:end])
+    if sys.byteorder != 'little':
+        lengths.byteswap()
+
+    strings = []
+    i = end
+    for size in lengths:
+        strings.append(data[i:i + size].decode('utf-8'))
+        i += size
+
+    return strings
+
+
+def _compact(results):
+    """Return header and terms of ``results`` or ``None``.
+
+    ``None`` means the results can't be stored compactly.
+
+    """
+    if not isinstance(results, list) or not results:
+        return None
+
+    first = results[0]
+    if not isinstance(first, Result) or first.urltemplate is None:
+        return None
+
+    tpl, source = first.urltemplate, first.source
+    if not isinstance(source, str):
+        return None
+
+    terms = []
+    for r in results:
+        if not isinstance(r, Result) or r.source != source or \
+                r.urltemplate is not tpl or not isinstance(r.term, str):
+            return None
+        terms.append(r.term)
+
+    return (tpl, source, terms)
+
+
+class ResultsSerializer(object):
+    """Compact serializer for lists of `Result` objects.
+
+    `searchio.cache` stores suggestions with it by default, and
+    `searchio.metadata` registers it with `workflow.manager` as
+    `SERIALIZER`.
+
+    Layout: `MAGIC`, a flags byte, then (zlib-compressed if the
+    flag is set) the lengths of the search's title, URL template
+    and terms, and the strings themselves as UTF-8.
+
+    """
+
+    is_binary = True
+
+    @classmethod
+    def dumps(cls, obj):
+        """Return ``obj`` serialized as `bytes`."""
+        compact = _compact(obj)
+        if compact is None:
+            return pickle.dumps(obj, protocol=-1)
+
+        tpl, source, terms = compact
+        flags = _PCENCODE if tpl.pcencode else 0
+        try:
+            payload = _pack([source, tpl.template] + terms)
+        except OverflowError:  # string or list too long for uint16
+            return pickle.dumps(obj, protocol=-1)
+
+        if len(payload) >= MIN_COMPRESS:
+            packed = zlib.compress(payload)
+            if len(packed) < len(payload):
+                payload = packed
+                flags |= _ZLIB
+
+        return MAGIC + bytes([flags]) + payload
+
+    @classmethod
+    def loads(cls, data):
+        """Return object deserialized from ``data``."""
+        if not data.startswith(MAGIC):
+            return pickle.loads(data)
+
+        flags = data[len(MAGIC)]
+        payload = data[len(MAGIC) + 1:]
+        if flags & _ZLIB:
+            payload = zlib.decompress(payload)
+
+        strings = _unpack(payload)
+        source, template = strings[:2]
+        tpl = util.urltemplate(template, bool(flags & _PCENCODE))
+        return [Result(term, None, source, tpl) for term in strings[2:]]
+
+    @classmethod
+    def load(cls, file_obj):
+        """Load serialized object from open file.
+
+        Args:
+            file_obj (file): File to read from.
+
+        Returns:
+            object: Deserialized object.
+
+        """
+        return cls.loads(file_obj.read())
+
+    @classmethod
+    def dump(cls, obj, file_obj):
+        """Serialize object ``obj`` to open file.
+
+        Args:
+            obj (object): Results to serialize.
+            file_obj (file): File to write to.
+
+        """
+        file_obj.write(cls.dumps(obj))
+
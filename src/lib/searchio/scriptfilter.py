@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Fast path of the ``search`` Script Filter program.
+
+Every keystroke in a search's Script Filter runs ``search``.
+Going through ``searchio search`` means importing `workflow`
+(which pulls in `plistlib`, `pickle`, `xml.etree`, `urllib.request`
+and more) and `docopt`, parsing the command line twice and
+creating the data directories, before the search even starts.
+
+`run()` answers ``search <search> <query>`` with a `ScriptFilter`,
+which does just what `searchio.cmd.search.show()` needs of a
+`workflow.Workflow3` and writes exactly the same JSON. Anything
+it can't handle (options, magic arguments, a missing Alfred
+environment) is left to ``searchio``.
+
+On a cache hit, nothing from `workflow` is imported at all.
+Fetching suggestions and refreshing them in the background still
+use `workflow.web` and `workflow.background`.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import json
+import logging
+import os
+import sys
+import time
+from unicodedata import normalize
+
+from searchio import trace
+from searchio import util
+
+log = util.logger(__name__)
+
+# Same as `workflow.ICON_ERROR`
+ICON_ERROR = ('/System/Library/CoreServices/CoreTypes.bundle/Contents/'
+              'Resources/AlertStopIcon.icns')
+
+# Same as `workflow.Workflow`'s log format
+LOG_FORMAT = '%(asctime)s %(filename)s:%(lineno)s %(levelname)-8s %(message)s'
+
+# Variables Alfred sets that `ScriptFilter` can't do without
+REQUIRED = ('alfred_workflow_bundleid', 'alfred_workflow_cache',
+            'alfred_workflow_data', 'alfred_workflow_name')
+
+
+class ScriptFilter(object):
+    """Minimal stand-in for `workflow.Workflow3`.
+
+    Attributes:
+        bundleid (str): Workflow's bundle ID.
+        cachedir (str): Workflow's cache directory.
+        datadir (str): Workflow's data directory.
+        debugging (bool): Whether Alfred's debugger is open.
+        name (str): Workflow's name.
+        rerun (float): How often Alfred should re-run the Script
+            Filter.
+        variables (dict): Workflow variables.
+        workflowdir (str): Workflow's directory.
+
+    """
+
+    def __init__(self, workflowdir):
+        """Create new `ScriptFilter` from Alfred's environment.
+
+        Args:
+            workflowdir (str): Directory ``info.plist`` is in.
+
+        """
+        self.workflowdir = workflowdir
+        self.bundleid = os.getenv('alfred_workflow_bundleid')
+        self.cachedir = os.getenv('alfred_workflow_cache')
+        self.datadir = os.getenv('alfred_workflow_data')
+        self.name = self.decode(os.getenv('alfred_workflow_name'))
+        self.debugging = bool(os.getenv('alfred_debug') == '1' or
+                              os.getenv('PYTEST_RUNNING'))
+        self.rerun = 0
+        self.variables = {}
+        self._items = []
+
+        session_id = os.getenv('_WF_SESSION_ID')
+        if session_id:
+            self.variables['_WF_SESSION_ID'] = session_id
+
+        if not os.path.exists(self.cachedir):
+            os.makedirs(self.cachedir)
+
+    def cachefile(self, filename):
+        """Path to ``filename`` in cache directory."""
+        return os.path.join(self.cachedir, filename)
+
+    def datafile(self, filename):
+        """Path to ``filename`` in data directory."""
+        return os.path.join(self.datadir, filename)
+
+    def workflowfile(self, filename):
+        """Path to ``filename`` in workflow directory."""
+        return os.path.join(self.workflowdir, filename)
+
+    def decode(self, text):
+        """Return ``text`` as NFC-normalised `str`."""
+        if not isinstance(text, str):
+            text = str(text, 'utf-8')
+        return normalize('NFC', text)
+
+    def add_item(self, title, subtitle='', arg=None, autocomplete=None,
+                 valid=False, icon=None):
+        """Add a result.
+
+        Takes the same arguments as `workflow.Workflow3.add_item()`,
+        but only those `searchio.cmd.search` uses.
+
+        """
+        # same keys in the same order as `workflow.workflow3.Item3`
+        o = {'title': title, 'subtitle': subtitle, 'valid': valid}
+        if arg is not None:
+            o['arg'] = arg
+        if autocomplete is not None:
+            o['autocomplete'] = autocomplete
+        if self.variables:
+            o['variables'] = dict(self.variables)
+        if icon is not None:
+            o['icon'] = {'path': icon}
+
+        self._items.append(o)
+
+    @property
+    def obj(self):
+        """Feedback formatted for JSON serialization."""
+        o = {'items': self._items}
+        if self.variables:
+            o['variables'] = self.variables
+        if self.rerun:
+            o['rerun'] = self.rerun
+        return o
+
+    def send_feedback(self):
+        """Print results to Alfred as JSON."""
+        if self.debugging:
+            json.dump(self.obj, sys.stdout, indent=2, separators=(',', ': '))
+        else:
+            json.dump(self.obj, sys.stdout)
+        sys.stdout.flush()
+
+    def setup_logging(self):
+        """Log to STDERR and the workflow's log file, like `workflow`."""
+        logger = logging.getLogger('')
+        if not logger.handlers:
+            from logging.handlers import RotatingFileHandler
+
+            fmt = logging.Formatter(LOG_FORMAT, datefmt='%H:%M:%S')
+            logfile = RotatingFileHandler(
+                self.cachefile('{}.log'.format(self.bundleid)),
+                maxBytes=1024 * 1024, backupCount=1)
+            logfile.setFormatter(fmt)
+            logger.addHandler(logfile)
+
+            console = logging.StreamHandler()
+            console.setFormatter(fmt)
+            logger.addHandler(console)
+
+        logger.setLevel(logging.DEBUG if self.debugging else logging.INFO)
+
+
+def parse(argv):
+    """Return ``(search, query)`` from ``argv`` or ``None``.
+
+    ``None`` means ``argv`` is anything other than a search and
+    a query, e.g. contains options, which are ``searchio``'s job.
+
+    """
+    if len(argv) != 2:
+        return None
+
+    for arg in argv:
+        if arg.startswith('-') or arg.startswith('workflow:'):
+            return None
+
+    return argv
+
+
+def run(argv, workflowdir):
+    """Answer ``search <search> <query>``.
+
+    Errors are shown in Alfred the same way `workflow.Workflow.run()`
+    shows them.
+
+    Args:
+        argv (list): Arguments of ``search``.
+        workflowdir (str): Directory ``info.plist`` is in.
+
+    Returns:
+        int: Exit status, or ``None`` if ``searchio`` has to
+            handle ``argv``.
+
+    """
+    args = parse(argv)
+    if args is None or not all([os.getenv(k) for k in REQUIRED]):
+        return None
+
+    from searchio.cmd.search import show
+
+    start = time.time()
+    wf = ScriptFilter(workflowdir)
+    wf.setup_logging()
+    print('.', file=sys.stderr)
+    try:
+        uid, query = [wf.decode(s).strip() for s in args]
+        if not uid or not query:
+            raise RuntimeError('<search> and <query> are required')
+
+        show(wf, uid, query)
+
+    except Exception as err:
+        log.exception(err)
+        wf._items = []
+        wf.add_item("Error in workflow '%s'" % wf.name, str(err),
+                    icon=ICON_ERROR)
+        wf.send_feedback()
+        return 1
+
+    finally:
+        log.debug('---------- finished in %0.3fs ----------',
+                  time.time() - start)
+        trace.save(wf.cachedir)
+
+    return 0
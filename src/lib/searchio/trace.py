@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# encoding: utf-8
+#
+# Copyright (c) 2026
+#
+# MIT Licence. See http://opensource.org/licenses/MIT
+#
+# Created on 2026-10-17
+#
+
+"""Lightweight tracing of where a search's time goes.
+
+Set the ``SEARCHIO_TRACE`` workflow variable to ``1``, and every
+run of ``searchio`` (or request to the daemon) records spans for
+its phases: interpreter start-up, imports, `Workflow3` init,
+argument parsing, cache lookup, the HTTP request, matching the JSON
+Path (which includes reading the response body), building items
+and sending them to Alfred.
+
+The spans are saved as Chrome trace-event JSON in the `DIRNAME`
+directory in the workflow's cache directory, one file per run, and
+can be opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+Only the newest `MAX_TRACES` files are kept.
+
+When tracing is off, `span()` returns a shared object that does
+nothing, so spans can be left in hot code.
+
+Spans are also used to collect metrics (see `searchio.metrics`):
+inside `measure()`, the durations and arguments of the spans on
+the current thread are totalled, whether tracing is on or not.
+
+"""
+
+from __future__ import print_function, absolute_import
+
+import os
+import threading
+import time
+
+# Directory in cache directory traces are saved in
+DIRNAME = 'traces'
+
+# Max. number of trace files to keep
+MAX_TRACES = 50
+
+# Recorded events or ``None`` if tracing is off
+_events = None
+_metadata = {}
+
+# `Totals` of current thread's `measure()` as ``totals``
+_local = threading.local()
+
+
+def enabled():
+    """Return `True` if tracing is turned on in the environment."""
+    return (os.getenv('SEARCHIO_TRACE') or '').lower() in ('1', 'yes', 'on')
+
+
+def _now():
+    """Return current time in microseconds."""
+    return time.perf_counter() * 1e6
+
+
+class Span(object):
+    """Context manager that records a complete ("X") event.
+
+    Attributes:
+        args (dict): Extra information shown with the span.
+        name (str): Name of span.
+
+    """
+
+    __slots__ = ('name', 'args', '_start')
+
+    def __init__(self, name, args):
+        """Create new `Span`."""
+        self.name = name
+        self.args = args
+        self._start = None
+
+    def __enter__(self):
+        self._start = _now()
+        return self
+
+    def note(self, **kwargs):
+        """Add extra information to the span while it's open."""
+        self.args.update(kwargs)
+
+    def __exit__(self, *exc_info):
+        end = _now()
+        totals = getattr(_local, 'totals', None)
+        if totals is not None:
+            totals.add(self.name, (end - self._start) / 1e6, self.args)
+
+        if _events is not None:
+            ev = dict(name=self.name, ph='X', ts=self._start,
+                      dur=end - self._start, pid=os.getpid(),
+                      tid=threading.get_ident())
+            if self.args:
+                ev['args'] = self.args
+            _events.append(ev)
+
+
+class _NullSpan(object):
+    """Stand-in for `Span` when tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def note(self, **kwargs):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_null = _NullSpan()
+
+
+def start(started=None):
+    """Start recording spans if tracing is turned on.
+
+    Any spans recorded since the last `save()` are discarded.
+
+    Args:
+        started (tuple, optional): ``(perf_counter, process_time)``
+            taken as early as possible in the program. If given,
+            spans are recorded for the interpreter's start-up
+            (estimated from the CPU time it had used) and for the
+            time between then and now.
+
+    Returns:
+        bool: `True` if spans are being recorded.
+
+    """
+    global _events
+
+    if not enabled():
+        _events = None
+        return False
+
+    _events = []
+    _metadata.clear()
+    if started:
+        now = started[0] * 1e6
+        boot = started[1] * 1e6
+        pid, tid = os.getpid(), threading.get_ident()
+        _events.append(dict(name='interpreter', ph='X', ts=now - boot,
+                            dur=boot, pid=pid, tid=tid))
+        _events.append(dict(name='launcher', ph='X', ts=now,
+                            dur=_now() - now, pid=pid, tid=tid))
+
+    return True
+
+
+def span(name, **args):
+    """Return context manager that records a span called ``name``.
+
+    Args:
+        name (str): Name of span.
+        **args: Extra information to show with the span.
+
+    Returns:
+        Span: Or a no-op if tracing is off.
+
+    """
+    if _events is None and getattr(_local, 'totals', None) is None:
+        return _null
+
+    return Span(name, args)
+
+
+def note(**kwargs):
+    """Record information about the current thread's work.
+
+    It's added to the `Totals` of `measure()` and, if tracing is on,
+    recorded as an instant event.
+
+    """
+    totals = getattr(_local, 'totals', None)
+    if totals is not None:
+        totals.args.update(kwargs)
+
+    if _events is not None:
+        _events.append(dict(name='note', ph='i', s='t', ts=_now(),
+                            pid=os.getpid(), tid=threading.get_ident(),
+                            args=kwargs))
+
+
+class Totals(object):
+    """Spans recorded on one thread by `measure()`.
+
+    Attributes:
+        args (dict): Arguments of all spans and `note()` calls. Later
+            values replace earlier ones.
+        durations (dict): Total seconds spent in spans by name.
+        elapsed (float): Seconds spent in `measure()`.
+
+    """
+
+    def __init__(self):
+        """Create new `Totals`."""
+        self.args = {}
+        self.durations = {}
+        self.elapsed = 0.0
+
+    def add(self, name, duration, args):
+        """Add a span's ``duration`` and ``args``."""
+        self.durations[name] = self.durations.get(name, 0.0) + duration
+        if args:
+            self.args.update(args)
+
+
+class measure(object):
+    """Context manager that totals spans on the current thread.
+
+    Returns a `Totals` object. Nested measurements don't count
+    towards the outer one's totals.
+
+    """
+
+    def __enter__(self):
+        self._saved = getattr(_local, 'totals', None)
+        self._start = _now()
+        self._totals = _local.totals = Totals()
+        return self._totals
+
+    def __exit__(self, *exc_info):
+        self._totals.elapsed = (_now() - self._start) / 1e6
+        _local.totals = self._saved
+
+
+def annotate(**kwargs):
+    """Add information about the whole trace, e.g. the command."""
+    if _events is not None:
+        _metadata.update(kwargs)
+
+
+def save(cachedir):
+    """Save recorded spans to a new file in ``cachedir``/`DIRNAME`.
+
+    Recording stops until the next `start()`.
+
+    Args:
+        cachedir (str): Workflow's cache directory.
+
+    Returns:
+        str: Path of trace file or ``None`` if tracing is off or
+            the trace couldn't be saved.
+
+    """
+    global _events
+    import json
+
+    if _events is None:
+        return None
+
+    events, _events = _events, None
+    dirpath = os.path.join(cachedir, DIRNAME)
+    pid = os.getpid()
+    events.append(dict(name='process_name', ph='M', pid=pid,
+                       args=dict(name='searchio daemon' if
+                                 _metadata.get('daemon') else 'searchio')))
+
+    try:
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath, 0o700)
+
+        t = time.time()
+        name = 'trace-{}-{:06d}-{}.json'.format(
+            time.strftime('%Y%m%d-%H%M%S', time.localtime(t)),
+            int(t % 1 * 1e6), pid)
+        path = os.path.join(dirpath, name)
+        with open(path, 'w') as fp:
+            json.dump(dict(traceEvents=events, displayTimeUnit='ms',
+                           otherData=dict(_metadata)), fp)
+
+        # names sort by time
+        traces = sorted([fn for fn in os.listdir(dirpath)
+                         if fn.startswith('trace-') and fn.endswith('.json')])
+        for fn in traces[:-MAX_TRACES]:
+            os.unlink(os.path.join(dirpath, fn))
+    except (IOError, OSError) as err:  # never break a search
+        import logging
+        logging.getLogger('workflow.' + __name__).error(
+            '[trace] could not save trace: %s', err)
+        return None
+
+    return path
@@ -12,14 +12,13 @@
 
 from __future__ import print_function, absolute_import
 
+import json
 import logging
 import os
 from unicodedata import normalize
 import urllib
 import re
-import subprocess
 import sys
-from uuid import uuid4
 
 
 def logger(name):
@@ -91,6 +90,114 @@ class FileFinder(object):
                 yield os.path.join(dp, fn)
 
 
+class FileIndex(object):
+    """Index of named files in a sequence of directories.
+
+    Same as `FileFinder.find()`, but each directory is listed once
+    with `os.scandir()`, and the index is saved to ``path``, so
+    later lookups are dict hits. The index is rebuilt when the
+    modification time of any of the directories changes.
+
+    Attributes:
+        dirpaths (sequence): Directories to search in.
+        extensions (sequence): File extensions to search for.
+        path (str): Path to saved index.
+    """
+
+    def __init__(self, dirpaths, extensions, path):
+        """Create new FileIndex.
+
+        Args:
+            dirpaths (sequence): Directories to search in.
+            extensions (sequence): File extensions to search for.
+            path (str): Path to save index to.
+
+        """
+        self.dirpaths = dirpaths
+        self.extensions = extensions
+        self.path = path
+        self._files = None
+
+    def _stamp(self):
+        """Return modification times of directories."""
+        stamp = []
+        for dp in self.dirpaths:
+            try:
+                stamp.append(os.stat(dp).st_mtime)
+            except OSError:
+                stamp.append(None)
+
+        return stamp
+
+    def _scan(self):
+        """Return paths of files by name (minus extension)."""
+        files = {}
+        for i, dp in reversed(list(enumerate(self.dirpaths))):
+            found = {}
+            try:
+                entries = list(os.scandir(dp))
+            except OSError:
+                continue
+
+            for entry in entries:
+                name, x = os.path.splitext(entry.name)
+                x = x.lstrip('.')
+                if x not in self.extensions:
+                    continue
+                rank = self.extensions.index(x)
+                if name not in found or rank < found[name][0]:
+                    found[name] = (rank, entry.path)
+
+            # earlier directories take precedence
+            files.update([(k, v[1]) for k, v in found.items()])
+
+        return files
+
+    @property
+    def files(self):
+        """Paths of files by name (minus extension).
+
+        Returns:
+            dict: ``{name: path}``.
+        """
+        if self._files is None:
+            from workflow.util import atomic_writer
+
+            stamp = self._stamp()
+            try:
+                with open(self.path) as fp:
+                    data = json.load(fp)
+                if data['dirpaths'] == list(self.dirpaths) and \
+                        data['extensions'] == list(self.extensions) and \
+                        data['stamp'] == stamp:
+                    self._files = data['files']
+            except (IOError, OSError, ValueError, KeyError, TypeError):
+                pass
+
+            if self._files is None:
+                self._files = self._scan()
+                data = dict(dirpaths=list(self.dirpaths),
+                            extensions=list(self.extensions),
+                            stamp=stamp, files=self._files)
+                with atomic_writer(self.path, 'w') as fp:
+                    json.dump(data, fp)
+                log.debug('[icons] indexed %d file(s)', len(self._files))
+
+        return self._files
+
+    def find(self, name, default=None):
+        """Find named file in ``self.dirpaths``.
+
+        Args:
+            name (str): Name of file (minus extension)
+            default (None, optional): Return if file isn't found
+
+        Returns:
+            str: Path to file (if found).
+        """
+        return self.files.get(name, default)
+
+
 class CommandError(Exception):
     """Improved exception for exec'd commands.
 
@@ -156,6 +263,8 @@ def check_output(cmd):
     Returns:
         str: Output of command (STDOUT).
     """
+    import subprocess
+
     proc = subprocess.Popen(cmd,
                             stdout=subprocess.PIPE,
                             stderr=subprocess.PIPE)
@@ -243,22 +352,122 @@ def valid_url(url):
 
 def uuid():
     """Return a `str` UUID."""
+    from uuid import uuid4
     return str(uuid4())
 
 
 def _bstr(s):
     """Ensure ``s`` is a `str`.
 
-    UTF-8 encode Unicode, call `str` on everything else.
+    UTF-8 decode bytes, call `str` on everything else.
 
     """
-    if isinstance(s, unicode):
-        s = s.encode('utf-8')
+    if isinstance(s, bytes):
+        s = s.decode('utf-8')
     elif not isinstance(s, str):
         s = str(s)
     return s
 
 
+class URLTemplate(object):
+    """Compiled URL template.
+
+    Placeholders are ``{query}`` and the names of environment
+    variables, e.g. ``{GOOGLE_PLACES_API_KEY}``. Go-style
+    ``${...}`` placeholders are also accepted.
+
+    Only the variables actually used by the template are looked up
+    and URL-encoded, and variables are read when the template is
+    called, not when it's compiled, as the daemon changes its
+    environment for every request.
+
+    Attributes:
+        fields (tuple): Names of placeholders in template.
+        pcencode (bool): Whether to use percent encoding (instead
+            of plus encoding).
+        template (str): Original URL template.
+
+    """
+
+    def __init__(self, template, pcencode=False):
+        """Compile ``template``."""
+        from string import Formatter
+
+        if pcencode:
+            from urllib.parse import quote
+        else:
+            from urllib.parse import quote_plus as quote
+
+        self.template = template = _bstr(template)
+        self.pcencode = pcencode
+        self._quote = quote
+        # Replace ${...} patterns needed by Go
+        template = re.sub(r'\$(\{.+?\})', r'\1', template)
+        self._format = template.format
+
+        fields = []
+        for _, name, _, _ in Formatter().parse(template):
+            if name is not None:
+                # name may be an expression, e.g. "var[0]" or "var.attr"
+                name = re.match(r'[^.\[]*', name).group()
+                if name not in fields:
+                    fields.append(name)
+
+        self.fields = tuple(fields)
+
+    def __call__(self, query=None):
+        """Return URL for ``query``.
+
+        Args:
+            query (str, optional): Query to insert into URL.
+
+        Returns:
+            str: URL. If ``query`` is empty, the template itself.
+
+        Raises:
+            KeyError: Raised if template contains a placeholder
+                for an environment variable that isn't set.
+
+        """
+        if not query:
+            return self.template
+
+        d = {}
+        for k in self.fields:
+            if k == 'query':
+                d[k] = self._quote(_bstr(query))
+            else:
+                d[k] = self._quote(os.environ[k])
+
+        return self._format(**d)
+
+
+# Compiled templates keyed by ``(template, pcencode)``
+_templates = {}
+
+
+def urltemplate(url, pcencode=False):
+    """Return compiled template for ``url``.
+
+    Templates are compiled once and cached.
+
+    Args:
+        url (str): URL template
+        pcencode (bool, optional): Whether to use percent encoding
+            (instead of plus encoding).
+
+    Returns:
+        URLTemplate: Compiled template.
+
+    """
+    key = (url, bool(pcencode))
+    tpl = _templates.get(key)
+    if tpl is None:
+        tpl = _templates[key] = URLTemplate(url, pcencode)
+
+    return tpl
+
+
 def mkurl(url, query=None, pcencode=False):
     """Replace ``{query}`` in ``url`` with URL-encoded ``query``.
 
@@ -267,26 +476,13 @@ def mkurl(url, query=None, pcencode=False):
         query (str, optional): Query to insert into ``url``
 
     Returns:
-        str: UTF-8 encoded URL
+        str: URL
 
     """
-    if pcencode:
-        from urllib import quote
-    else:
-        from urllib import quote_plus as quote
     if not query:
         return url
 
-    query = _bstr(query)
-    url = _bstr(url)
-    # Replace ${...} patterns needed by Go
-    url = re.sub(r'\$(\{.+?\})', r'\1', url)
-
-    d = dict(query=quote(query))
-    for k, v in os.environ.items():
-        d[k] = quote(v)
-
-    url = url.format(**d)
+    url = urltemplate(url, pcencode)(query)
     log.debug('pcencode=%r, url=%s', pcencode, url)
     return url
 
@@ -332,27 +528,268 @@ def shortpath(path):
     return path.replace(os.getenv('HOME'), '~')
 
 
-def getjson(url):
+# Pool of persistent connections used by `getjson()`.
+# Only set in long-running processes (see `set_pool()`).
+_pool = None
+
+
+def set_pool(pool):
+    """Make `getjson()` fetch URLs via a connection pool.
+
+    Args:
+        pool (searchio.pool.ConnectionPool): Pool to use or ``None``
+            to open a new connection for each request.
+
+    """
+    global _pool
+    _pool = pool
+
+
+# Function that rewrites URLs before they're fetched (see
+# `set_rewrite()`).
+_rewrite = None
+
+
+def set_rewrite(func):
+    """Make `getjson()` and `findjson()` fetch rewritten URLs.
+
+    For benchmarks and tests, to send requests to a stand-in
+    server instead of the real one.
+
+    Args:
+        func (callable): Called with each URL, returns the URL to
+            fetch instead. ``None`` to stop rewriting.
+
+    """
+    global _rewrite
+    _rewrite = func
+
+
+def fixture_url(base, url):
+    """Return URL of ``url`` on fixture server ``base``.
+
+    The scheme of ``url`` is dropped, and its host, path and query
+    are appended to ``base``, e.g. ``http://127.0.0.1:8900`` and
+    ``https://duckduckgo.com/ac/?q=x`` give
+    ``http://127.0.0.1:8900/duckduckgo.com/ac/?q=x``.
+
+    """
+    from urllib.parse import urlsplit
+
+    u = urlsplit(url)
+    target = u.netloc + u.path + ('?' + u.query if u.query else '')
+    return base.rstrip('/') + '/' + target
+
+
+def rewrite_url(url):
+    """Return the URL actually fetched for ``url``.
+
+    That's ``url`` rewritten by the function set with `set_rewrite()`,
+    if any, or on the server in the ``SEARCHIO_FIXTURE_SERVER``
+    environment variable, if set (see `fixture_url()`), otherwise
+    ``url`` itself.
+
+    """
+    if _rewrite is not None:
+        return _rewrite(url)
+
+    base = os.getenv('SEARCHIO_FIXTURE_SERVER')
+    if base:
+        return fixture_url(base, url)
+
+    return url
+
+
+class Deadline(object):
+    """End-to-end time budget for fetching a URL.
+
+    Attributes:
+        connect_timeout (float): Max. seconds to spend connecting.
+        expires (float): Time the budget runs out.
+        timeout (float): Total budget in seconds.
+
+    """
+
+    def __init__(self, timeout, connect_timeout=None):
+        """Create new `Deadline` expiring in ``timeout`` seconds."""
+        import time
+
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout or timeout
+        self.expires = time.time() + timeout
+
+    def remaining(self):
+        """Return seconds left.
+
+        Returns:
+            float: Seconds before deadline.
+
+        Raises:
+            TimeoutError: Raised if the deadline has passed.
+
+        """
+        import time
+
+        left = self.expires - time.time()
+        if left <= 0:
+            raise TimeoutError(
+                'deadline of {:0.1f}s exceeded'.format(self.timeout))
+        return left
+
+    def connect(self):
+        """Return seconds left for connecting.
+
+        Returns:
+            float: Connect timeout or remaining time if less.
+
+        """
+        return min(self.connect_timeout, self.remaining())
+
+
+def _get(url, deadline=None, limiter=None, stream=False):
+    """Fetch URL, waiting for rate limiter and respecting deadline.
+
+    Uses the connection pool set with `set_pool()`, if any, and
+    fetches ``url`` as rewritten by `rewrite_url()`.
+    Without a pool, the connect budget of ``deadline`` isn't
+    enforced separately, as `workflow.web` only has a single
+    timeout.
+
+    Returns:
+        workflow.web.Response: Or `searchio.pool.Response`.
+
+    Raises:
+        TimeoutError: Raised if the request (including any wait
+            for the rate limiter) would take longer than ``deadline``.
+
+    """
+    import socket
+    import time
+    from urllib.error import URLError
+    from urllib.parse import urlsplit
+    from workflow import web
+
+    from searchio import trace
+
+    url = rewrite_url(url)
+    if limiter is not None:
+        host = urlsplit(url).hostname
+        wait = limiter.reserve(host, deadline.remaining() if deadline else None)
+        if wait is None:
+            raise TimeoutError('rate limit for {} exceeds deadline'.format(host))
+        if wait:
+            with trace.span('rate limit', host=host):
+                time.sleep(wait)
+
+    try:
+        with trace.span('network', url=url, pooled=_pool is not None) as sp:
+            if _pool is not None:
+                if deadline:
+                    r = _pool.get(url, timeout=deadline.remaining(),
+                                  connect_timeout=deadline.connect(),
+                                  stream=stream)
+                else:
+                    r = _pool.get(url, stream=stream)
+            elif deadline:
+                r = web.get(url, timeout=deadline.remaining(), stream=stream)
+            else:
+                r = web.get(url, stream=stream)
+            sp.note(status=r.status_code)
+
+        log.debug('[%s] %s', r.status_code, r.url)
+        r.raise_for_status()
+        return r
+    except URLError as err:
+        if isinstance(err.reason, socket.timeout):
+            raise TimeoutError(str(err.reason))
+        raise
+
+
+def getjson(url, deadline=None, limiter=None):
     """Retrieve URL and parse response as JSON.
 
     Args:
         url (str): URL to fetch
+        deadline (Deadline, optional): Time budget for request.
+        limiter (searchio.ratelimit.RateLimiter, optional): Rate
+            limiter to wait for before sending request.
 
     Returns:
         object: JSON-deserialised HTTP response.
 
+    Raises:
+        TimeoutError: Raised if the request (including any wait
+            for the rate limiter) would take longer than ``deadline``.
+
     """
-    import time
+    return _get(url, deadline, limiter).json()
+
+
+def findjson(url, jx, max_results=0, deadline=None, limiter=None):
+    """Retrieve URL and return values matched by JSON Path ``jx``.
+
+    The response is decompressed, decoded and matched as it is
+    read, and reading stops as soon as ``max_results`` values
+    have been found or no more can match.
+
+    ``deadline`` covers reading the response, too, so a server
+    that sends it slowly can't hold up the search.
+
+    Args:
+        url (str): URL to fetch
+        jx (searchio.jpath.Expression): Compiled JSON Path.
+        max_results (int, optional): Max. number of values to return.
+        deadline (Deadline, optional): Time budget for request.
+        limiter (searchio.ratelimit.RateLimiter, optional): Rate
+            limiter to wait for before sending request.
+
+    Returns:
+        list: Values matched by ``jx``.
+
+    Raises:
+        TimeoutError: Raised if the request (including any wait
+            for the rate limiter and reading the response) takes
+            longer than ``deadline``.
+
+    """
+    import codecs
     from workflow import web
-    
-    # Add small delay for Wikipedia API to avoid rate limiting
-    if 'wikipedia.org' in url:
-        time.sleep(0.1)
-    
-    r = web.get(url)
-    log.debug('[%s] %s', r.status_code, r.url)
-    r.raise_for_status()
-    return r.json()
+    from searchio import trace
+
+    r = _get(url, deadline, limiter, stream=True)
+    decoder = codecs.getincrementaldecoder(r.encoding or 'utf-8')('replace')
+    pooled = not isinstance(r, web.Response)
+
+    def chunks():
+        if pooled:  # `pool.Response` checks deadline before each read
+            data = r.iter_content(deadline=deadline)
+        else:
+            data = r.iter_content()
+
+        for s in data:
+            if deadline and not pooled:
+                # `web` only has a socket timeout, which a server
+                # sending a byte at a time never hits
+                deadline.remaining()
+            yield decoder.decode(s)
+        yield decoder.decode(b'', final=True)
+
+    with trace.span('jsonpath', path=jx.path) as sp:
+        try:
+            values = jx.stream(chunks(), max_results)
+        finally:
+            r.close()
+        sp.note(values=len(values), bytes_read=r.bytes_read)
+
+    size = r.headers.get('Content-Length')
+    if size and size.isdigit():
+        log.debug('[stream] %d value(s) from %d of %s byte(s), %d saved',
+                  len(values), r.bytes_read, size, int(size) - r.bytes_read)
+    else:
+        log.debug('[stream] %d value(s) from %d byte(s)',
+                  len(values), r.bytes_read)
+
+    return values
 
 
 def in_same_directory(*paths):
@@ -464,23 +901,21 @@ class Table(object):
         is_title, data = row[0], row[1:]
         str_row = [is_title]
 
-        for i, cell in enumerate(data):
-            if isinstance(cell, str):
+        for cell in data:
+            if isinstance(cell, bytes):
                 cell = cell.decode('utf-8')
-            elif isinstance(cell, unicode):
-                pass
-            else:
-                cell = unicode(cell)
+            elif not isinstance(cell, str):
+                cell = str(cell)
 
             str_row.append(cell)
 
         return str_row
 
     def __str__(self):
-        """Return UTF-8 representation of data.
+        """Return text representation of data.
 
         Returns:
-            str: UTF-8 string of tabular data.
+            str: Tabular data.
 
         """
         widths = [0 for _ in range(self.width)]
@@ -518,4 +953,4 @@ class Table(object):
 
         # text.append(hr)
 
-        return u'\n'.join(text).encode('utf-8')
+        return u'\n'.join(text)
@@ -99,6 +99,55 @@ def str_dict(dic):
         dic2[k] = v
     return dic2
 
+class Decompressor(object):
+    """Incremental decoder for a ``Content-Encoding``.
+
+    Handles ``gzip`` and ``deflate``, both zlib-wrapped (as the
+    standard says) and raw (as some servers send it).
+
+    """
+
+    def __init__(self, encoding):
+        """Create new `Decompressor` for ``encoding``."""
+        self.encoding = encoding
+        self._obj = None
+        if encoding == 'gzip':
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def decompress(self, data):
+        """Return next piece of decoded data."""
+        if self._obj is None:
+            if not data:
+                return data
+            # zlib header has compression method 8 in low nibble
+            wbits = zlib.MAX_WBITS if ord(data[:1]) & 0x0f == 8 \
+                else -zlib.MAX_WBITS
+            self._obj = zlib.decompressobj(wbits)
+
+        return self._obj.decompress(data)
+
+    def flush(self):
+        """Return any remaining decoded data."""
+        return self._obj.flush() if self._obj else b''
+
+
+def content_decoder(headers):
+    """Return `Decompressor` for response ``headers`` or ``None``.
+
+    :param headers: Response headers
+    :returns: :class:`Decompressor` or ``None`` if response isn't
+        compressed.
+
+    """
+    for key in ('content-encoding', 'transfer-encoding'):
+        value = headers.get(key) or ''
+        for encoding in ('gzip', 'deflate'):
+            if encoding in value:
+                return Decompressor(encoding)
+
+    return None
+
+
 class NoRedirectHandler(request3.HTTPRedirectHandler):
     """Prevent redirections."""
 
@@ -232,6 +281,9 @@ class Response(object):
         self._content = None
         self._content_loaded = False
         self._gzipped = False
+        self._decoder = None
+        #: Number of (compressed) bytes read from the server
+        self.bytes_read = 0
 
         # Execute query
         try:
@@ -264,9 +316,8 @@ class Response(object):
             # Transfer-Encoding appears to not be used in the wild
             # (contrary to the HTTP standard), but no harm in testing
             # for it
-            if 'gzip' in headers.get('content-encoding', '') or \
-                    'gzip' in headers.get('transfer-encoding', ''):
-                self._gzipped = True
+            self._decoder = content_decoder(headers)
+            self._gzipped = self._decoder is not None
 
     @property
     def stream(self):
@@ -318,13 +369,16 @@ class Response(object):
         """
         if not self._content:
 
-            # Decompress gzipped content
-            if self._gzipped:
-                decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
-                self._content = decoder.decompress(self.raw.read())
+            data = self.raw.read()
+            self.bytes_read += len(data)
+
+            # Decompress gzipped/deflated content
+            if self._decoder:
+                self._content = (self._decoder.decompress(data) +
+                                 self._decoder.flush())
 
             else:
-                self._content = self.raw.read()
+                self._content = data
 
             self._content_loaded = True
 
@@ -379,19 +433,25 @@ class Response(object):
                 yield data
 
         def generate():
-            if self._gzipped:
-                decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            decoder = self._decoder
+            # return what has arrived instead of waiting for
+            # `chunk_size` bytes
+            read = getattr(self.raw, 'read1', self.raw.read)
 
             while True:
-                chunk = self.raw.read(chunk_size)
+                chunk = read(chunk_size)
                 if not chunk:
                     break
 
-                if self._gzipped:
+                self.bytes_read += len(chunk)
+                if decoder:
                     chunk = decoder.decompress(chunk)
 
                 yield chunk
 
+            if decoder:
+                yield decoder.flush()
+
         chunks = generate()
 
         if decode_unicode and self.encoding:
@@ -418,6 +478,11 @@ class Response(object):
             for data in self.iter_content():
                 fileobj.write(data)
 
+    def close(self):
+        """Close connection, e.g. after reading part of a stream."""
+        if self.raw is not None:
+            self.raw.close()
+
     def raise_for_status(self):
         """Raise stored error if one occurred.
 
@@ -559,11 +624,12 @@ def request(method, url, params=None, data=None, headers=None, cookies=None,
     if 'accept-language' not in headers:
         headers['accept-language'] = 'en-US,en;q=0.9'
 
-    # Accept gzip-encoded content
+    # Accept gzip- and deflate-encoded content
     encodings = [s.strip() for s in
-                 headers.get('accept-encoding', '').split(',')]
-    if 'gzip' not in encodings:
-        encodings.append('gzip')
+                 headers.get('accept-encoding', '').split(',') if s.strip()]
+    for encoding in ('gzip', 'deflate'):
+        if encoding not in encodings:
+            encodings.append(encoding)
 
     headers['accept-encoding'] = ', '.join(encodings)
 